@@ -0,0 +1,53 @@
+"""Benchmark of the fused `Bidirectional` RNN against the two-scan path.
+
+An encoder made of a stack of bidirectional LSTMs (or GRUs) is run with
+`fused=False` (one scan per direction) and `fused=True` (a single scan
+over the stacked states of both directions), with the same weights.
+
+Run with `KERAS_BACKEND=<backend> python benchmarks/bidirectional_rnn.py`.
+"""
+from __future__ import print_function
+
+import timeit
+
+import numpy as np
+
+from keras import backend as K
+from keras.layers import Bidirectional, GRU, Input, LSTM, Masking
+from keras.models import Model
+
+
+def encoder(rnn, fused, timesteps, dim, units, depth):
+    inputs = Input((timesteps, dim))
+    x = Masking()(inputs)
+    for _ in range(depth):
+        x = Bidirectional(rnn(units, return_sequences=True), fused=fused)(x)
+    return Model(inputs, x)
+
+
+def bench(rnn, samples=64, timesteps=50, dim=128, units=128, depth=2,
+          number=3):
+    x = np.random.rand(samples, timesteps, dim).astype(K.floatx())
+    # Sequences of different lengths, padded with zeros.
+    lengths = np.random.randint(timesteps // 2, timesteps + 1, samples)
+    x[np.arange(timesteps) >= lengths[:, None]] = 0
+
+    two_scans = encoder(rnn, False, timesteps, dim, units, depth)
+    fused = encoder(rnn, True, timesteps, dim, units, depth)
+    fused.set_weights(two_scans.get_weights())
+    np.testing.assert_allclose(fused.predict(x), two_scans.predict(x),
+                               rtol=1e-4, atol=1e-4)
+
+    times = []
+    for model in [two_scans, fused]:
+        times.append(min(timeit.repeat(lambda: model.predict(x),
+                                       number=number, repeat=3)) / number)
+    print('%-5s x %d, %d steps   two scans: %8.2f ms   fused: %8.2f ms   '
+          'speedup: %5.2fx' % (rnn.__name__, depth, timesteps,
+                               times[0] * 1e3, times[1] * 1e3,
+                               times[0] / times[1]))
+
+
+if __name__ == '__main__':
+    for rnn in [LSTM, GRU]:
+        bench(rnn)
@@ -0,0 +1,70 @@
+"""Benchmark of the confusion matrix updates of threshold metrics.
+
+`metrics_utils.update_confusion_matrix_variables` (used by `AUC`,
+`Precision`, `Recall`, ...) counts the predictions of a batch in buckets
+between the thresholds. It is compared with the former implementation,
+which compared every prediction with every threshold, and the results of
+both are checked to be equal.
+
+Run with `KERAS_BACKEND=<backend> python benchmarks/confusion_matrix_metrics.py`.
+"""
+from __future__ import print_function
+
+import timeit
+
+import numpy as np
+
+from keras import backend as K
+from keras.utils import metrics_utils
+from keras.utils.metrics_utils import ConfusionMatrix
+
+
+def tiled_updates(variables, y_true, y_pred, thresholds):
+    num_thresholds = len(thresholds)
+    preds = K.tile(K.reshape(y_pred, [1, -1]), [num_thresholds, 1])
+    labels = K.tile(K.reshape(y_true, [1, -1]), [num_thresholds, 1])
+    pred_is_pos = K.cast(
+        K.greater(preds, K.expand_dims(K.constant(thresholds), 1)),
+        K.floatx())
+    label_is_pos = K.cast(K.not_equal(labels, 0), K.floatx())
+    counts = {
+        ConfusionMatrix.TRUE_POSITIVES: label_is_pos * pred_is_pos,
+        ConfusionMatrix.FALSE_NEGATIVES: label_is_pos * (1 - pred_is_pos),
+        ConfusionMatrix.FALSE_POSITIVES: (1 - label_is_pos) * pred_is_pos,
+        ConfusionMatrix.TRUE_NEGATIVES: (1 - label_is_pos) * (1 - pred_is_pos),
+    }
+    return [K.update_add(variables[key], K.sum(counts[key], 1))
+            for key in variables]
+
+
+def bench(batch_size=65536, num_thresholds=200, number=5):
+    thresholds = [(i + 1) * 1.0 / (num_thresholds - 1)
+                  for i in range(num_thresholds - 2)]
+    thresholds = [0.0] + thresholds + [1.0]
+    y_true = (np.random.random((batch_size, 1)) > 0.9).astype('float32')
+    y_pred = np.random.random((batch_size, 1)).astype('float32')
+
+    true_ph = K.placeholder(shape=(None, 1))
+    pred_ph = K.placeholder(shape=(None, 1))
+    results = []
+    for name, make_updates in [
+            ('tiled', tiled_updates),
+            ('bucketed', metrics_utils.update_confusion_matrix_variables)]:
+        variables = {key: K.zeros((num_thresholds,))
+                     for key in ConfusionMatrix}
+        update = K.function([true_ph, pred_ph], [],
+                            updates=make_updates(variables, true_ph, pred_ph,
+                                                 thresholds))
+        update([y_true, y_pred])
+        results.append([K.get_value(variables[key])
+                        for key in ConfusionMatrix])
+        time = min(timeit.repeat(lambda: update([y_true, y_pred]),
+                                 number=number, repeat=3)) / number
+        print('%-10s %8.1f ms per batch of %d predictions' % (
+            name, time * 1e3, batch_size))
+    for x, y in zip(*results):
+        np.testing.assert_allclose(x, y, rtol=1e-6)
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,62 @@
+"""Benchmark of `count_sketch` and `scan_conv1d` at the usual MCB size.
+
+The vectorized backend implementations (scatter-add and FFT product) are
+compared with the per-element loops that the Theano backend used to run
+through `theano.scan`, replicated here in NumPy.
+
+Run with `KERAS_BACKEND=<backend> python benchmarks/count_sketch.py`.
+"""
+from __future__ import print_function
+
+import timeit
+
+import numpy as np
+
+from keras import backend as K
+
+
+def loop_count_sketch(h, s, x, d):
+    y = np.zeros((x.shape[0], d), dtype=x.dtype)
+    for i in range(x.shape[1]):
+        y[:, h[i]] += s[i] * x[:, i]
+    return y
+
+
+def loop_scan_conv1d(u, v):
+    n = u.shape[1]
+    return np.stack([np.convolve(u_i, v_i)[n // 2:n // 2 + n]
+                     for u_i, v_i in zip(u, v)])
+
+
+def bench(name, func, reference, inputs, number=5):
+    np.testing.assert_allclose(func(inputs)[0], reference(),
+                               rtol=1e-3, atol=1e-2)
+    new = min(timeit.repeat(lambda: func(inputs),
+                            number=number, repeat=3)) / number
+    old = min(timeit.repeat(reference, number=1, repeat=1))
+    print('%-36s loop: %9.2f ms   %s: %8.2f ms   speedup: %6.1fx'
+          % (name, old * 1e3, K.backend(), new * 1e3, old / new))
+
+
+if __name__ == '__main__':
+    d = 16000
+    batch_size = 32
+    rng = np.random.RandomState(1337)
+    for input_dim in [512, 2048]:
+        h = rng.randint(0, d, size=(input_dim,))
+        s = rng.randint(0, 2, size=(input_dim,)) * 2 - 1
+        x = rng.rand(batch_size, input_dim).astype('float32')
+        x_ph = K.placeholder(shape=(None, input_dim))
+        sketch = K.count_sketch(K.variable(h, dtype='int64'),
+                                K.variable(s, dtype='int64'), x_ph, d)
+        bench('count_sketch %d -> %d' % (input_dim, d),
+              K.function([x_ph], [sketch]),
+              lambda: loop_count_sketch(h, s, x, d), [x])
+
+    u = rng.rand(batch_size, d).astype('float32')
+    v = rng.rand(batch_size, d).astype('float32')
+    u_ph = K.placeholder(shape=(None, d))
+    v_ph = K.placeholder(shape=(None, d))
+    bench('scan_conv1d %dx%d' % (batch_size, d),
+          K.function([u_ph, v_ph], [K.scan_conv1d(u_ph, v_ph)]),
+          lambda: loop_scan_conv1d(u, v), [u, v], number=1)
@@ -0,0 +1,63 @@
+"""Benchmark of `ctc_decode` in the NumPy backend.
+
+Random softmax outputs are decoded with greedy and beam search decoding.
+When TensorFlow is installed, the results are compared with those of the
+TensorFlow backend, and its throughput is reported as well.
+
+Run with `python benchmarks/ctc_decode.py`.
+"""
+from __future__ import print_function
+
+import timeit
+
+import numpy as np
+
+from keras.backend import numpy_backend as KNP
+
+try:
+    from keras.backend import tensorflow_backend as KTF
+except ImportError:
+    KTF = None
+
+
+def decode_tf(y_pred, input_length, **kwargs):
+    decoded, log_prob = KTF.ctc_decode(KTF.constant(y_pred),
+                                       KTF.constant(input_length), **kwargs)
+    return KTF.batch_get_value(decoded), KTF.eval(log_prob)
+
+
+def bench(greedy, num_samples=64, num_steps=100, num_classes=30,
+          beam_width=10, top_paths=3, number=3):
+    y_pred = np.random.dirichlet(0.2 * np.ones(num_classes),
+                                 size=(num_samples, num_steps))
+    y_pred = y_pred.astype('float32')
+    input_length = np.random.randint(num_steps // 2, num_steps + 1,
+                                     size=num_samples)
+    kwargs = {'greedy': greedy}
+    if not greedy:
+        kwargs.update(beam_width=beam_width, top_paths=top_paths)
+
+    decoders = [('numpy', KNP.ctc_decode)]
+    if KTF is not None:
+        decoders.append(('tensorflow', decode_tf))
+    results = []
+    for name, decode in decoders:
+        results.append(decode(y_pred, input_length, **kwargs))
+        time = min(timeit.repeat(lambda: decode(y_pred, input_length,
+                                                **kwargs),
+                                 number=number, repeat=3)) / number
+        print('%-6s %-10s %8.1f ms   %8.0f samples/s' % (
+            'greedy' if greedy else 'beam', name, time * 1e3,
+            num_samples / time))
+    if len(results) == 2:
+        (np_decoded, np_log_prob), (tf_decoded, tf_log_prob) = results
+        if greedy:
+            np_decoded = [np_decoded]
+        for x, y in zip(np_decoded, tf_decoded):
+            np.testing.assert_array_equal(x, y)
+        np.testing.assert_allclose(np_log_prob, tf_log_prob, rtol=1e-3)
+
+
+if __name__ == '__main__':
+    bench(greedy=True)
+    bench(greedy=False)
@@ -0,0 +1,44 @@
+"""Benchmark of `LocallyConnected1D` and `LocallyConnected2D` layers.
+
+The time needed to build and compile a model (up to its first prediction)
+and the time of a prediction step are reported, for growing numbers of
+output positions.
+
+Run with `KERAS_BACKEND=<backend> python benchmarks/locally_connected.py`.
+"""
+from __future__ import print_function
+
+import time
+import timeit
+
+import numpy as np
+
+from keras import backend as K
+from keras.layers import LocallyConnected1D
+from keras.layers import LocallyConnected2D
+from keras.models import Sequential
+
+
+def bench(layer, input_shape, batch_size=32, number=10):
+    x = np.random.rand(*((batch_size,) + input_shape)).astype(K.floatx())
+    start = time.time()
+    model = Sequential([layer])
+    model.build((None,) + input_shape)
+    model.predict(x)
+    compile_time = time.time() - start
+
+    step_time = min(timeit.repeat(lambda: model.predict(x),
+                                  number=number, repeat=3)) / number
+    print('%-20s input: %-14s positions: %5d   compile: %7.2f s   '
+          'step: %8.2f ms' % (
+              layer.__class__.__name__, input_shape,
+              int(np.prod(model.output_shape[1:-1])),
+              compile_time, step_time * 1e3))
+    K.clear_session()
+
+
+if __name__ == '__main__':
+    for steps in [64, 256, 1024]:
+        bench(LocallyConnected1D(16, 3), (steps, 8))
+    for size in [16, 32, 64]:
+        bench(LocallyConnected2D(16, (3, 3)), (size, size, 3))
@@ -0,0 +1,41 @@
+"""Benchmark of calling large functional models as layers.
+
+Each `keras.applications` model is built once, then called on new `Input`
+tensors, which replays its whole graph through `run_internal_graph`
+(as when the model is nested inside another model). The time needed to
+build the output tensors is reported.
+
+Run with `KERAS_BACKEND=<backend> python benchmarks/network_call.py
+[model names]`.
+"""
+from __future__ import print_function
+
+import sys
+import timeit
+
+from keras import applications
+from keras import backend as K
+from keras.layers import Input
+
+
+MODELS = ['NASNetLarge', 'NASNetMobile', 'DenseNet121']
+
+
+def bench(name, number=1):
+    model = getattr(applications, name)(weights=None)
+    input_shape = model.input_shape[1:]
+
+    def call():
+        return model(Input(shape=input_shape))
+
+    call()
+    time = min(timeit.repeat(call, number=number, repeat=3)) / number
+    print('%-12s nodes: %5d   call: %8.1f ms' % (
+        name, sum(len(nodes) for nodes in model._nodes_by_depth.values()),
+        time * 1e3))
+    K.clear_session()
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or MODELS:
+        bench(name)
@@ -0,0 +1,68 @@
+"""Micro-benchmark of the convolutions and pooling of the NumPy backend.
+
+Compares the strided-window implementation of `keras.backend.numpy_backend`
+with the previous one, which looped over samples and channels in Python and
+called `scipy.signal.convolve` on every pair of feature maps.
+
+Run with `python benchmarks/numpy_backend_conv.py`.
+"""
+from __future__ import print_function
+
+import timeit
+
+import numpy as np
+import scipy.signal as signal
+
+from keras.backend import numpy_backend as KNP
+
+
+def loop_conv2d(x, w, padding='valid'):
+    """Previous `conv2d` (channels_last, odd kernels, no strides)."""
+    x = np.transpose(x, (0, 3, 1, 2))
+    w = np.transpose(np.fliplr(np.flipud(w)), (2, 3, 0, 1))
+    y = []
+    for i in range(x.shape[0]):
+        _y = []
+        for j in range(w.shape[1]):
+            __y = []
+            for k in range(w.shape[0]):
+                __y.append(signal.convolve(x[i, k], w[k, j], mode=padding))
+            _y.append(np.sum(np.stack(__y, axis=-1), axis=-1))
+        y.append(_y)
+    return np.transpose(np.array(y), (0, 2, 3, 1))
+
+
+def loop_pool2d(x, pool_size, strides):
+    """Previous `pool2d` (channels_last, 'valid' max pooling)."""
+    x = np.transpose(x, (0, 3, 1, 2))
+    x = np.pad(x, [(0, 0), (0, 0), (0, 1), (0, 1)], 'constant')
+    y = []
+    for (k, k1) in zip(range(pool_size[0]), range(-pool_size[0], 0)):
+        for (l, l1) in zip(range(pool_size[1]), range(-pool_size[1], 0)):
+            y.append(x[:, :, k:k1:strides[0], l:l1:strides[1]])
+    y = np.max(np.stack(y, axis=-1), axis=-1)
+    return np.transpose(y, (0, 2, 3, 1))
+
+
+def bench(name, func, reference, number=3):
+    np.testing.assert_allclose(func(), reference(), rtol=1e-4, atol=1e-4)
+    new = min(timeit.repeat(func, number=number, repeat=3)) / number
+    old = min(timeit.repeat(reference, number=1, repeat=1))
+    print('%-32s loop: %9.2f ms   strided: %8.2f ms   speedup: %6.1fx'
+          % (name, old * 1e3, new * 1e3, old / new))
+
+
+if __name__ == '__main__':
+    rng = np.random.RandomState(1337)
+    for batch, size, channels, filters in [(8, 32, 16, 32),
+                                           (8, 56, 64, 64),
+                                           (1, 112, 32, 64)]:
+        x = rng.rand(batch, size, size, channels).astype('float32')
+        w = rng.rand(3, 3, channels, filters).astype('float32')
+        bench('conv2d %dx%dx%dx%d -> %d' % (batch, size, size,
+                                            channels, filters),
+              lambda: KNP.conv2d(x, w, padding='same'),
+              lambda: loop_conv2d(x, w, padding='same'))
+        bench('pool2d %dx%dx%dx%d' % (batch, size, size, channels),
+              lambda: KNP.pool2d(x, (2, 2), (2, 2), pool_mode='max'),
+              lambda: loop_pool2d(x, (2, 2), (2, 2)))
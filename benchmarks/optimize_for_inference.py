@@ -0,0 +1,58 @@
+"""Benchmark of `optimize_for_inference` on `keras.applications` models.
+
+Each model is built with random weights (and random batch normalization
+statistics), then folded with `keras.models.optimize_for_inference`.
+The outputs of both models are compared, and their prediction times
+and numbers of layers are reported.
+
+Run with `KERAS_BACKEND=<backend> python benchmarks/optimize_for_inference.py
+[model names]`.
+"""
+from __future__ import print_function
+
+import sys
+import timeit
+
+import numpy as np
+
+from keras import applications
+from keras import backend as K
+from keras.layers import BatchNormalization
+from keras.models import optimize_for_inference
+
+
+MODELS = ['ResNet50', 'MobileNet', 'MobileNetV2', 'DenseNet121',
+          'InceptionV3', 'Xception']
+
+
+def randomize_batch_normalization(model):
+    for layer in model.layers:
+        if isinstance(layer, BatchNormalization):
+            layer.set_weights([np.random.uniform(0.5, 1.5, w.shape)
+                               for w in layer.get_weights()])
+
+
+def bench(name, batch_size=8, size=224, number=3):
+    model = getattr(applications, name)(weights=None,
+                                        input_shape=(size, size, 3))
+    randomize_batch_normalization(model)
+    optimized = optimize_for_inference(model)
+    x = np.random.rand(batch_size, size, size, 3).astype(K.floatx())
+    np.testing.assert_allclose(optimized.predict(x), model.predict(x),
+                               rtol=1e-3, atol=1e-5)
+
+    times = []
+    for m in [model, optimized]:
+        m.predict(x)
+        times.append(min(timeit.repeat(lambda: m.predict(x),
+                                       number=number, repeat=3)) / number)
+    print('%-12s layers: %4d -> %4d   original: %8.1f ms   '
+          'optimized: %8.1f ms   speedup: %5.2fx' % (
+              name, len(model.layers), len(optimized.layers),
+              times[0] * 1e3, times[1] * 1e3, times[0] / times[1]))
+    K.clear_session()
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or MODELS:
+        bench(name)
@@ -0,0 +1,58 @@
+"""Accuracy and latency of int8 quantized models against float models.
+
+A decoder-like model (an `Embedding`, a stack of `LSTM` and a softmax
+over the vocabulary), with random weights, is quantized with
+`keras.models.quantize_model`. The size of the weights, the prediction
+time, the largest difference between the output probabilities and the
+agreement of the most likely tokens of both models are reported.
+
+Run with `KERAS_BACKEND=<backend> python benchmarks/quantization.py`.
+"""
+from __future__ import print_function
+
+import timeit
+
+import numpy as np
+
+from keras.layers import Dense, Embedding, Input, LSTM, TimeDistributed
+from keras.models import Model, quantize_model
+
+
+def decoder(vocabulary_size, units, depth):
+    inputs = Input((None,), dtype='int32')
+    x = Embedding(vocabulary_size, units)(inputs)
+    for _ in range(depth):
+        x = LSTM(units, return_sequences=True)(x)
+    outputs = TimeDistributed(Dense(vocabulary_size,
+                                    activation='softmax'))(x)
+    return Model(inputs, outputs)
+
+
+def bench(vocabulary_size=10000, units=512, depth=2, samples=16,
+          timesteps=20, number=3):
+    model = decoder(vocabulary_size, units, depth)
+    quantized_model = quantize_model(model)
+    x = np.random.randint(0, vocabulary_size, (samples, timesteps))
+
+    y = model.predict(x)
+    quantized_y = quantized_model.predict(x)
+    agreement = np.mean(y.argmax(-1) == quantized_y.argmax(-1))
+
+    sizes = []
+    times = []
+    for m in [model, quantized_model]:
+        sizes.append(sum(w.nbytes for w in m.get_weights()))
+        times.append(min(timeit.repeat(lambda: m.predict(x),
+                                       number=number, repeat=3)) / number)
+    print('vocabulary %d, %d x LSTM(%d)' % (vocabulary_size, depth, units))
+    print('  weights:     float %8.1f MB   int8 %8.1f MB   (%.2fx)' % (
+        sizes[0] / 2. ** 20, sizes[1] / 2. ** 20, sizes[0] / sizes[1]))
+    print('  prediction:  float %8.1f ms   int8 %8.1f ms   (%.2fx)' % (
+        times[0] * 1e3, times[1] * 1e3, times[0] / times[1]))
+    print('  max abs error of the probabilities: %.2e' %
+          np.abs(y - quantized_y).max())
+    print('  top-1 agreement: %.2f%%' % (100 * agreement))
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,45 @@
+"""Benchmark of `fit` and `evaluate` with small batches, with and without
+`log_freq`.
+
+With `log_freq`, the loss and the metrics are accumulated in backend
+variables and only fetched every `log_freq` batches, instead of after
+every batch.
+
+Run with `KERAS_BACKEND=<backend> python benchmarks/streamed_logs.py`.
+The NumPy backend only runs the `evaluate` benchmark, since it cannot train.
+"""
+from __future__ import print_function
+
+import timeit
+
+import numpy as np
+
+from keras import backend as K
+from keras.layers import Dense
+from keras.models import Sequential
+
+
+def bench(num_samples=8192, batch_size=8, log_freq=100, number=3):
+    model = Sequential([Dense(32, input_shape=(16,), activation='relu'),
+                        Dense(10, activation='softmax')])
+    model.compile('sgd', 'categorical_crossentropy', metrics=['acc'])
+    x = np.random.random((num_samples, 16)).astype('float32')
+    y = np.eye(10)[np.random.randint(0, 10, size=num_samples)]
+
+    runs = [('evaluate', lambda freq: model.evaluate(
+        x, y, batch_size=batch_size, verbose=0, log_freq=freq))]
+    if K.backend() != 'numpy':
+        runs.append(('fit', lambda freq: model.fit(
+            x, y, batch_size=batch_size, epochs=1, verbose=0,
+            log_freq=freq)))
+    for name, run in runs:
+        for freq in [None, log_freq]:
+            run(freq)
+            time = min(timeit.repeat(lambda: run(freq), number=number,
+                                     repeat=3)) / number
+            print('%-8s log_freq=%-5s %8.1f ms   %8.0f samples/s' % (
+                name, freq, time * 1e3, num_samples / time))
+
+
+if __name__ == '__main__':
+    bench()
@@ -224,6 +224,7 @@ PAGES = [
         'page': 'layers/normalization.md',
         'classes': [
             layers.BatchNormalization,
+            layers.LayerNormalization,
         ],
     },
     {
@@ -1,14 +1,14 @@
 from __future__ import absolute_import
 
+import importlib
+import sys
+
 from . import utils
 from . import activations
-from . import applications
 from . import backend
-from . import datasets
 from . import engine
 from . import layers
 from . import preprocessing
-from . import wrappers
 from . import callbacks
 from . import constraints
 from . import initializers
@@ -24,3 +24,18 @@ from .models import Model
 from .models import Sequential
 
 __version__ = '2.3.1'
+
+# Submodules that are slow to import and not needed to build or run
+# models are imported on first access (e.g. `keras.datasets.mnist`).
+_LAZY_SUBMODULES = ('applications', 'caffe', 'datasets', 'wrappers')
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _LAZY_SUBMODULES:
+            return importlib.import_module('.' + name, __name__)
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+else:
+    from . import applications
+    from . import datasets
+    from . import wrappers
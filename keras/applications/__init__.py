@@ -7,7 +7,8 @@ from .. import layers
 from .. import models
 from .. import utils
 
-import keras_applications
+import importlib
+import sys
 
 
 def keras_modules_injection(base_fun):
@@ -22,15 +23,49 @@ def keras_modules_injection(base_fun):
     return wrapper
 
 
-from .vgg16 import VGG16
-from .vgg19 import VGG19
-from .resnet50 import ResNet50
-from .inception_v3 import InceptionV3
-from .inception_resnet_v2 import InceptionResNetV2
-from .xception import Xception
-from .mobilenet import MobileNet
-from .mobilenet_v2 import MobileNetV2
-from .densenet import DenseNet121, DenseNet169, DenseNet201
-from .nasnet import NASNetMobile, NASNetLarge
-from .resnet import ResNet101, ResNet152
-from .resnet_v2 import ResNet50V2, ResNet101V2, ResNet152V2
+# Maps the application functions to the modules defining them.
+_APPLICATIONS = {
+    'VGG16': 'vgg16',
+    'VGG19': 'vgg19',
+    'ResNet50': 'resnet50',
+    'InceptionV3': 'inception_v3',
+    'InceptionResNetV2': 'inception_resnet_v2',
+    'Xception': 'xception',
+    'MobileNet': 'mobilenet',
+    'MobileNetV2': 'mobilenet_v2',
+    'DenseNet121': 'densenet',
+    'DenseNet169': 'densenet',
+    'DenseNet201': 'densenet',
+    'NASNetMobile': 'nasnet',
+    'NASNetLarge': 'nasnet',
+    'ResNet101': 'resnet',
+    'ResNet152': 'resnet',
+    'ResNet50V2': 'resnet_v2',
+    'ResNet101V2': 'resnet_v2',
+    'ResNet152V2': 'resnet_v2',
+}
+
+if sys.version_info >= (3, 7):
+    # Applications (and `keras_applications`) are imported on first access.
+    def __getattr__(name):
+        if name in _APPLICATIONS:
+            module = importlib.import_module('.' + _APPLICATIONS[name],
+                                             __name__)
+            return getattr(module, name)
+        if name in _APPLICATIONS.values() or name == 'imagenet_utils':
+            return importlib.import_module('.' + name, __name__)
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+else:
+    from .vgg16 import VGG16
+    from .vgg19 import VGG19
+    from .resnet50 import ResNet50
+    from .inception_v3 import InceptionV3
+    from .inception_resnet_v2 import InceptionResNetV2
+    from .xception import Xception
+    from .mobilenet import MobileNet
+    from .mobilenet_v2 import MobileNetV2
+    from .densenet import DenseNet121, DenseNet169, DenseNet201
+    from .nasnet import NASNetMobile, NASNetLarge
+    from .resnet import ResNet101, ResNet152
+    from .resnet_v2 import ResNet50V2, ResNet101V2, ResNet152V2
@@ -1,3 +1,10 @@
+from __future__ import absolute_import
+
+import functools
+import importlib
+import sys
+
+# Configuration functions, available without importing the backend module.
 from .load_backend import epsilon
 from .load_backend import set_epsilon
 from .load_backend import floatx
@@ -5,179 +12,239 @@ from .load_backend import set_floatx
 from .load_backend import cast_to_floatx
 from .load_backend import image_data_format
 from .load_backend import set_image_data_format
-from .load_backend import reset_uids
-from .load_backend import get_uid
-from .load_backend import learning_phase
-from .load_backend import set_learning_phase
-from .load_backend import is_sparse
-from .load_backend import to_dense
-from .load_backend import variable
-from .load_backend import is_variable
-from .load_backend import constant
-from .load_backend import is_keras_tensor
-from .load_backend import is_tensor
-from .load_backend import placeholder
-from .load_backend import is_placeholder
-from .load_backend import shape
-from .load_backend import int_shape
-from .load_backend import ndim
-from .load_backend import dtype
-from .load_backend import eval
-from .load_backend import zeros
-from .load_backend import ones
-from .load_backend import eye
-from .load_backend import zeros_like
-from .load_backend import ones_like
-from .load_backend import identity
-from .load_backend import random_uniform_variable
-from .load_backend import random_normal_variable
-from .load_backend import count_params
-from .load_backend import cast
-from .load_backend import ceil
-from .load_backend import floor
-from .load_backend import update
-from .load_backend import update_add
-from .load_backend import update_sub
-from .load_backend import moving_average_update
-from .load_backend import dot
-from .load_backend import batch_dot
-from .load_backend import dot_product
-from .load_backend import transpose
-from .load_backend import gather
-from .load_backend import fft
-from .load_backend import ifft
-from .load_backend import real
-from .load_backend import max
-from .load_backend import min
-from .load_backend import sum
-from .load_backend import prod
-from .load_backend import cumsum
-from .load_backend import cumprod
-from .load_backend import var
-from .load_backend import std
-from .load_backend import mean
-from .load_backend import any
-from .load_backend import all
-from .load_backend import argmax
-from .load_backend import argmin
-from .load_backend import square
-from .load_backend import abs
-from .load_backend import sqrt
-from .load_backend import exp
-from .load_backend import log
-from .load_backend import log2
-from .load_backend import logsumexp
-from .load_backend import round
-from .load_backend import sign
-from .load_backend import pow
-from .load_backend import clip
-from .load_backend import equal
-from .load_backend import not_equal
-from .load_backend import greater
-from .load_backend import greater_equal
-from .load_backend import less
-from .load_backend import less_equal
-from .load_backend import maximum
-from .load_backend import minimum
-from .load_backend import sin
-from .load_backend import cos
-from .load_backend import normalize_batch_in_training
-from .load_backend import batch_normalization
-from .load_backend import concatenate
-from .load_backend import reshape
-from .load_backend import permute_dimensions
-from .load_backend import resize_images
-from .load_backend import resize_volumes
-from .load_backend import repeat_elements
-from .load_backend import repeat
-from .load_backend import repeatRdim
-from .load_backend import equal_dimensions
-from .load_backend import funequal
-from .load_backend import arange
-from .load_backend import tile
-from .load_backend import flatten
-from .load_backend import batch_flatten
-from .load_backend import expand_dims
-from .load_backend import squeeze
-from .load_backend import temporal_padding
-from .load_backend import spatial_2d_padding
-from .load_backend import spatial_3d_padding
-from .load_backend import tril
-from .load_backend import stack
-from .load_backend import one_hot
-from .load_backend import reverse
-from .load_backend import slice
-from .load_backend import get_value
-from .load_backend import batch_get_value
-from .load_backend import set_value
-from .load_backend import batch_set_value
-from .load_backend import print_tensor
-from .load_backend import function
-from .load_backend import gradients
-from .load_backend import stop_gradient
-from .load_backend import rnn
-from .load_backend import switch
-from .load_backend import in_train_phase
-from .load_backend import in_test_phase
-from .load_backend import relu
-from .load_backend import elu
-from .load_backend import softmax
-from .load_backend import softmax_3d
-from .load_backend import softplus
-from .load_backend import softsign
-from .load_backend import categorical_crossentropy
-from .load_backend import sparse_categorical_crossentropy
-from .load_backend import binary_crossentropy
-from .load_backend import sigmoid
-from .load_backend import hard_sigmoid
-from .load_backend import tanh
-from .load_backend import dropout
-from .load_backend import l2_normalize
-from .load_backend import l1_normalize
-from .load_backend import in_top_k
-from .load_backend import conv1d
-from .load_backend import separable_conv1d
-from .load_backend import conv2d
-from .load_backend import separable_conv2d
-from .load_backend import conv2d_transpose
-from .load_backend import depthwise_conv2d
-from .load_backend import conv3d
-from .load_backend import conv3d_transpose
-from .load_backend import pool2d
-from .load_backend import pool3d
-from .load_backend import bias_add
-from .load_backend import random_normal
-from .load_backend import random_uniform
-from .load_backend import random_binomial
-from .load_backend import truncated_normal
-from .load_backend import count_sketch
-from .load_backend import scan_conv1d
-from .load_backend import ctc_label_dense_to_sparse
-from .load_backend import ctc_batch_cost
-from .load_backend import ctc_decode
-from .load_backend import map_fn
-from .load_backend import foldl
-from .load_backend import foldr
-from .load_backend import local_conv1d
-from .load_backend import local_conv2d
-from .load_backend import backend
 from .load_backend import normalize_data_format
-from .load_backend import name_scope
-from .load_backend import symbolic
-from .load_backend import eager
-from .load_backend import size
-from .load_backend import control_dependencies
+from .load_backend import backend
+from . import load_backend
+
+# Functions of the backend module, which is imported when one of them
+# is first accessed (on Python 3.7+), since importing TensorFlow or
+# Theano takes seconds.
+_BACKEND_FUNCTIONS = [
+    'symbolic',
+    'eager',
+    'reset_uids',
+    'get_uid',
+    'learning_phase',
+    'set_learning_phase',
+    'is_sparse',
+    'to_dense',
+    'variable',
+    'is_variable',
+    'constant',
+    'is_keras_tensor',
+    'is_tensor',
+    'placeholder',
+    'is_placeholder',
+    'shape',
+    'int_shape',
+    'ndim',
+    'dtype',
+    'eval',
+    'zeros',
+    'ones',
+    'eye',
+    'zeros_like',
+    'ones_like',
+    'identity',
+    'random_uniform_variable',
+    'random_normal_variable',
+    'count_params',
+    'cast',
+    'ceil',
+    'floor',
+    'update',
+    'update_add',
+    'update_sub',
+    'moving_average_update',
+    'dot',
+    'batch_dot',
+    'dot_product',
+    'transpose',
+    'gather',
+    'fft',
+    'ifft',
+    'real',
+    'max',
+    'min',
+    'sum',
+    'prod',
+    'cumsum',
+    'cumprod',
+    'searchsorted',
+    'bincount',
+    'var',
+    'std',
+    'mean',
+    'any',
+    'all',
+    'argmax',
+    'argmin',
+    'square',
+    'abs',
+    'sqrt',
+    'exp',
+    'log',
+    'log2',
+    'logsumexp',
+    'round',
+    'sign',
+    'pow',
+    'clip',
+    'equal',
+    'not_equal',
+    'greater',
+    'greater_equal',
+    'less',
+    'less_equal',
+    'maximum',
+    'minimum',
+    'sin',
+    'cos',
+    'normalize_batch_in_training',
+    'batch_normalization',
+    'layer_normalization',
+    'concatenate',
+    'reshape',
+    'permute_dimensions',
+    'resize_images',
+    'resize_volumes',
+    'repeat_elements',
+    'repeat',
+    'repeatRdim',
+    'equal_dimensions',
+    'funequal',
+    'arange',
+    'tile',
+    'flatten',
+    'batch_flatten',
+    'expand_dims',
+    'squeeze',
+    'temporal_padding',
+    'spatial_2d_padding',
+    'spatial_3d_padding',
+    'tril',
+    'stack',
+    'one_hot',
+    'reverse',
+    'slice',
+    'get_value',
+    'batch_get_value',
+    'set_value',
+    'batch_set_value',
+    'print_tensor',
+    'function',
+    'gradients',
+    'stop_gradient',
+    'rnn',
+    'switch',
+    'in_train_phase',
+    'in_test_phase',
+    'relu',
+    'elu',
+    'softmax',
+    'softmax_3d',
+    'softplus',
+    'softsign',
+    'categorical_crossentropy',
+    'sparse_categorical_crossentropy',
+    'binary_crossentropy',
+    'sigmoid',
+    'hard_sigmoid',
+    'tanh',
+    'dropout',
+    'l2_normalize',
+    'l1_normalize',
+    'in_top_k',
+    'conv1d',
+    'separable_conv1d',
+    'conv2d',
+    'separable_conv2d',
+    'conv2d_transpose',
+    'depthwise_conv2d',
+    'conv3d',
+    'conv3d_transpose',
+    'pool2d',
+    'pool3d',
+    'bias_add',
+    'random_normal',
+    'random_uniform',
+    'random_binomial',
+    'truncated_normal',
+    'count_sketch',
+    'scan_conv1d',
+    'ctc_label_dense_to_sparse',
+    'ctc_batch_cost',
+    'ctc_decode',
+    'map_fn',
+    'foldl',
+    'foldr',
+    'local_conv1d',
+    'local_conv2d',
+    'name_scope',
+    'size',
+    'control_dependencies',
+]
+_BACKEND_SPECIFIC_FUNCTIONS = {
+    'theano': ['pattern_broadcast', 'function_signature',
+               'serialize_function', 'deserialize_function'],
+    'tensorflow': ['clear_session', 'manual_variable_initialization',
+                   'get_session', 'set_session'],
+    'cntk': ['clear_session'],
+    'numpy': ['clear_session'],
+}
+_BACKEND_FUNCTIONS += _BACKEND_SPECIFIC_FUNCTIONS.get(backend(), [])
+
+
+def _lazy_decorator(name):
+    """Returns a decorator applying the backend decorator `name` lazily.
+
+    `symbolic` and `eager` decorate functions when Keras modules are
+    imported, before the backend module is loaded. The decorator of the
+    backend is then applied on the first call of the decorated function.
+    """
+    def decorator(func):
+        decorated = []
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not decorated:
+                _load_backend_functions()
+                decorated.append(globals()[name](func))
+            return decorated[0](*args, **kwargs)
+
+        return wrapper
+
+    decorator.__name__ = name
+    return decorator
+
+
+# Replaced by the decorators of the backend once it is loaded.
+symbolic = _lazy_decorator('symbolic')
+eager = _lazy_decorator('eager')
+
+
+def _load_backend_functions():
+    load_backend._load_backend_module()
+    namespace = globals()
+    for name in _BACKEND_FUNCTIONS:
+        namespace[name] = getattr(load_backend, name)
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _BACKEND_FUNCTIONS:
+            _load_backend_functions()
+            return globals()[name]
+        if name.endswith('_backend') or name == 'common':
+            # Submodules, e.g. `K.tensorflow_backend`.
+            return importlib.import_module('.' + name, __name__)
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_BACKEND_FUNCTIONS))
+else:
+    _load_backend_functions()
 
 # Set Keras' recursion limit high enough.
-import sys
 sys.setrecursionlimit(10000)
-
-if backend() == 'theano':
-    from .load_backend import pattern_broadcast
-elif backend() == 'tensorflow':
-    from .load_backend import clear_session
-    from .load_backend import manual_variable_initialization
-    from .load_backend import get_session
-    from .load_backend import set_session
-elif backend() == 'cntk':
-    from .load_backend import clear_session
@@ -1244,6 +1244,17 @@ def batch_normalization(x, mean, var, beta, gamma, axis=-1, epsilon=1e-3):
     return (x - mean) / C.sqrt(var + epsilon) * gamma + beta
 
 
+def layer_normalization(x, gamma=None, beta=None, axis=-1, epsilon=1e-3):
+    centered = x - mean(x, axis=axis, keepdims=True)
+    variance = mean(C.square(centered), axis=axis, keepdims=True)
+    output = centered / C.sqrt(variance + epsilon)
+    if gamma is not None:
+        output = output * gamma
+    if beta is not None:
+        output = output + beta
+    return output
+
+
 def concatenate(tensors, axis=-1):
     if len(tensors) == 0:
         return None
@@ -2790,6 +2801,25 @@ def cumprod(x, axis=0):
     return out
 
 
+def searchsorted(sorted_sequence, values, side='left'):
+    values = expand_dims(values, -1)
+    if side == 'left':
+        smaller = greater(values, sorted_sequence)
+    else:
+        smaller = greater_equal(values, sorted_sequence)
+    return cast(sum(cast(smaller, 'int32'), axis=-1), 'int32')
+
+
+def bincount(x, weights=None, minlength=0):
+    # CNTK needs a static number of bins: `minlength` must be larger
+    # than the values of `x`.
+    counts = one_hot(x, minlength)
+    if weights is not None:
+        counts = counts * expand_dims(weights, -1)
+        return sum(counts, axis=0)
+    return cast(sum(counts, axis=0), 'int32')
+
+
 def arange(start, stop=None, step=1, dtype='int32'):
     raise NotImplementedError
 
@@ -78,35 +78,76 @@ if 'KERAS_BACKEND' in os.environ:
     if _backend:
         _BACKEND = _backend
 
-# Import backend functions.
-if _BACKEND == 'cntk':
-    sys.stderr.write('Using CNTK backend\n')
-    from .cntk_backend import *
-elif _BACKEND == 'theano':
-    sys.stderr.write('Using Theano backend.\n')
-    from .theano_backend import *
-elif _BACKEND == 'tensorflow':
-    sys.stderr.write('Using TensorFlow backend.\n')
-    from .tensorflow_backend import *
+_BACKEND_MODULE = None
+
+
+def _load_backend_module():
+    """Imports the backend module and copies its functions in this module.
+
+    Importing TensorFlow, Theano or CNTK takes seconds, so this is deferred
+    until a backend function is first needed (on Python 3.7+, see the module
+    `__getattr__` below), which keeps `import keras` fast.
+
+    # Returns
+        The backend module.
+    """
+    global _BACKEND_MODULE
+    if _BACKEND_MODULE is not None:
+        return _BACKEND_MODULE
+    namespace = globals()
+    if _BACKEND in _BUILTIN_BACKENDS:
+        module_name, backend_name = _BUILTIN_BACKENDS[_BACKEND]
+        sys.stderr.write('Using %s backend.\n' % backend_name)
+        backend_module = importlib.import_module(module_name, __package__)
+        # Equivalent to `from .xxx_backend import *`.
+        names = getattr(backend_module, '__all__', None)
+        if names is None:
+            names = [k for k in backend_module.__dict__
+                     if not k.startswith('_')]
+        for k in names:
+            namespace[k] = getattr(backend_module, k)
+    else:
+        # Try and load external backend.
+        try:
+            backend_module = importlib.import_module(_BACKEND)
+            entries = backend_module.__dict__
+            # Check if valid backend.
+            # Module is a valid backend if it has the required entries.
+            required_entries = ['placeholder', 'variable', 'function']
+            for e in required_entries:
+                if e not in entries:
+                    raise ValueError('Invalid backend. '
+                                     'Missing required entry : ' + e)
+            for k, v in entries.items():
+                # Make sure we don't override any entries from common,
+                # such as epsilon.
+                if k not in namespace:
+                    namespace[k] = v
+            sys.stderr.write('Using ' + _BACKEND + ' backend.\n')
+        except ImportError:
+            raise ValueError('Unable to import backend : ' + str(_BACKEND))
+    _BACKEND_MODULE = backend_module
+    return backend_module
+
+
+_BUILTIN_BACKENDS = {
+    'cntk': ('.cntk_backend', 'CNTK'),
+    'theano': ('.theano_backend', 'Theano'),
+    'tensorflow': ('.tensorflow_backend', 'TensorFlow'),
+    'numpy': ('.numpy_backend', 'NumPy'),
+}
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        _load_backend_module()
+        if name in globals():
+            return globals()[name]
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
 else:
-    # Try and load external backend.
-    try:
-        backend_module = importlib.import_module(_BACKEND)
-        entries = backend_module.__dict__
-        # Check if valid backend.
-        # Module is a valid backend if it has the required entries.
-        required_entries = ['placeholder', 'variable', 'function']
-        for e in required_entries:
-            if e not in entries:
-                raise ValueError('Invalid backend. Missing required entry : ' + e)
-        namespace = globals()
-        for k, v in entries.items():
-            # Make sure we don't override any entries from common, such as epsilon.
-            if k not in namespace:
-                namespace[k] = v
-        sys.stderr.write('Using ' + _BACKEND + ' backend.\n')
-    except ImportError:
-        raise ValueError('Unable to import backend : ' + str(_BACKEND))
+    _load_backend_module()
 
 
 def backend():
@@ -1,115 +1,600 @@
-"""Utilities for backend functionality checks."""
+"""NumPy backend.
+
+Operations run eagerly on NumPy arrays, which is how this module is used as a
+reference implementation in the backend tests. Operations called on
+`NumpyTensor` objects (placeholders, variables and results of other
+operations) are recorded in a graph instead, and evaluated by `function` or
+`eval`. This makes the module usable as an inference-only Keras backend
+(`KERAS_BACKEND=numpy`) that does not import TensorFlow or Theano.
+"""
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import functools
+import inspect
+import operator
+import weakref
+from collections import defaultdict
+from contextlib import contextmanager
+
 import numpy as np
-import scipy.signal as signal
+import scipy.fftpack
+import scipy.sparse
+import scipy.special
+import scipy.stats
 import scipy as sp
+from .common import epsilon
 from .common import floatx
-from keras.utils.generic_utils import transpose_shape
-from keras.utils import to_categorical
+from .common import normalize_data_format
+from ..utils.generic_utils import transpose_shape
+from ..utils.np_utils import to_categorical
+
+py_all = all
+py_any = any
+py_max = max
+py_sum = sum
+py_slice = slice
 
+_UID_PREFIXES = defaultdict(int)
 
-def normalize_conv(func):
-    def wrapper(*args, **kwargs):
-        x = args[0]
-        w = args[1]
-        if x.ndim == 3:
-            w = np.flipud(w)
-            w = np.transpose(w, (1, 2, 0))
-            if kwargs['data_format'] == 'channels_last':
-                x = np.transpose(x, (0, 2, 1))
-        elif x.ndim == 4:
-            w = np.fliplr(np.flipud(w))
-            w = np.transpose(w, (2, 3, 0, 1))
-            if kwargs['data_format'] == 'channels_last':
-                x = np.transpose(x, (0, 3, 1, 2))
+
+# SYMBOLIC GRAPH
+
+
+class NumpyTensor(object):
+    """Node of the deferred computation graph of the NumPy backend.
+
+    A node is either a leaf, i.e. a placeholder (`_value` is `None` until it
+    is fed) or a variable or constant (holding its array in `_value`), or the
+    application of the function `_op` to `_args` and `_kwargs`, which may
+    contain other nodes, possibly nested in lists, tuples, dicts or slices.
+    """
+
+    # Makes NumPy defer to the reflected operators below,
+    # so that `array + tensor` builds a node.
+    __array_ufunc__ = None
+
+    def __init__(self, op=None, args=(), kwargs=None, value=None,
+                 dtype=None, name=None):
+        self._op = op
+        self._args = args
+        self._kwargs = kwargs or {}
+        self._value = value
+        self._dtype = dtype
+        self._inputs = _collect_tensors((args, self._kwargs))
+        self._uses_learning_phase = False
+        self.name = name
+
+    def __iter__(self):
+        # Like Theano variables, tensors whose first axis has a static
+        # length can be unpacked, e.g. `list(x.shape)`.
+        static_shape = int_shape(self)
+        if not static_shape or static_shape[0] is None:
+            raise TypeError('`NumpyTensor` objects are not iterable '
+                            'unless their first axis has a static length.')
+        return iter([self[i] for i in range(static_shape[0])])
+
+    def __getitem__(self, key):
+        return NumpyTensor(operator.getitem, (self, key))
+
+    def __repr__(self):
+        if self._op is None:
+            kind = 'placeholder' if is_placeholder(self) else 'variable'
         else:
-            w = np.flip(np.fliplr(np.flipud(w)), axis=2)
-            w = np.transpose(w, (3, 4, 0, 1, 2))
-            if kwargs['data_format'] == 'channels_last':
-                x = np.transpose(x, (0, 4, 1, 2, 3))
-
-        dilation_rate = kwargs.pop('dilation_rate', 1)
-        if isinstance(dilation_rate, int):
-            dilation_rate = (dilation_rate,) * (x.ndim - 2)
-        for (i, d) in enumerate(dilation_rate):
-            if d > 1:
-                for j in range(w.shape[2 + i] - 1):
-                    w = np.insert(w, 2 * j + 1, 0, axis=2 + i)
-
-        y = func(x, w, **kwargs)
-
-        if kwargs['data_format'] == 'channels_last':
-            if y.ndim == 3:
-                y = np.transpose(y, (0, 2, 1))
-            elif y.ndim == 4:
-                y = np.transpose(y, (0, 2, 3, 1))
+            kind = getattr(self._op, '__name__', 'op')
+        return '<NumpyTensor %s name=%s>' % (kind, self.name)
+
+    @property
+    def shape(self):
+        return shape(self)
+
+    @property
+    def ndim(self):
+        return ndim(self)
+
+    @property
+    def dtype(self):
+        return dtype(self)
+
+
+def _unary_operator(op):
+    def method(self):
+        return NumpyTensor(op, (self,))
+    return method
+
+
+def _binary_operators(op):
+    def method(self, other):
+        return NumpyTensor(op, (self, other))
+
+    def reflected(self, other):
+        return NumpyTensor(op, (other, self))
+    return method, reflected
+
+
+for _name, _op in [('add', operator.add), ('sub', operator.sub),
+                   ('mul', operator.mul), ('truediv', operator.truediv),
+                   ('floordiv', operator.floordiv), ('mod', operator.mod),
+                   ('pow', operator.pow), ('and', operator.and_),
+                   ('or', operator.or_), ('xor', operator.xor)]:
+    _method, _reflected = _binary_operators(_op)
+    setattr(NumpyTensor, '__%s__' % _name, _method)
+    setattr(NumpyTensor, '__r%s__' % _name, _reflected)
+NumpyTensor.__div__ = NumpyTensor.__truediv__
+NumpyTensor.__rdiv__ = NumpyTensor.__rtruediv__
+for _name, _op in [('lt', operator.lt), ('le', operator.le),
+                   ('gt', operator.gt), ('ge', operator.ge)]:
+    setattr(NumpyTensor, '__%s__' % _name, _binary_operators(_op)[0])
+for _name, _op in [('neg', operator.neg), ('pos', operator.pos),
+                   ('abs', operator.abs), ('invert', operator.invert)]:
+    setattr(NumpyTensor, '__%s__' % _name, _unary_operator(_op))
+
+
+def _collect_tensors(structure):
+    """Returns the `NumpyTensor`s found in a nested structure."""
+    tensors = []
+    stack = [structure]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, NumpyTensor):
+            tensors.append(x)
+        elif isinstance(x, (list, tuple)):
+            stack.extend(x)
+        elif isinstance(x, dict):
+            stack.extend(x.values())
+        elif isinstance(x, py_slice):
+            stack.extend((x.start, x.stop, x.step))
+    return tensors
+
+
+def _has_tensor(structure):
+    if isinstance(structure, NumpyTensor):
+        return True
+    if isinstance(structure, (list, tuple)):
+        return py_any(_has_tensor(x) for x in structure)
+    if isinstance(structure, dict):
+        return py_any(_has_tensor(x) for x in structure.values())
+    if isinstance(structure, py_slice):
+        return _has_tensor((structure.start, structure.stop, structure.step))
+    return False
+
+
+def _substitute(structure, cache):
+    """Replaces the `NumpyTensor`s of a nested structure by their values."""
+    if isinstance(structure, NumpyTensor):
+        return cache.get(structure, structure._value)
+    if isinstance(structure, list):
+        return [_substitute(x, cache) for x in structure]
+    if isinstance(structure, tuple):
+        return tuple(_substitute(x, cache) for x in structure)
+    if isinstance(structure, dict):
+        return {k: _substitute(v, cache) for k, v in structure.items()}
+    if isinstance(structure, py_slice):
+        return py_slice(*_substitute((structure.start,
+                                      structure.stop,
+                                      structure.step), cache))
+    return structure
+
+
+def _is_pending(x, cache):
+    return x not in cache and (x._op is not None or x._value is None)
+
+
+def _evaluate(tensors, cache, fill=None):
+    """Computes the values of `tensors`.
+
+    # Arguments
+        tensors: List of `NumpyTensor`s (other entries are returned as is).
+        cache: Mapping from nodes to already known values, e.g. the values
+            fed to placeholders. Computed values are added to it.
+        fill: If not `None`, a tuple `(batch_size, size)`: unfed
+            placeholders are then fed arrays of ones with their unknown
+            first dimension set to `batch_size` and their other unknown
+            dimensions set to `size` (used for shape inference).
+
+    # Returns
+        List of values.
+
+    # Raises
+        ValueError: if a placeholder needed by `tensors` was not fed.
+    """
+    stack = [x for x in tensors if isinstance(x, NumpyTensor)]
+    while stack:
+        node = stack[-1]
+        if not _is_pending(node, cache):
+            stack.pop()
+        elif node._op is None:
+            stack.pop()
+            if fill is None:
+                raise ValueError('You must feed a value for placeholder '
+                                 'tensor `%s`.' % node.name)
+            shape = tuple(fill[i > 0] if d is None else d
+                          for i, d in enumerate(node._keras_shape))
+            cache[node] = np.ones(shape, dtype=node._dtype)
+        else:
+            pending = [x for x in node._inputs if _is_pending(x, cache)]
+            if pending:
+                stack.extend(pending)
             else:
-                y = np.transpose(y, (0, 2, 3, 4, 1))
+                stack.pop()
+                args, kwargs = _substitute((node._args, node._kwargs), cache)
+                cache[node] = node._op(*args, **kwargs)
+    return [_substitute(x, cache) for x in tensors]
+
+
+# Values computed with dummy inputs, used to infer static shapes.
+_PROBES = {(2, 2): weakref.WeakKeyDictionary(),
+           (3, 3): weakref.WeakKeyDictionary()}
+# Fallback probes, for graphs combining unknown dimensions with known ones
+# (e.g. targets of shape `(None, None)` and predictions of shape
+# `(None, 10)`): the unknown dimensions other than the first are
+# set to 1, so that they broadcast.
+_BROADCAST_PROBES = {(2, 1): weakref.WeakKeyDictionary(),
+                     (3, 1): weakref.WeakKeyDictionary()}
+
+
+def _infer_shape(x):
+    """Infers the static shape of a node, with `None` for dynamic axes.
+
+    The node is evaluated twice with different sizes for the unknown
+    dimensions of the placeholders; axes whose size changes are dynamic.
+    """
+    for probes in (_PROBES, _BROADCAST_PROBES):
+        shapes = []
+        for fill, cache in probes.items():
+            try:
+                shapes.append(np.shape(_evaluate([x], cache, fill=fill)[0]))
+            except Exception:
+                break
+        else:
+            break
+    else:
+        return None
+    if len(shapes[0]) != len(shapes[1]):
+        return None
+    if probes is _BROADCAST_PROBES:
+        # Axes of size 1 may come from the unknown dimensions.
+        return tuple(int(i) if i == j and i != 1 else None
+                     for i, j in zip(*shapes))
+    return tuple(int(i) if i == j else None for i, j in zip(*shapes))
+
+
+def _graph_op(func):
+    """Makes `func` record a graph node when called on `NumpyTensor`s."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _has_tensor(args) or _has_tensor(kwargs):
+            return NumpyTensor(func, args, kwargs)
+        return func(*args, **kwargs)
+    return wrapper
 
-        return y
 
-    return wrapper
+def _multi_output_graph_op(num_outputs):
+    """Like `_graph_op`, for functions returning `num_outputs` values."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _has_tensor(args) or _has_tensor(kwargs):
+                node = NumpyTensor(func, args, kwargs)
+                return tuple(node[i] for i in range(num_outputs))
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _Subgraph(object):
+    """A Python function traced on placeholders, to be run many times.
+
+    Used to implement loops (`rnn`, `map_fn`, ...): the body is traced once
+    and every iteration only evaluates the nodes depending on the loop
+    inputs. The other nodes the body depends on are exposed in `captured`,
+    which the caller passes as arguments of the loop node so that they are
+    evaluated once, together with the rest of the graph.
+
+    # Arguments
+        inputs: List of placeholders.
+        outputs: List of tensors computed from `inputs`.
+    """
 
+    def __init__(self, inputs, outputs):
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        variant = set(self.inputs)
+        order = []
+        visited = set(self.inputs)
+        stack = [(x, False) for x in _collect_tensors(self.outputs)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+            elif node not in visited:
+                visited.add(node)
+                stack.append((node, True))
+                stack.extend((x, False) for x in node._inputs)
+        for node in order:
+            if py_any(x in variant for x in node._inputs):
+                variant.add(node)
+        # Loop-invariant nodes directly used by the loop-variant ones.
+        boundary = [x for node in order if node in variant
+                    for x in node._inputs]
+        boundary += _collect_tensors(self.outputs)
+        self.captured = []
+        seen = set(variant)
+        for x in boundary:
+            if x not in seen:
+                seen.add(x)
+                self.captured.append(x)
 
-@normalize_conv
-def conv(x, w, padding, data_format):
-    y = []
-    for i in range(x.shape[0]):
-        _y = []
-        for j in range(w.shape[1]):
-            __y = []
-            for k in range(w.shape[0]):
-                __y.append(signal.convolve(x[i, k], w[k, j], mode=padding))
-            _y.append(np.sum(np.stack(__y, axis=-1), axis=-1))
-        y.append(_y)
-    y = np.array(y)
-    return y
+    def __call__(self, values, captured_values):
+        cache = dict(zip(self.captured, captured_values))
+        cache.update(zip(self.inputs, values))
+        return _evaluate(self.outputs, cache)
 
 
-@normalize_conv
-def depthwise_conv(x, w, padding, data_format):
-    y = []
-    for i in range(x.shape[0]):
-        _y = []
-        for j in range(w.shape[0]):
-            __y = []
-            for k in range(w.shape[1]):
-                __y.append(signal.convolve(x[i, j], w[j, k], mode=padding))
-            _y.append(np.stack(__y, axis=0))
-        y.append(np.concatenate(_y, axis=0))
-    y = np.array(y)
-    return y
+def _placeholder_like(x, axes=None):
+    """Returns a placeholder with the shape and dtype of `x`.
 
+    # Arguments
+        x: Tensor or array.
+        axes: Optional list of axes of `x` to keep in the placeholder.
+    """
+    x_shape = int_shape(x)
+    if axes is not None:
+        x_shape = tuple(x_shape[i] for i in axes)
+    return placeholder(shape=x_shape, dtype=dtype(x))
 
-def separable_conv(x, w1, w2, padding, data_format):
-    x2 = depthwise_conv(x, w1, padding=padding, data_format=data_format)
-    return conv(x2, w2, padding=padding, data_format=data_format)
 
+# VARIABLE MANIPULATION
 
-def conv_transpose(x, w, output_shape, padding, data_format, dilation_rate=1):
-    if x.ndim == 4:
-        w = np.fliplr(np.flipud(w))
-        w = np.transpose(w, (0, 1, 3, 2))
-    else:
-        w = np.flip(np.fliplr(np.flipud(w)), axis=2)
-        w = np.transpose(w, (0, 1, 2, 4, 3))
 
-    if isinstance(dilation_rate, int):
-        dilation_rate = (dilation_rate,) * (x.ndim - 2)
-    for (i, d) in enumerate(dilation_rate):
-        if d > 1:
-            for j in range(w.shape[i] - 1):
-                w = np.insert(w, 2 * j + 1, 0, axis=i)
+def get_uid(prefix=''):
+    _UID_PREFIXES[prefix] += 1
+    return _UID_PREFIXES[prefix]
+
 
-    return conv(x, w, padding=padding, data_format=data_format)
+def reset_uids():
+    global _UID_PREFIXES
+    _UID_PREFIXES = defaultdict(int)
 
 
-conv1d = conv
-conv2d = conv
-conv3d = conv
+def clear_session():
+    reset_uids()
+    for cache in list(_PROBES.values()) + list(_BROADCAST_PROBES.values()):
+        cache.clear()
+
+
+@contextmanager
+def name_scope(name):
+    yield
+
+
+def control_dependencies(control_inputs):
+    @contextmanager
+    def nullcontextmanager():
+        yield
+
+    return nullcontextmanager()
+
+
+def is_sparse(tensor):
+    if isinstance(tensor, NumpyTensor):
+        return getattr(tensor, '_sparse', False) or (
+            tensor._value is not None and sp.sparse.issparse(tensor._value))
+    return sp.sparse.issparse(tensor)
+
+
+def to_dense(tensor):
+    if sp.sparse.issparse(tensor):
+        return tensor.toarray()
+    return tensor
+
+
+def is_tensor(x):
+    return isinstance(x, NumpyTensor)
+
+
+def is_keras_tensor(x):
+    if not is_tensor(x):
+        raise ValueError('Unexpectedly found an instance of type `' +
+                         str(type(x)) + '`. '
+                         'Expected a symbolic tensor instance.')
+    return hasattr(x, '_keras_history')
+
+
+def is_variable(x):
+    return (isinstance(x, NumpyTensor) and
+            x._op is None and x._value is not None)
+
+
+def is_placeholder(x):
+    return getattr(x, '_is_placeholder', False)
+
+
+def placeholder(shape=None, ndim=None, dtype=None, sparse=False, name=None):
+    """Instantiates a placeholder tensor and returns it.
+
+    # Arguments
+        shape: Shape of the placeholder
+            (integer tuple, may include `None` entries).
+        ndim: Number of axes of the tensor.
+            At least one of {`shape`, `ndim`} must be specified.
+            If both are specified, `shape` is used.
+        dtype: Placeholder type.
+        sparse: Boolean, whether the placeholder should have a sparse type.
+        name: Optional name string for the placeholder.
+
+    # Returns
+        `NumpyTensor` instance, to be fed in the calls of `function`.
+    """
+    if dtype is None:
+        dtype = floatx()
+    if shape is None and ndim is None:
+        raise ValueError('Specify either a shape or ndim value.')
+    if shape is None:
+        shape = (None,) * ndim
+    x = NumpyTensor(dtype=dtype, name=name or 'placeholder')
+    x._keras_shape = tuple(shape)
+    x._is_placeholder = True
+    x._sparse = sparse
+    return x
+
+
+def _normalize_tuple(value, n):
+    if isinstance(value, int):
+        return (value,) * n
+    return tuple(value)
+
+
+def _to_channels_last(x, data_format):
+    if data_format == 'channels_first':
+        return np.moveaxis(x, 1, -1)
+    return x
+
+
+def _from_channels_last(x, data_format):
+    if data_format == 'channels_first':
+        return np.moveaxis(x, -1, 1)
+    return x
+
+
+def _pad_spatial(x, kernel_size, strides, dilation_rate, padding, value=0.):
+    """Pads the spatial axes of a channels_last `x` like TensorFlow does."""
+    if padding == 'valid':
+        return x
+    pads = [(0, 0)]
+    for size, k, s, d in zip(x.shape[1:-1], kernel_size,
+                             strides, dilation_rate):
+        k = (k - 1) * d + 1
+        if padding == 'causal':
+            pads.append((k - 1, 0))
+        else:
+            total = py_max((-(-size // s) - 1) * s + k - size, 0)
+            pads.append((total // 2, total - total // 2))
+    pads.append((0, 0))
+    return np.pad(x, pads, 'constant', constant_values=value)
+
+
+def _windows(x, kernel_size, strides, dilation_rate):
+    """Read-only view of the sliding windows of a channels_last `x`.
+
+    # Returns
+        Array of shape `(batch,) + output_spatial + kernel_size +
+        (channels,)`, sharing memory with `x`.
+    """
+    spatial = x.shape[1:-1]
+    out_size = tuple((size - (k - 1) * d - 1) // s + 1
+                     for size, k, s, d in zip(spatial, kernel_size,
+                                              strides, dilation_rate))
+    if py_any(size <= 0 for size in out_size):
+        raise ValueError('The input of shape %s is too small for a window of '
+                         'size %s.' % (x.shape, kernel_size))
+    x_strides = x.strides[1:-1]
+    return np.lib.stride_tricks.as_strided(
+        x,
+        shape=(x.shape[0],) + out_size + tuple(kernel_size) + (x.shape[-1],),
+        strides=((x.strides[0],) +
+                 tuple(st * s for st, s in zip(x_strides, strides)) +
+                 tuple(st * d for st, d in zip(x_strides, dilation_rate)) +
+                 (x.strides[-1],)),
+        writeable=False)
+
+
+def conv(x, kernel, strides=1, padding='valid',
+         data_format=None, dilation_rate=1):
+    """N-D convolution (cross-correlation, as in TensorFlow).
+
+    The sliding windows of the input are gathered in a strided view and
+    contracted with the kernel in a single `np.tensordot` call.
+    """
+    data_format = normalize_data_format(data_format)
+    n = kernel.ndim - 2
+    strides = _normalize_tuple(strides, n)
+    dilation_rate = _normalize_tuple(dilation_rate, n)
+    x = _to_channels_last(np.asarray(x), data_format)
+    x = _pad_spatial(x, kernel.shape[:n], strides, dilation_rate, padding)
+    windows = _windows(x, kernel.shape[:n], strides, dilation_rate)
+    y = np.tensordot(windows, kernel,
+                     axes=(list(range(n + 1, 2 * n + 2)), list(range(n + 1))))
+    return _from_channels_last(y, data_format)
+
+
+def depthwise_conv(x, kernel, strides=1, padding='valid',
+                   data_format=None, dilation_rate=1):
+    data_format = normalize_data_format(data_format)
+    n = kernel.ndim - 2
+    strides = _normalize_tuple(strides, n)
+    dilation_rate = _normalize_tuple(dilation_rate, n)
+    x = _to_channels_last(np.asarray(x), data_format)
+    x = _pad_spatial(x, kernel.shape[:n], strides, dilation_rate, padding)
+    windows = _windows(x, kernel.shape[:n], strides, dilation_rate)
+    out_shape = windows.shape[:n + 1]
+    channels, multiplier = kernel.shape[-2:]
+    windows = windows.reshape((-1, int(np.prod(kernel.shape[:n])), channels))
+    kernel = kernel.reshape((-1, channels, multiplier))
+    y = np.einsum('npc,pcm->ncm', windows, kernel)
+    y = y.reshape(out_shape + (channels * multiplier,))
+    return _from_channels_last(y, data_format)
+
+
+def separable_conv(x, depthwise_kernel, pointwise_kernel, strides=1,
+                   padding='valid', data_format=None, dilation_rate=1):
+    x = depthwise_conv(x, depthwise_kernel, strides=strides, padding=padding,
+                       data_format=data_format, dilation_rate=dilation_rate)
+    return conv(x, pointwise_kernel, padding='valid', data_format=data_format)
+
+
+def conv_transpose(x, kernel, output_shape, strides=1, padding='valid',
+                   data_format=None, dilation_rate=1):
+    """Transposed convolution, i.e. the gradient of `conv` w.r.t. its input.
+
+    The input is dilated by the strides and padded so that a stride-1
+    `conv` with the flipped kernel yields `output_shape`.
+    """
+    data_format = normalize_data_format(data_format)
+    n = kernel.ndim - 2
+    strides = _normalize_tuple(strides, n)
+    dilation_rate = _normalize_tuple(dilation_rate, n)
+    x = _to_channels_last(np.asarray(x), data_format)
+    if data_format == 'channels_first':
+        out_spatial = tuple(output_shape[2:])
+    else:
+        out_spatial = tuple(output_shape[1:-1])
+
+    in_spatial = x.shape[1:-1]
+    z = np.zeros((x.shape[0],) +
+                 tuple((i - 1) * s + 1 for i, s in zip(in_spatial, strides)) +
+                 (x.shape[-1],), dtype=x.dtype)
+    z[(py_slice(None),) +
+      tuple(py_slice(None, None, s) for s in strides)] = x
+
+    pads = [(0, 0)]
+    for i, o, k, s, d in zip(in_spatial, out_spatial, kernel.shape[:n],
+                             strides, dilation_rate):
+        k = (k - 1) * d + 1
+        before = 0
+        if padding == 'same':
+            before = py_max((i - 1) * s + k - o, 0) // 2
+        pads.append((k - 1 - before, o - 1 + before - (i - 1) * s))
+    pads.append((0, 0))
+    z = np.pad(z, [(py_max(a, 0), py_max(b, 0)) for a, b in pads], 'constant')
+    z = z[tuple(py_slice(py_max(-a, 0), z.shape[j] - py_max(-b, 0))
+                for j, (a, b) in enumerate(pads))]
+
+    kernel = np.swapaxes(kernel[(py_slice(None, None, -1),) * n], -1, -2)
+    y = conv(z, kernel, padding='valid', data_format='channels_last',
+             dilation_rate=dilation_rate)
+    return _from_channels_last(y, data_format)
+
+
+def conv1d(x, kernel, strides=1, padding='valid',
+           data_format=None, dilation_rate=1):
+    return conv(x, kernel, strides=strides, padding=padding,
+                data_format=data_format, dilation_rate=dilation_rate)
+
+
+conv2d = conv1d
+conv3d = conv1d
 depthwise_conv2d = depthwise_conv
 separable_conv1d = separable_conv
 separable_conv2d = separable_conv
@@ -117,63 +602,53 @@ conv2d_transpose = conv_transpose
 conv3d_transpose = conv_transpose
 
 
-def pool(x, pool_size, strides, padding, data_format, pool_mode):
-    if data_format == 'channels_last':
-        if x.ndim == 3:
-            x = np.transpose(x, (0, 2, 1))
-        elif x.ndim == 4:
-            x = np.transpose(x, (0, 3, 1, 2))
-        else:
-            x = np.transpose(x, (0, 4, 1, 2, 3))
-
-    if padding == 'same':
-        pad = [(0, 0), (0, 0)] + [(s // 2, s // 2) for s in pool_size]
-        x = np.pad(x, pad, 'constant', constant_values=-np.inf)
-
-    # indexing trick
-    x = np.pad(x, [(0, 0), (0, 0)] + [(0, 1) for _ in pool_size],
-               'constant', constant_values=0)
-
-    if x.ndim == 3:
-        y = [x[:, :, k:k1:strides[0]]
-             for (k, k1) in zip(range(pool_size[0]), range(-pool_size[0], 0))]
-    elif x.ndim == 4:
-        y = []
-        for (k, k1) in zip(range(pool_size[0]), range(-pool_size[0], 0)):
-            for (l, l1) in zip(range(pool_size[1]), range(-pool_size[1], 0)):
-                y.append(x[:, :, k:k1:strides[0], l:l1:strides[1]])
+def pool(x, pool_size, strides=None, padding='valid',
+         data_format=None, pool_mode='max'):
+    """N-D pooling over strided windows of the input.
+
+    Average pooling only counts the elements inside the input, so that
+    the padded borders of `'same'` pooling do not lower the mean.
+    """
+    data_format = normalize_data_format(data_format)
+    if padding not in {'same', 'valid'}:
+        raise ValueError('Invalid padding: ' + str(padding))
+    if pool_mode not in {'max', 'avg'}:
+        raise ValueError('Invalid pool_mode: ' + str(pool_mode))
+    n = len(pool_size)
+    if strides is None:
+        strides = pool_size
+    strides = _normalize_tuple(strides, n)
+    ones = (1,) * n
+    x = _to_channels_last(np.asarray(x), data_format)
+    window_axes = tuple(range(n + 1, 2 * n + 1))
+    if pool_mode == 'max':
+        x = _pad_spatial(x, pool_size, strides, ones, padding, value=-np.inf)
+        y = np.max(_windows(x, pool_size, strides, ones), axis=window_axes)
     else:
-        y = []
-        for (k, k1) in zip(range(pool_size[0]), range(-pool_size[0], 0)):
-            for (l, l1) in zip(range(pool_size[1]), range(-pool_size[1], 0)):
-                for (m, m1) in zip(range(pool_size[2]), range(-pool_size[2], 0)):
-                    y.append(x[:,
-                               :,
-                               k:k1:strides[0],
-                               l:l1:strides[1],
-                               m:m1:strides[2]])
-    y = np.stack(y, axis=-1)
-    if pool_mode == 'avg':
-        y = np.mean(np.ma.masked_invalid(y), axis=-1).data
-    elif pool_mode == 'max':
-        y = np.max(y, axis=-1)
-
-    if data_format == 'channels_last':
-        if y.ndim == 3:
-            y = np.transpose(y, (0, 2, 1))
-        elif y.ndim == 4:
-            y = np.transpose(y, (0, 2, 3, 1))
-        else:
-            y = np.transpose(y, (0, 2, 3, 4, 1))
+        count = _pad_spatial(np.ones((1,) + x.shape[1:-1] + (1,), x.dtype),
+                             pool_size, strides, ones, padding)
+        count = np.sum(_windows(count, pool_size, strides, ones),
+                       axis=window_axes)
+        x = _pad_spatial(x, pool_size, strides, ones, padding)
+        y = np.sum(_windows(x, pool_size, strides, ones),
+                   axis=window_axes) / count
+    return _from_channels_last(y, data_format)
 
-    return y
 
+def pool2d(x, pool_size, strides=(1, 1), padding='valid',
+           data_format=None, pool_mode='max'):
+    return pool(x, pool_size, strides=strides, padding=padding,
+                data_format=data_format, pool_mode=pool_mode)
 
-pool2d = pool
-pool3d = pool
 
+def pool3d(x, pool_size, strides=(1, 1, 1), padding='valid',
+           data_format=None, pool_mode='max'):
+    return pool(x, pool_size, strides=strides, padding=padding,
+                data_format=data_format, pool_mode=pool_mode)
 
-def bias_add(x, y, data_format):
+
+def bias_add(x, y, data_format=None):
+    data_format = normalize_data_format(data_format)
     if data_format == 'channels_first':
         if y.ndim > 1:
             y = np.reshape(y, y.shape[::-1])
@@ -187,15 +662,59 @@ def bias_add(x, y, data_format):
 
 def rnn(step_function, inputs, initial_states,
         go_backwards=False, mask=None, constants=None,
-        unroll=False, input_length=None):
+        unroll=False, input_length=None, pos_extra_outputs_states=None):
+
+    if constants is None:
+        constants = []
+
+    if _has_tensor([inputs, initial_states, mask, constants, input_length]):
+        # Trace the step function once and loop over the traced graph
+        # when the returned tensors are evaluated.
+        step_inputs = _placeholder_like(inputs, [0] + list(range(2, ndim(inputs))))
+        step_states = [_placeholder_like(state) for state in initial_states]
+        output, new_states = step_function(step_inputs,
+                                           step_states + list(constants))
+        step = _Subgraph([step_inputs] + step_states, [output] + list(new_states))
+        results = NumpyTensor(_run_traced_rnn,
+                              (step, inputs, initial_states, go_backwards,
+                               mask, input_length, pos_extra_outputs_states,
+                               step.captured))
+        last_output = results[0]
+        last_output._uses_learning_phase = getattr(
+            output, '_uses_learning_phase', False)
+        states = [results[2][i] for i in range(len(new_states))]
+        return last_output, results[1], states
+
+    return _rnn(step_function, inputs, initial_states,
+                go_backwards=go_backwards, mask=mask, constants=constants,
+                input_length=input_length,
+                pos_extra_outputs_states=pos_extra_outputs_states)
+
+
+def _run_traced_rnn(step, inputs, initial_states, go_backwards, mask,
+                    input_length, pos_extra_outputs_states, captured):
+    num_states = len(initial_states)
+
+    def step_function(inputs_t, states_tm1):
+        values = step([inputs_t] + list(states_tm1[:num_states]), captured)
+        return values[0], values[1:]
+
+    return _rnn(step_function, inputs, initial_states,
+                go_backwards=go_backwards, mask=mask,
+                input_length=input_length,
+                pos_extra_outputs_states=pos_extra_outputs_states)
+
+
+def _rnn(step_function, inputs, initial_states,
+         go_backwards=False, mask=None, constants=None,
+         input_length=None, pos_extra_outputs_states=None):
 
     if constants is None:
         constants = []
 
-    output_sample, _ = step_function(inputs[:, 0], initial_states + constants)
     if mask is not None:
-        if mask.dtype != np.bool:
-            mask = mask.astype(np.bool)
+        if mask.dtype != bool:
+            mask = mask.astype(bool)
         if mask.shape != inputs.shape[:2]:
             raise ValueError(
                 'mask should have `shape=(samples, time)`, '
@@ -206,7 +725,6 @@ def rnn(step_function, inputs, initial_states,
             while mask_.ndim < x.ndim + 1:
                 mask_ = np.expand_dims(mask_, axis=-1)
             return mask_
-        output_mask = expand_mask(mask, output_sample)
         states_masks = [expand_mask(mask, state) for state in initial_states]
 
     if input_length is None:
@@ -217,23 +735,35 @@ def rnn(step_function, inputs, initial_states,
         time_index = time_index[::-1]
 
     outputs = []
+    # States at every timestep, stacked on a leading time axis,
+    # for the positions listed in `pos_extra_outputs_states`.
+    extra_states = defaultdict(list)
     states_tm1 = initial_states  # tm1 means "t minus one" as in "previous timestep"
-    output_tm1 = np.zeros(output_sample.shape)
+    output_tm1 = None
     for t in time_index:
-        output_t, states_t = step_function(inputs[:, t], states_tm1 + constants)
+        output_t, states_t = step_function(inputs[:, t],
+                                           list(states_tm1) + constants)
         if mask is not None:
+            if output_tm1 is None:
+                output_tm1 = np.zeros_like(output_t)
+                output_mask = expand_mask(mask, output_t)
             output_t = np.where(output_mask[:, t], output_t, output_tm1)
             states_t = [np.where(state_mask[:, t], state_t, state_tm1)
                         for state_mask, state_t, state_tm1
                         in zip(states_masks, states_t, states_tm1)]
         outputs.append(output_t)
+        for i in pos_extra_outputs_states or []:
+            extra_states[i].append(states_t[i])
         states_tm1 = states_t
         output_tm1 = output_t
 
-    return outputs[-1], np.stack(outputs, axis=1), states_tm1
+    states = [np.stack(extra_states[i], axis=0) if i in extra_states else state
+              for i, state in enumerate(states_tm1)]
+    return outputs[-1], np.stack(outputs, axis=1), states
 
 
-_LEARNING_PHASE = True
+# Inference-only backend: test phase by default.
+_LEARNING_PHASE = 0
 
 
 def learning_phase():
@@ -242,6 +772,9 @@ def learning_phase():
 
 def set_learning_phase(value):
     global _LEARNING_PHASE
+    if value not in {0, 1}:
+        raise ValueError('Expected learning phase to be '
+                         '0 or 1.')
     _LEARNING_PHASE = value
 
 
@@ -249,7 +782,14 @@ def in_train_phase(x, alt, training=None):
     if training is None:
         training = learning_phase()
 
-    if training is 1 or training is True:
+    if isinstance(training, NumpyTensor):
+        if callable(x):
+            x = x()
+        if callable(alt):
+            alt = alt()
+        return NumpyTensor(_select, (training, x, alt))
+
+    if training == 1 or training is True:
         if callable(x):
             return x()
         else:
@@ -261,6 +801,10 @@ def in_train_phase(x, alt, training=None):
             return alt
 
 
+def _select(condition, x, alt):
+    return x if condition else alt
+
+
 def in_test_phase(x, alt, training=None):
     return in_train_phase(alt, x, training=training)
 
@@ -311,11 +855,22 @@ def softmax(x, axis=-1):
     return y / np.sum(y, axis, keepdims=True)
 
 
+def softmax_3d(x):
+    if x.ndim not in (2, 3):
+        raise Exception('Cannot apply softmax to a tensor that is not 2D or 3D. ' +
+                        'Here, ndim=' + str(x.ndim))
+    return softmax(x, axis=-1)
+
+
 def l2_normalize(x, axis=-1):
     y = np.max(np.sum(x ** 2, axis, keepdims=True), axis, keepdims=True)
     return x / np.sqrt(y)
 
 
+def l1_normalize(x, axis):
+    return x / np.max(np.sum(np.abs(x), axis=axis, keepdims=True))
+
+
 def in_top_k(predictions, targets, k):
     top_k = np.argsort(-predictions)[:, :k]
     targets = targets.reshape(-1, 1)
@@ -330,13 +885,20 @@ def binary_crossentropy(target, output, from_logits=False):
             (1 - target) * -np.log(1 - sigmoid(output)))
 
 
-def categorical_crossentropy(target, output, from_logits=False):
+def categorical_crossentropy(target, output, from_logits=False, axis=-1):
     if from_logits:
-        output = softmax(output)
+        output = softmax(output, axis=axis)
     else:
-        output /= output.sum(axis=-1, keepdims=True)
+        output = output / output.sum(axis=axis, keepdims=True)
     output = np.clip(output, 1e-7, 1 - 1e-7)
-    return np.sum(target * -np.log(output), axis=-1, keepdims=False)
+    return np.sum(target * -np.log(output), axis=axis, keepdims=False)
+
+
+def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
+    output = np.moveaxis(output, axis, -1)
+    target = one_hot(np.reshape(target, output.shape[:-1]).astype('int64'),
+                     output.shape[-1])
+    return categorical_crossentropy(target, output, from_logits=from_logits)
 
 
 def max(x, axis=None, keepdims=False):
@@ -395,6 +957,18 @@ def cumprod(x, axis=0):
     return np.cumprod(x, axis=axis)
 
 
+def searchsorted(sorted_sequence, values, side='left'):
+    return np.searchsorted(sorted_sequence, values, side=side).astype('int32')
+
+
+def bincount(x, weights=None, minlength=0):
+    counts = np.bincount(np.asarray(x, dtype='int64'), weights=weights,
+                         minlength=minlength)
+    if weights is None:
+        return counts.astype('int32')
+    return counts.astype(weights.dtype)
+
+
 def any(x, axis=None, keepdims=False):
     if isinstance(axis, list):
         axis = tuple(axis)
@@ -417,8 +991,7 @@ def argmin(x, axis=-1):
 
 def sqrt(x):
     y = np.sqrt(x)
-    y[np.isnan(y)] = 0.
-    return y
+    return np.where(np.isnan(y), np.zeros_like(y), y)
 
 
 def pow(x, a=1.):
@@ -486,30 +1059,78 @@ def batch_flatten(x):
 
 
 def gather(reference, indices):
-    return reference[indices]
+    return np.take(reference, indices, axis=0)
 
 
 def eval(x):
-    return x
+    return _evaluate([x], {})[0]
 
 
 def get_value(x):
-    return x
+    return eval(x)
+
+
+def batch_get_value(ops):
+    return _evaluate(list(ops), {})
+
+
+def set_value(x, value):
+    if not sp.sparse.issparse(value):
+        value = np.array(value, dtype=x._value.dtype)
+    x._value = value
+
+
+def batch_set_value(tuples):
+    for x, value in tuples:
+        set_value(x, value)
 
 
 def count_params(x):
-    return x.size
+    return int(np.prod(int_shape(x)))
 
 
 def int_shape(x):
-    return x.shape
+    if hasattr(x, '_keras_shape'):
+        return x._keras_shape
+    if isinstance(x, NumpyTensor):
+        if x._value is not None:
+            return x._value.shape
+        return _infer_shape(x)
+    return np.shape(x)
 
 
 def get_variable_shape(x):
     return int_shape(x)
 
 
+def shape(x):
+    return np.array(np.shape(x))
+
+
+def size(x, name=None):
+    return np.size(x)
+
+
+def ndim(x):
+    if isinstance(x, NumpyTensor):
+        return len(int_shape(x))
+    return np.ndim(x)
+
+
 def dtype(x):
+    if isinstance(x, NumpyTensor):
+        if x._value is not None:
+            return x._value.dtype.name
+        if x._dtype is not None:
+            return np.dtype(x._dtype).name
+        for fill, cache in list(_PROBES.items())[:1] + list(
+                _BROADCAST_PROBES.items())[:1]:
+            try:
+                return np.asarray(
+                    _evaluate([x], cache, fill=fill)[0]).dtype.name
+            except Exception:
+                continue
+        return floatx()
     return x.dtype.name
 
 
@@ -518,9 +1139,40 @@ def constant(value, dtype=None, shape=None, name=None):
         dtype = floatx()
     if shape is None:
         shape = ()
-    np_value = value * np.ones(shape)
-    np_value.astype(dtype)
-    return np_value
+    np_value = np.asarray(value, dtype=dtype)
+    if np_value.ndim == 0:
+        np_value = np_value * np.ones(shape, dtype=dtype)
+    if shape and np_value.shape != tuple(shape):
+        np_value = np.reshape(np_value, shape)
+    const = NumpyTensor(value=np_value, name=name or 'constant')
+    const._keras_shape = np_value.shape
+    return const
+
+
+def cast(x, dtype):
+    if sp.sparse.issparse(x):
+        return x.astype(dtype)
+    return np.asarray(x).astype(dtype)
+
+
+def identity(x, name=None):
+    return x.copy()
+
+
+def update(x, new_x):
+    return (x, new_x)
+
+
+def update_add(x, increment):
+    return (x, x + increment)
+
+
+def update_sub(x, decrement):
+    return (x, x - decrement)
+
+
+def moving_average_update(x, value, momentum):
+    return (x, x * momentum + value * (1. - momentum))
 
 
 def print_tensor(x, message=''):
@@ -528,14 +1180,54 @@ def print_tensor(x, message=''):
     return x
 
 
+def normalize_batch_in_training(x, gamma, beta,
+                                reduction_axes, epsilon=1e-3):
+    reduction_axes = tuple(reduction_axes)
+    mean = np.mean(x, axis=reduction_axes, keepdims=True)
+    var = np.var(x, axis=reduction_axes, keepdims=True)
+    normed = batch_normalization(x, mean, var,
+                                 _broadcast_like(beta, mean),
+                                 _broadcast_like(gamma, mean),
+                                 epsilon=epsilon)
+    return (normed,
+            np.squeeze(mean, axis=reduction_axes),
+            np.squeeze(var, axis=reduction_axes))
+
+
+def _broadcast_like(x, target):
+    if x is None:
+        return None
+    return np.reshape(x, target.shape)
+
+
 def batch_normalization(x, mean, var, beta, gamma, axis=-1, epsilon=0.001):
-    return ((x - mean) / sqrt(var + epsilon)) * gamma + beta
+    y = (x - mean) / sqrt(var + epsilon)
+    if gamma is not None:
+        y = y * gamma
+    if beta is not None:
+        y = y + beta
+    return y
+
+
+def layer_normalization(x, gamma=None, beta=None, axis=-1, epsilon=1e-3):
+    if isinstance(axis, int):
+        axis = (axis,)
+    axis = tuple(axis)
+    mean = np.mean(x, axis=axis, keepdims=True)
+    var = np.var(x, axis=axis, keepdims=True)
+    return batch_normalization(x, mean, var, beta, gamma, epsilon=epsilon)
 
 
 def dot(x, y):
+    if sp.sparse.issparse(x):
+        return x.dot(y)
     return np.dot(x, y)
 
 
+def dot_product(x, kernel):
+    return dot(x, kernel)
+
+
 def batch_dot(x, y, axes=None):
     if x.ndim < 2 or y.ndim < 2:
         raise ValueError('Batch dot requires inputs of rank 2 or more.')
@@ -577,11 +1269,17 @@ def batch_dot(x, y, axes=None):
                          ' with axes=' + str(axes) + '. x.shape[%d] != '
                          'y.shape[%d] (%d != %d).' % (axes[0], axes[1], d1, d2))
 
-    result = []
-    axes = [axes[0] - 1, axes[1] - 1]  # ignore batch dimension
-    for xi, yi in zip(x, y):
-        result.append(np.tensordot(xi, yi, axes))
-    result = np.array(result)
+    # One subscript per axis: the batch axis and the reduced axis are shared,
+    # the output keeps the other axes of `x` followed by those of `y`.
+    x_subscripts = [chr(ord('c') + i) for i in range(x.ndim)]
+    y_subscripts = [chr(ord('c') + x.ndim + i) for i in range(y.ndim)]
+    x_subscripts[0] = y_subscripts[0] = 'a'
+    x_subscripts[axes[0]] = y_subscripts[axes[1]] = 'b'
+    out_subscripts = ['a'] + [s for s in x_subscripts[1:] + y_subscripts[1:]
+                              if s != 'b']
+    result = np.einsum('%s,%s->%s' % (''.join(x_subscripts),
+                                      ''.join(y_subscripts),
+                                      ''.join(out_subscripts)), x, y)
 
     if result.ndim == 1:
         result = np.expand_dims(result, -1)
@@ -599,32 +1297,92 @@ def reverse(x, axes):
     return np.flip(x, axes)
 
 
-py_slice = slice
-
-
 def slice(x, start, size):
     slices = [py_slice(i, i + j) for i, j in zip(start, size)]
     return x[tuple(slices)]
 
 
 def variable(value, dtype=None, name=None, constraint=None):
-    if constraint is not None:
-        raise TypeError("Constraint must be None when "
-                        "using the NumPy backend.")
-    return np.array(value, dtype)
+    if dtype is None:
+        dtype = floatx()
+    if isinstance(value, NumpyTensor):
+        value = eval(value)
+    if sp.sparse.issparse(value):
+        value = value.astype(dtype)
+    else:
+        value = np.array(value, dtype)
+    x = NumpyTensor(value=value, name=name or 'variable')
+    x._keras_shape = value.shape
+    x.constraint = constraint
+    return x
+
+
+def gradients(loss, variables):
+    raise NotImplementedError('The NumPy backend is inference-only '
+                              'and does not compute gradients.')
+
+
+def stop_gradient(variables):
+    return variables
+
+
+class Function(object):
+    """Runs the computation of `outputs` from the values fed to `inputs`.
+
+    # Arguments
+        inputs: List of placeholders.
+        outputs: List of output tensors.
+        updates: List of update tuples `(variable, new_value)`,
+            applied after the outputs are computed.
+        name: A name to help users identify what this function does.
+    """
+
+    def __init__(self, inputs, outputs, updates=None, name=None):
+        if updates is None:
+            updates = []
+        if not isinstance(updates, (list, tuple)):
+            raise TypeError('`updates` in a Keras backend function '
+                            'should be a list or tuple.')
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.updates = [tuple(update) for update in updates]
+        self.name = name
+
+    def __call__(self, inputs):
+        if not isinstance(inputs, (list, tuple)):
+            raise TypeError('`inputs` should be a list or tuple.')
+        feed = {}
+        for tensor, value in zip(self.inputs, inputs):
+            if not sp.sparse.issparse(value):
+                value = np.asarray(value, dtype=getattr(tensor, '_dtype', None))
+            feed[tensor] = value
+        new_values = [new_x for _, new_x in self.updates]
+        values = _evaluate(self.outputs + new_values, feed)
+        for (x, _), new_value in zip(self.updates, values[len(self.outputs):]):
+            set_value(x, new_value)
+        return values[:len(self.outputs)]
+
+
+def function(inputs, outputs, updates=None, **kwargs):
+    for key in kwargs:
+        if key != 'name':
+            raise ValueError('Invalid argument "%s" passed to K.function '
+                             'with NumPy backend' % key)
+    return Function(inputs, outputs, updates=updates, **kwargs)
 
 
 def dropout(x, level, noise_shape=None, seed=None):
+    if level < 0. or level >= 1:
+        raise ValueError('Dropout level must be in interval [0, 1[.')
     if noise_shape is None:
         noise_shape = x.shape
-    if learning_phase():
-        noise = np.random.choice([0, 1],
-                                 noise_shape,
-                                 replace=True,
-                                 p=[level, 1 - level])
-        return x * noise / (1 - level)
-    else:
-        return x
+    if seed is not None:
+        np.random.seed(seed)
+    noise = np.random.choice([0, 1],
+                             noise_shape,
+                             replace=True,
+                             p=[level, 1 - level])
+    return x * noise / (1 - level)
 
 
 def equal(x, y):
@@ -659,40 +1417,77 @@ def minimum(x, y):
     return np.minimum(x, y)
 
 
-def ndim(x):
-    return x.ndim
-
-
 def random_uniform_variable(shape, low, high, dtype=None, name=None, seed=None):
-    return (high - low) * np.random.random(shape).astype(dtype) + low
+    return variable(random_uniform(shape, low, high, dtype=dtype, seed=seed),
+                    dtype=dtype, name=name)
 
 
 def random_normal_variable(shape, mean, scale, dtype=None, name=None, seed=None):
-    return scale * np.random.randn(*shape).astype(dtype) + mean
+    return variable(random_normal(shape, mean, scale, dtype=dtype, seed=seed),
+                    dtype=dtype, name=name)
+
+
+def random_uniform(shape, minval=0.0, maxval=1.0, dtype=None, seed=None):
+    if dtype is None:
+        dtype = floatx()
+    rng = np.random.RandomState(seed)
+    return rng.uniform(minval, maxval, size=tuple(shape)).astype(dtype)
+
+
+def random_normal(shape, mean=0.0, stddev=1.0, dtype=None, seed=None):
+    if dtype is None:
+        dtype = floatx()
+    rng = np.random.RandomState(seed)
+    return rng.normal(mean, stddev, size=tuple(shape)).astype(dtype)
+
+
+def random_binomial(shape, p=0.0, dtype=None, seed=None):
+    if dtype is None:
+        dtype = floatx()
+    rng = np.random.RandomState(seed)
+    return (rng.uniform(size=tuple(shape)) <= p).astype(dtype)
 
 
-def zeros(shape, dtype=floatx(), name=None):
-    return np.zeros(shape, dtype=dtype)
+def truncated_normal(shape, mean=0.0, stddev=1.0, dtype=None, seed=None):
+    if dtype is None:
+        dtype = floatx()
+    return sp.stats.truncnorm.rvs(-2., 2., loc=mean, scale=stddev,
+                                  size=tuple(shape),
+                                  random_state=seed).astype(dtype)
+
+
+def zeros(shape, dtype=None, name=None):
+    if dtype is None:
+        dtype = floatx()
+    if _has_tensor(shape):
+        return NumpyTensor(np.zeros, (shape, dtype))
+    return variable(np.zeros(shape, dtype=dtype), dtype=dtype, name=name)
 
 
-def zeros_like(x, dtype=floatx(), name=None):
+def zeros_like(x, dtype=None, name=None):
     return np.zeros_like(x, dtype=dtype)
 
 
-def ones(shape, dtype=floatx(), name=None):
-    return np.ones(shape, dtype=dtype)
+def ones(shape, dtype=None, name=None):
+    if dtype is None:
+        dtype = floatx()
+    if _has_tensor(shape):
+        return NumpyTensor(np.ones, (shape, dtype))
+    return variable(np.ones(shape, dtype=dtype), dtype=dtype, name=name)
 
 
-def ones_like(x, dtype=floatx(), name=None):
+def ones_like(x, dtype=None, name=None):
     return np.ones_like(x, dtype=dtype)
 
 
 def eye(size, dtype=None, name=None):
+    if dtype is None:
+        dtype = floatx()
     if isinstance(size, (list, tuple)):
         n, m = size
     else:
         n, m = size, size
-    return np.eye(n, m, dtype=dtype)
+    return variable(np.eye(n, m, dtype=dtype), dtype=dtype, name=name)
 
 
 def resize_images(x, height_factor, width_factor, data_format):
@@ -723,46 +1518,312 @@ def one_hot(indices, num_classes):
 
 def ctc_decode(y_pred, input_length, greedy=True, beam_width=100, top_paths=1,
                merge_repeated=False):
-    num_samples = y_pred.shape[0]
-    num_classes = y_pred.shape[-1]
-    log_prob = np.zeros((num_samples, 1))
-    decoded_dense = -np.ones_like(y_pred[..., 0])
-    decoded_length = np.zeros((num_samples,), dtype=np.int)
-    if greedy:
-        for i in range(num_samples):
-            prob = y_pred[i]
-            length = input_length[i]
-            decoded = np.argmax(prob[:length], axis=-1)
-            log_prob[i] = -np.sum(np.log(prob[np.arange(length), decoded]))
-            decoded = _remove_repeats(decoded)
-            decoded = _remove_blanks(decoded, num_classes)
-            decoded_length[i] = len(decoded)
-            decoded_dense[i, :len(decoded)] = decoded
-        return decoded_dense[:, :np.max(decoded_length)], log_prob
-    else:
-        raise NotImplementedError
+    num_samples, num_steps, num_classes = y_pred.shape
+    input_length = np.asarray(input_length).astype(int).reshape((-1,))
+    if not greedy:
+        return _ctc_beam_search(y_pred, input_length, beam_width, top_paths,
+                                merge_repeated)
+    # Best path of the whole padded batch at once.
+    in_sequence = np.arange(num_steps) < input_length[:, None]
+    decoded = np.argmax(y_pred, axis=-1)
+    best_prob = np.max(y_pred, axis=-1)
+    log_prob = -np.sum(np.log(np.where(in_sequence, best_prob, 1.)),
+                       axis=1, keepdims=True)
+    # Collapse repeats, then remove blanks (the last class).
+    keep = in_sequence & (decoded < num_classes - 1)
+    keep[:, 1:] &= decoded[:, 1:] != decoded[:, :-1]
+    decoded_length = np.sum(keep, axis=1)
+    decoded_dense = -np.ones((num_samples, np.max(decoded_length)),
+                             dtype=y_pred.dtype)
+    rows, _ = np.nonzero(keep)
+    positions = np.cumsum(keep, axis=1)[keep] - 1
+    decoded_dense[rows, positions] = decoded[keep]
+    return decoded_dense, log_prob
+
+
+def _ctc_beam_search(y_pred, input_length, beam_width, top_paths,
+                     merge_repeated):
+    """Prefix beam search over the softmax outputs `y_pred`.
+
+    Like the TensorFlow decoder, the inputs are renormalized in log space
+    and the log probabilities of the `top_paths` most probable labelings
+    (summed over all their alignments) are returned. At each timestep,
+    all the extensions of all the beams are scored at once.
+    """
+    num_samples, _, num_classes = y_pred.shape
+    blank = num_classes - 1
+    log_y = np.log(y_pred.astype('float64') + epsilon())
+    log_y -= scipy.special.logsumexp(log_y, axis=-1, keepdims=True)
+    paths = [[] for _ in range(top_paths)]
+    log_prob = np.full((num_samples, top_paths), -np.inf)
+    for i in range(num_samples):
+        # Log probabilities of the alignments of each prefix
+        # ending with a blank and with a label.
+        prefixes = [()]
+        p_blank = np.zeros(1)
+        p_label = np.full(1, -np.inf)
+        for log_p in log_y[i, :input_length[i]]:
+            index = dict((prefix, j) for j, prefix in enumerate(prefixes))
+            last = np.array([prefix[-1] if prefix else blank
+                             for prefix in prefixes])
+            has_last = last != blank
+            p_total = np.logaddexp(p_blank, p_label)
+            # Scores of all the one label extensions of all the prefixes.
+            # Repeating the last label only extends alignments ending
+            # with a blank.
+            extensions = p_total[:, None] + log_p[None, :]
+            rows = np.nonzero(has_last)[0]
+            extensions[rows, last[rows]] = p_blank[rows] + log_p[last[rows]]
+            extensions[:, blank] = -np.inf
+            new_blank = p_total + log_p[blank]
+            new_label = np.where(has_last, p_label + log_p[last], -np.inf)
+            # Extensions which are already prefixes of the beam
+            # are merged into them.
+            for j, prefix in enumerate(prefixes):
+                parent = index.get(prefix[:-1]) if prefix else None
+                if parent is not None:
+                    new_label[j] = np.logaddexp(new_label[j],
+                                                extensions[parent, prefix[-1]])
+                    extensions[parent, prefix[-1]] = -np.inf
+            extensions = extensions.ravel()
+            if beam_width < extensions.size:
+                best = np.argpartition(-extensions, beam_width)[:beam_width]
+            else:
+                best = np.arange(extensions.size)
+            best = best[extensions[best] > -np.inf]
+            prefixes = prefixes + [prefixes[j // num_classes] +
+                                   (int(j % num_classes),) for j in best]
+            p_blank = np.concatenate([new_blank, np.full(len(best), -np.inf)])
+            p_label = np.concatenate([new_label, extensions[best]])
+            # Prune the beam.
+            scores = np.logaddexp(p_blank, p_label)
+            order = np.argsort(-scores, kind='mergesort')[:beam_width]
+            prefixes = [prefixes[j] for j in order]
+            p_blank = p_blank[order]
+            p_label = p_label[order]
+        scores = np.logaddexp(p_blank, p_label)
+        order = np.argsort(-scores, kind='mergesort')
+        for k in range(top_paths):
+            if k >= len(order):
+                paths[k].append(())
+                continue
+            prefix = prefixes[order[k]]
+            log_prob[i, k] = scores[order[k]]
+            if merge_repeated:
+                prefix = [x for j, x in enumerate(prefix)
+                          if j == 0 or x != prefix[j - 1]]
+            paths[k].append(prefix)
+    decoded_dense = []
+    for decoded in paths:
+        dense = -np.ones((num_samples, np.max([len(x) for x in decoded])),
+                         dtype='int64')
+        for i, x in enumerate(decoded):
+            dense[i, :len(x)] = x
+        decoded_dense.append(dense)
+    return decoded_dense, log_prob
 
 
-def _remove_repeats(inds):
-    is_not_repeat = np.insert(np.diff(inds).astype(np.bool), 0, True)
-    return inds[is_not_repeat]
+def stack(x, axis=0):
+    return np.stack(x, axis=axis)
 
 
-def _remove_blanks(inds, num_classes):
-    return inds[inds < (num_classes - 1)]
+def expand_dims(x, axis=-1):
+    return np.expand_dims(x, axis)
 
 
-def stack(x, axis=0):
-    return np.stack(x, axis=axis)
+def squeeze(x, axis):
+    return np.squeeze(x, axis)
 
 
-square = np.square
-abs = np.abs
-exp = np.exp
-log = np.log
-round = np.round
-sign = np.sign
-expand_dims = np.expand_dims
-squeeze = np.squeeze
-cos = np.cos
-sin = np.sin
+def tril(x):
+    return np.tril(x)
+
+
+def repeatRdim(x, n, axis=1):
+    return np.repeat(np.expand_dims(x, axis), n, axis=axis)
+
+
+def equal_dimensions(x, y):
+    if x.shape[2:4] == y.shape[2:4]:
+        return y
+    return funequal(x, y)
+
+
+def funequal(x, y):
+    # Zero-pads the spatial dimensions of `y` to those of `x`.
+    new_y = np.zeros(y.shape[:2] + x.shape[2:4], dtype=y.dtype)
+    new_y[:, :, :y.shape[2], :y.shape[3]] = y
+    return new_y
+
+
+def fft(x, norm=None):
+    return np.fft.fft(x, norm=norm)
+
+
+def ifft(x, norm=None, is_odd=False):
+    return np.fft.ifft(x, norm=norm)
+
+
+def real(x):
+    return np.real(x)
+
+
+def count_sketch(h, s, x, d=16000):
+    # Projects `x` with the sparse (input_dim, d) matrix holding `s[i]`
+    # at row `i` and column `h[i]`.
+    sketch = sp.sparse.csr_matrix((s, (np.arange(len(h)), h)),
+                                  shape=(len(h), d), dtype=x.dtype)
+    return np.asarray((sketch.T.dot(x.T)).T)
+
+
+def scan_conv1d(u, v):
+    # Row-wise "same" convolution of `u` and `v`, computed with real FFTs.
+    n = u.shape[1]
+    fft_length = sp.fftpack.next_fast_len(2 * n - 1)
+    conv_out = np.fft.irfft(np.fft.rfft(u, fft_length) *
+                            np.fft.rfft(v, fft_length), fft_length)
+    return conv_out[:, n // 2:n // 2 + n].astype(u.dtype)
+
+
+def map_fn(fn, elems, name=None, dtype=None):
+    if _has_tensor(elems):
+        elem = _placeholder_like(elems, list(range(1, ndim(elems))))
+        body = _Subgraph([elem], [fn(elem)])
+        return NumpyTensor(_run_traced_map, (body, elems, dtype, body.captured))
+    return np.stack([fn(x) for x in elems]).astype(dtype or elems.dtype)
+
+
+def _run_traced_map(body, elems, dtype, captured):
+    return map_fn(lambda x: body([x], captured)[0], elems, dtype=dtype)
+
+
+def foldl(fn, elems, initializer=None, name=None):
+    if initializer is None:
+        initializer = elems[0]
+        elems = elems[1:]
+    if _has_tensor([elems, initializer]):
+        acc = _placeholder_like(initializer)
+        elem = _placeholder_like(elems, list(range(1, ndim(elems))))
+        body = _Subgraph([acc, elem], [fn(acc, elem)])
+        return NumpyTensor(_run_traced_fold,
+                           (body, elems, initializer, False, body.captured))
+    acc = initializer
+    for x in elems:
+        acc = fn(acc, x)
+    return acc
+
+
+def foldr(fn, elems, initializer=None, name=None):
+    if initializer is None:
+        initializer = elems[-1]
+        elems = elems[:-1]
+    if _has_tensor([elems, initializer]):
+        acc = _placeholder_like(initializer)
+        elem = _placeholder_like(elems, list(range(1, ndim(elems))))
+        body = _Subgraph([acc, elem], [fn(acc, elem)])
+        return NumpyTensor(_run_traced_fold,
+                           (body, elems, initializer, True, body.captured))
+    acc = initializer
+    for x in elems[::-1]:
+        acc = fn(acc, x)
+    return acc
+
+
+def _run_traced_fold(body, elems, initializer, reverse, captured):
+    acc = initializer
+    for x in (elems[::-1] if reverse else elems):
+        acc = body([acc, x], captured)[0]
+    return acc
+
+
+def local_conv1d(inputs, kernel, kernel_size, strides, data_format=None):
+    stride = strides[0]
+    output_length, feature_dim, filters = kernel.shape
+    # One strided slice per kernel offset, ordered as (kernel_size, channels).
+    stop = stride * (output_length - 1) + 1
+    xs = [inputs[:, i:i + stop:stride, :] for i in range(kernel_size[0])]
+    x = np.reshape(np.stack(xs, axis=2), (-1, output_length, feature_dim))
+    output = np.matmul(np.transpose(x, (1, 0, 2)), kernel)
+    return np.transpose(output, (1, 0, 2))
+
+
+def local_conv2d(inputs, kernel, kernel_size, strides, output_shape,
+                 data_format=None):
+    data_format = normalize_data_format(data_format)
+    stride_row, stride_col = strides
+    output_row, output_col = output_shape
+    _, feature_dim, filters = kernel.shape
+    stop_row = stride_row * (output_row - 1) + 1
+    stop_col = stride_col * (output_col - 1) + 1
+    xs = []
+    for i in range(kernel_size[0]):
+        for j in range(kernel_size[1]):
+            slice_row = py_slice(i, i + stop_row, stride_row)
+            slice_col = py_slice(j, j + stop_col, stride_col)
+            if data_format == 'channels_first':
+                xs.append(inputs[:, :, slice_row, slice_col])
+            else:
+                xs.append(inputs[:, slice_row, slice_col, :])
+    if data_format == 'channels_first':
+        # Patches are ordered as (channels, kernel_rows, kernel_cols).
+        x = np.transpose(np.stack(xs, axis=2), (0, 3, 4, 1, 2))
+    else:
+        # Patches are ordered as (kernel_rows, kernel_cols, channels).
+        x = np.stack(xs, axis=3)
+    x = np.reshape(x, (-1, output_row * output_col, feature_dim))
+    output = np.matmul(np.transpose(x, (1, 0, 2)), kernel)
+    output = np.reshape(output, (output_row, output_col, -1, filters))
+    if data_format == 'channels_first':
+        return np.transpose(output, (2, 3, 0, 1))
+    return np.transpose(output, (2, 0, 1, 3))
+
+
+def ctc_label_dense_to_sparse(labels, label_lengths):
+    raise NotImplementedError('The NumPy backend does not support '
+                              '`ctc_label_dense_to_sparse`.')
+
+
+def ctc_batch_cost(y_true, y_pred, input_length, label_length):
+    raise NotImplementedError('The NumPy backend does not support '
+                              '`ctc_batch_cost`.')
+
+
+square = _graph_op(np.square)
+abs = _graph_op(np.abs)
+exp = _graph_op(np.exp)
+log = _graph_op(np.log)
+log2 = _graph_op(np.log2)
+round = _graph_op(np.round)
+sign = _graph_op(np.sign)
+ceil = _graph_op(np.ceil)
+floor = _graph_op(np.floor)
+cos = _graph_op(np.cos)
+sin = _graph_op(np.sin)
+
+
+# Functions that create or inspect graph nodes themselves
+# rather than operating on values.
+_NOT_GRAPH_OPS = {
+    'get_uid', 'reset_uids', 'clear_session', 'name_scope',
+    'control_dependencies', 'is_sparse', 'is_tensor', 'is_keras_tensor',
+    'is_variable', 'is_placeholder', 'placeholder', 'variable', 'constant',
+    'eval', 'get_value', 'batch_get_value', 'set_value', 'batch_set_value',
+    'count_params', 'int_shape', 'get_variable_shape', 'ndim', 'dtype',
+    'update', 'update_add', 'update_sub', 'moving_average_update',
+    'gradients', 'stop_gradient', 'function', 'rnn', 'learning_phase',
+    'set_learning_phase', 'in_train_phase', 'in_test_phase',
+    'random_uniform_variable', 'random_normal_variable',
+    'zeros', 'ones', 'eye', 'map_fn', 'foldl', 'foldr',
+    'normalize_batch_in_training', 'ctc_decode',
+    'ctc_label_dense_to_sparse', 'ctc_batch_cost',
+}
+
+for _name, _func in list(globals().items()):
+    if _name.startswith('_') or _name in _NOT_GRAPH_OPS:
+        continue
+    if inspect.isfunction(_func) and _func.__module__ == __name__:
+        globals()[_name] = _graph_op(_func)
+
+normalize_batch_in_training = _multi_output_graph_op(3)(
+    normalize_batch_in_training)
+ctc_decode = _multi_output_graph_op(2)(ctc_decode)
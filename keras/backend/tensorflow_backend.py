@@ -1716,6 +1716,47 @@ def cumprod(x, axis=0):
     return tf.cumprod(x, axis=axis)
 
 
+def searchsorted(sorted_sequence, values, side='left'):
+    """Finds the indices where values would be inserted in a sorted sequence.
+
+    # Arguments
+        sorted_sequence: 1D tensor, sorted in increasing order.
+        values: A tensor of values to look up.
+        side: `'left'` or `'right'`. With `'left'`, the index of a value
+            is the number of elements of `sorted_sequence` strictly smaller
+            than it. With `'right'`, it is the number of elements smaller
+            than or equal to it.
+
+    # Returns
+        An `int32` tensor with the shape of `values`.
+    {{np_implementation}}
+    """
+    values = tf.convert_to_tensor(values)
+    indices = tf.searchsorted(sorted_sequence, tf.reshape(values, [-1]),
+                              side=side, out_type=tf.int32)
+    return tf.reshape(indices, tf.shape(values))
+
+
+def bincount(x, weights=None, minlength=0):
+    """Counts the occurrences of each value in an integer tensor.
+
+    # Arguments
+        x: 1D tensor of non-negative integers.
+        weights: Optional 1D tensor with the shape of `x`. If given, the
+            weights of the occurrences of each value are summed instead
+            of counted.
+        minlength: Minimum length of the output.
+
+    # Returns
+        A 1D tensor of length `max(max(x) + 1, minlength)`, with the dtype
+        of `weights`, or `int32` if `weights` is `None`.
+    {{np_implementation}}
+    """
+    dtype = tf.int32 if weights is None else weights.dtype
+    return tf.bincount(tf.cast(x, tf.int32), weights=weights,
+                       minlength=minlength, dtype=dtype)
+
+
 def var(x, axis=None, keepdims=False):
     """Variance of a tensor, alongside the specified axis.
 
@@ -2375,6 +2416,65 @@ def batch_normalization(x, mean, var, beta, gamma, axis=-1, epsilon=1e-3):
     return tf.nn.batch_normalization(x, mean, var, beta, gamma, epsilon)
 
 
+def layer_normalization(x, gamma=None, beta=None, axis=-1, epsilon=1e-3):
+    """Normalizes `x` over `axis`, independently for every sample.
+
+    I.e. returns:
+    `output = (x - mean(x)) / sqrt(var(x) + epsilon) * gamma + beta`
+    where the mean and the variance are computed over `axis`.
+
+    The mean and the variance are computed in a single pass over `x`
+    (shifted by one of its values per sample, for numerical stability),
+    and the gradient with respect to `x` is computed in closed form,
+    with two reductions of the incoming gradient.
+
+    # Arguments
+        x: Input tensor or variable.
+        gamma: Tensor by which to scale the normalized input
+            (broadcastable to the shape of `x`), or `None`.
+        beta: Tensor with which to center the normalized input
+            (broadcastable to the shape of `x`), or `None`.
+        axis: Integer or list of integers, the axes to normalize over
+            (typically the features axis).
+        epsilon: Fuzz factor.
+
+    # Returns
+        A tensor.
+    """
+    if isinstance(axis, int):
+        axis = [axis]
+    x_ndim = ndim(x)
+    axis = [a % x_ndim for a in axis]
+    index = [slice(None)] * x_ndim
+    for a in axis:
+        index[a] = slice(0, 1)
+
+    @tf.custom_gradient
+    def normalize(x):
+        shift = tf.stop_gradient(x[tuple(index)])
+        counts, mean_ss, variance_ss, _ = tf.nn.sufficient_statistics(
+            x, axis, shift=shift, keep_dims=True)
+        mean, variance = tf.nn.normalize_moments(
+            counts, mean_ss, variance_ss, shift)
+        inv = tf.rsqrt(tf.maximum(variance, 0.) + epsilon)
+        normalized = (x - mean) * inv
+
+        def grad(dy):
+            mean_dy = tf.reduce_mean(dy, axis, keepdims=True)
+            mean_dy_normalized = tf.reduce_mean(dy * normalized, axis,
+                                                keepdims=True)
+            return inv * (dy - mean_dy - normalized * mean_dy_normalized)
+
+        return normalized, grad
+
+    output = normalize(x)
+    if gamma is not None:
+        output *= gamma
+    if beta is not None:
+        output += beta
+    return output
+
+
 # SHAPE OPERATIONS
 
 def concatenate(tensors, axis=-1):
@@ -4854,29 +4954,23 @@ def count_sketch(h, s, x, d=16000):
     """Count sketch operator.
     See https://arxiv.org/abs/1606.01847.
 
+    Every input feature `i` is added, multiplied by `s[i]`, to the output
+    feature `h[i]`. This is computed as a single scatter-add over the
+    features of the batch.
+
     # Arguments
         h: Count sketch vector h \in \{1, d\} ^n
         s: Count sketch vector s \in \{-1, 1\} ^n
-        x: Count sketch input vector
+        x: Count sketch input vector, of shape `(batch_size, n)`.
         d: Compact Bilinear dimension
-    """
-    print('count_sketch is not implemented in the tensorflow backend')
-    pass
-
-
-def __count_sketch(h, s, v,  # Sequences
-                   y,  # Outputs info
-                   ):
-    """Count sketch utility.
-    See https://arxiv.org/abs/1606.01847.
 
-    # Arguments
-        h: Count sketch vector h \in \{1, d\} ^n
-        s: Count sketch vector s \in \{-1, 1\} ^n
-        v: Count sketch input vector
-        y: Projected output vector
+    # Returns
+        A tensor of shape `(batch_size, d)`.
     """
-    pass
+    signed_x = x * tf.cast(s, x.dtype)
+    y = tf.unsorted_segment_sum(tf.transpose(signed_x),
+                                tf.cast(h, 'int32'), d)
+    return tf.transpose(y)
 
 
 # 1d Convolution
@@ -4884,12 +4978,32 @@ def scan_conv1d(u, v):
     """1D convolution over a set of vectors. All inputs will be treated by pairs.
         #x must be equal to #kernel
 
+    The convolution of each pair of rows is computed as the product of their
+    real FFTs, zero-padded to avoid the wrap-around of circular convolution,
+    and cut to the central `n` values (`'same'` convolution).
+
     # Arguments
-        u: first set of vectors
-        v: second set of vectors
+        u: first set of vectors, of shape `(batch_size, n)`.
+        v: second set of vectors, of shape `(batch_size, n)`.
+
+    # Returns
+        A tensor of shape `(batch_size, n)`.
     """
-    print('scan_conv1d is not implemented in the tensorflow backend')
-    pass
+    n = int_shape(u)[1]
+    if n is None:
+        n = tf.shape(u)[1]
+        fft_length = tf.reshape(2 * n - 1, [1])
+    else:
+        # Any length >= 2 * n - 1 gives the same result; powers of two
+        # are the fastest.
+        fft_length = [2 ** int(np.ceil(np.log2(2 * n - 1)))]
+    dtype = u.dtype
+    if dtype != tf.float32:
+        u = tf.cast(u, tf.float32)
+        v = tf.cast(v, tf.float32)
+    conv_out = tf.spectral.irfft(tf.spectral.rfft(u, fft_length) *
+                                 tf.spectral.rfft(v, fft_length), fft_length)
+    return tf.cast(conv_out[:, n // 2:n // 2 + n], dtype)
 
 
 # CTC
@@ -5109,13 +5223,15 @@ def local_conv1d(inputs, kernel, kernel_size, strides, data_format=None):
     kernel_shape = int_shape(kernel)
     output_length, feature_dim, filters = kernel_shape
 
-    xs = []
-    for i in range(output_length):
-        slice_length = py_slice(i * stride,
-                                i * stride + kernel_size[0])
-        xs.append(reshape(inputs[:, slice_length, :],
-                          (1, -1, feature_dim)))
-    x_aggregate = concatenate(xs, axis=0)
+    # Extract all the patches with a single op, as rows of an image.
+    # Shape: `(batch_size, 1, output_length, kernel_size * input_dim)`.
+    patches = tf.extract_image_patches(tf.expand_dims(inputs, 1),
+                                       ksizes=(1, 1, kernel_size[0], 1),
+                                       strides=(1, 1, stride, 1),
+                                       rates=(1, 1, 1, 1),
+                                       padding='VALID')
+    x_aggregate = reshape(patches, (-1, output_length, feature_dim))
+    x_aggregate = permute_dimensions(x_aggregate, (1, 0, 2))
     # Shape: `(output_length, batch_size, filters)`.
     output = batch_dot(x_aggregate, kernel)
     return permute_dimensions(output, (1, 0, 2))
@@ -5164,21 +5280,25 @@ def local_conv2d(inputs,
     kernel_shape = int_shape(kernel)
     _, feature_dim, filters = kernel_shape
 
-    xs = []
-    for i in range(output_row):
-        for j in range(output_col):
-            slice_row = py_slice(i * stride_row,
-                                 i * stride_row + kernel_size[0])
-            slice_col = py_slice(j * stride_col,
-                                 j * stride_col + kernel_size[1])
-            if data_format == 'channels_first':
-                xs.append(reshape(inputs[:, :, slice_row, slice_col],
-                                  (1, -1, feature_dim)))
-            else:
-                xs.append(reshape(inputs[:, slice_row, slice_col, :],
-                                  (1, -1, feature_dim)))
-
-    x_aggregate = concatenate(xs, axis=0)
+    if data_format == 'channels_first':
+        inputs = tf.transpose(inputs, (0, 2, 3, 1))
+    # Extract all the patches with a single op.
+    # Shape: `(batch_size, output_row, output_col,
+    # kernel_rows * kernel_cols * channels)`.
+    patches = tf.extract_image_patches(inputs,
+                                       ksizes=(1,) + tuple(kernel_size) + (1,),
+                                       strides=(1, stride_row, stride_col, 1),
+                                       rates=(1, 1, 1, 1),
+                                       padding='VALID')
+    if data_format == 'channels_first':
+        # The kernel expects the features ordered as
+        # (channels, kernel_rows, kernel_cols).
+        patches = reshape(patches, (-1, output_row * output_col,
+                                    kernel_size[0] * kernel_size[1],
+                                    feature_dim // (kernel_size[0] * kernel_size[1])))
+        patches = permute_dimensions(patches, (0, 1, 3, 2))
+    x_aggregate = reshape(patches, (-1, output_row * output_col, feature_dim))
+    x_aggregate = permute_dimensions(x_aggregate, (1, 0, 2))
     output = batch_dot(x_aggregate, kernel)
     output = reshape(output,
                      (output_row, output_col, -1, filters))
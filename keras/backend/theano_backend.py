@@ -4,13 +4,13 @@ from __future__ import print_function
 
 from collections import defaultdict
 from contextlib import contextmanager
+import hashlib
 import theano
 from theano import tensor as T
 from theano.sandbox.rng_mrg import MRG_RandomStreams as RandomStreams
 from theano.tensor.signal import pool
 from theano.tensor.fft import rfft, irfft
 from theano.printing import Print
-from theano.tensor.signal.conv import conv2d as vec_conv
 from theano.ifelse import ifelse
 
 try:
@@ -23,6 +23,7 @@ except ImportError:
     from theano.sandbox.softsign import softsign as T_softsign
 
 import numpy as np
+from six.moves import cPickle as pickle
 from .common import floatx
 from .common import epsilon
 from .common import normalize_data_format
@@ -1179,6 +1180,44 @@ def cumprod(x, axis=0):
     return T.extra_ops.cumprod(x, axis=axis)
 
 
+def searchsorted(sorted_sequence, values, side='left'):
+    """Finds the indices where values would be inserted in a sorted sequence.
+
+    # Arguments
+        sorted_sequence: 1D tensor, sorted in increasing order.
+        values: A tensor of values to look up.
+        side: `'left'` or `'right'`. With `'left'`, the index of a value
+            is the number of elements of `sorted_sequence` strictly smaller
+            than it. With `'right'`, it is the number of elements smaller
+            than or equal to it.
+
+    # Returns
+        An `int32` tensor with the shape of `values`.
+    """
+    indices = T.extra_ops.searchsorted(sorted_sequence, values, side=side)
+    return T.cast(indices, 'int32')
+
+
+def bincount(x, weights=None, minlength=0):
+    """Counts the occurrences of each value in an integer tensor.
+
+    # Arguments
+        x: 1D tensor of non-negative integers.
+        weights: Optional 1D tensor with the shape of `x`. If given, the
+            weights of the occurrences of each value are summed instead
+            of counted.
+        minlength: Minimum length of the output.
+
+    # Returns
+        A 1D tensor of length `max(max(x) + 1, minlength)`, with the dtype
+        of `weights`, or `int32` if `weights` is `None`.
+    """
+    counts = T.extra_ops.bincount(x, weights=weights, minlength=minlength)
+    if weights is None:
+        return T.cast(counts, 'int32')
+    return T.cast(counts, weights.dtype)
+
+
 def mean(x, axis=None, keepdims=False):
     """Mean of a tensor, alongside the specified axis.
 
@@ -1648,6 +1687,31 @@ def batch_normalization(x, mean, var, beta, gamma, axis=-1, epsilon=1e-3):
         x, gamma, beta, mean, var, reduction_axes, epsilon)
 
 
+def layer_normalization(x, gamma=None, beta=None, axis=-1, epsilon=1e-3):
+    """Normalizes `x` over `axis`, independently for every sample.
+    """
+    if isinstance(axis, int):
+        axis = [axis]
+    axis = [a % x.ndim for a in axis]
+    # The mean and the variance are computed in a single pass over `x`,
+    # shifted by one of its values per sample for numerical stability.
+    index = [slice(None)] * x.ndim
+    for a in axis:
+        index[a] = slice(0, 1)
+    shift = T.patternbroadcast(
+        theano.gradient.disconnected_grad(x[tuple(index)]),
+        [b or i in axis for i, b in enumerate(x.broadcastable)])
+    shifted = x - shift
+    mean = T.mean(shifted, axis=axis, keepdims=True)
+    variance = T.mean(T.sqr(shifted), axis=axis, keepdims=True) - T.sqr(mean)
+    output = (shifted - mean) * T.inv(T.sqrt(T.maximum(variance, 0.) + epsilon))
+    if gamma is not None:
+        output *= gamma
+    if beta is not None:
+        output += beta
+    return output
+
+
 # TODO remove this function when Theano without
 # T.nnet.bn.batch_normalization_train is deprecated
 def _old_normalize_batch_in_training(x, gamma, beta, reduction_axes,
@@ -2493,17 +2557,23 @@ def print_tensor(x, message=''):
 
 # GRAPH MANIPULATION
 
+def _unique_updates(updates):
+    unique_variables_to_update = {}
+    for v, nv in updates:
+        if v not in unique_variables_to_update:
+            unique_variables_to_update[v] = nv
+    return list(unique_variables_to_update.items())
+
+
 class Function(object):
     """Wrapper around Theano Function
     """
 
     def __init__(self, inputs, outputs, updates=[], name=None, **kwargs):
-        unique_variables_to_update = {}
-        for v, nv in updates:
-            if v not in unique_variables_to_update:
-                unique_variables_to_update[v] = nv
-        updates = unique_variables_to_update.items()
+        updates = _unique_updates(updates)
+        self.inputs = inputs
         self.outputs = outputs
+        self.updates = updates
         self.function = theano.function(inputs, outputs, updates=updates,
                                         allow_input_downcast=True,
                                         on_unused_input='ignore',
@@ -2547,6 +2617,152 @@ def function(inputs, outputs, updates=[], **kwargs):
     return Function(inputs, outputs, updates=updates, **kwargs)
 
 
+def _graph_description(inputs, outputs, updates):
+    """Describes the structure of a graph, independently of variable names.
+
+    # Returns
+        A tuple `(lines, shared)`: the list of strings describing the
+        graph and the shared variables of the graph, in the order in
+        which they are first met.
+    """
+    ids = {}
+    lines = []
+    shared = []
+
+    def describe(variable):
+        if variable in ids:
+            return ids[variable]
+        ids[variable] = len(ids)
+        if isinstance(variable, theano.compile.SharedVariable):
+            value = variable.get_value(borrow=True,
+                                       return_internal_type=True)
+            shared.append(variable)
+            lines.append('%d shared %s %s' % (ids[variable], variable.type,
+                                              getattr(value, 'shape', ())))
+        elif isinstance(variable, theano.gof.Constant):
+            data = np.asarray(variable.data)
+            lines.append('%d constant %s %s' % (
+                ids[variable], variable.type,
+                hashlib.sha1(data.tobytes()).hexdigest()))
+        elif variable.owner is None:
+            lines.append('%d input %s' % (ids[variable], variable.type))
+        return ids[variable]
+
+    for x in inputs:
+        describe(x)
+    for v, _ in updates:
+        describe(v)
+    update_values = [nv for _, nv in updates]
+    for node in theano.gof.graph.io_toposort(
+            theano.gof.graph.inputs(outputs + update_values),
+            outputs + update_values):
+        node_inputs = [describe(x) for x in node.inputs]
+        for x in node.outputs:
+            ids.setdefault(x, len(ids))
+        op_description = str(node.op)
+        # Ops with inner graphs (scan, OpFromGraph...) are described
+        # by their inner graph as well.
+        if isinstance(getattr(node.op, 'outputs', None), (list, tuple)):
+            inner_lines, _ = _graph_description(
+                list(node.op.inputs), list(node.op.outputs), [])
+            op_description += '{%s}' % '; '.join(inner_lines)
+        lines.append('%s(%s) -> %s' % (
+            op_description, node_inputs,
+            ['%d %s' % (ids[x], x.type) for x in node.outputs]))
+    lines.append('outputs %s' % [describe(x) for x in outputs])
+    lines.append('updates %s' % [(describe(v), describe(nv))
+                                 for v, nv in updates])
+    return lines, shared
+
+
+def function_signature(inputs, outputs, updates=[], **kwargs):
+    """Returns a string identifying the function that `function` would build.
+
+    Two calls with graphs of the same structure, dtypes and shapes, and the
+    same Theano configuration, return the same signature, even across
+    processes, so that compiled functions can be cached with
+    `serialize_function` and `deserialize_function`.
+
+    # Arguments
+        inputs: List of placeholder tensors.
+        outputs: List of output tensors.
+        updates: List of update tuples.
+        **kwargs: Passed to `theano.function`.
+
+    # Returns
+        A string.
+    """
+    lines, _ = _graph_description(inputs, outputs, _unique_updates(updates))
+    lines.append('theano %s, mode %s, optimizer %s, device %s, floatX %s' % (
+        theano.__version__, theano.config.mode, theano.config.optimizer,
+        theano.config.device, theano.config.floatX))
+    lines.append('kwargs %s' % sorted((k, repr(v)) for k, v in kwargs.items()))
+    return '\n'.join(lines)
+
+
+def serialize_function(f):
+    """Serializes a function returned by `function`.
+
+    The compiled Theano functions are pickled, together with the position
+    of their shared variables in the graph, so that `deserialize_function`
+    can bind them to the variables of another graph of the same structure.
+
+    # Arguments
+        f: A function returned by `function`.
+
+    # Returns
+        A byte string.
+    """
+    _, shared = _graph_description(f.inputs, f.outputs, f.updates)
+    positions = dict((v, i) for i, v in enumerate(shared))
+    state = {
+        'function': f.function,
+        'shared': [positions[v] for v in f.function.get_shared()],
+        'metrics_function': f._metrics_function,
+        'metrics_shared': [positions[v]
+                           for v in f._metrics_function.get_shared()],
+    }
+    return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def deserialize_function(data, inputs, outputs, updates=[], name=None):
+    """Loads a function serialized by `serialize_function`.
+
+    The graph given by `inputs`, `outputs` and `updates` must have the
+    signature of the serialized function. Its shared variables replace the
+    ones of the unpickled functions, which are not optimized again.
+
+    # Arguments
+        data: Byte string returned by `serialize_function`.
+        inputs: List of placeholder tensors.
+        outputs: List of output tensors.
+        updates: List of update tuples.
+        name: Name of the function.
+
+    # Returns
+        A function, as returned by `function`.
+    """
+    state = pickle.loads(data)
+    updates = _unique_updates(updates)
+    _, shared = _graph_description(inputs, outputs, updates)
+
+    def bind(compiled, positions):
+        swap = dict((old, shared[i])
+                    for old, i in zip(compiled.get_shared(), positions))
+        return compiled.copy(swap=swap)
+
+    f = Function.__new__(Function)
+    f.inputs = inputs
+    f.outputs = outputs
+    f.updates = updates
+    f.function = bind(state['function'], state['shared'])
+    f._metrics = [x for x in outputs if hasattr(x, '_is_metric')]
+    f._metrics_function = bind(state['metrics_function'],
+                               state['metrics_shared'])
+    f.name = name
+    return f
+
+
 def gradients(loss, variables):
     """Return symbolic gradients of one cost with respect to one or more variables.
     """
@@ -4182,32 +4398,23 @@ def count_sketch(h, s, x, d=16000):
     """Count sketch operator.
     See https://arxiv.org/abs/1606.01847.
 
+    Every input feature `i` is added, multiplied by `s[i]`, to the output
+    feature `h[i]`. This is computed as a single scatter-add over the
+    features of the batch.
+
     # Arguments
         h: Count sketch vector h \in \{1, d\} ^n
         s: Count sketch vector s \in \{-1, 1\} ^n
-        x: Count sketch input vector
+        x: Count sketch input vector, of shape `(batch_size, n)`.
         d: Compact Bilinear dimension
-    """
-    rval, updates = theano.scan(fn=__count_sketch,
-                                sequences=[h, s, x.dimshuffle(1, 0)],
-                                outputs_info=T.alloc(0., x.shape[0], d),
-                                non_sequences=[], n_steps=x.shape[1])
-    return rval[-1]  # We are interested only in the last value
-
-
-def __count_sketch(h, s, v,  # Sequences
-                   y,  # Outputs info
-                   ):
-    """Count sketch utility.
-    See https://arxiv.org/abs/1606.01847.
 
-    # Arguments
-        h: Count sketch vector h \in \{1, d\} ^n
-        s: Count sketch vector s \in \{-1, 1\} ^n
-        v: Count sketch input vector
-        y: Projected output vector
+    # Returns
+        A tensor of shape `(batch_size, d)`.
     """
-    return T.cast(T.inc_subtensor(y[:, h], T.dot(s, v)), 'float32')
+    signed_x = x * T.cast(s, x.dtype)
+    y = T.zeros((d, x.shape[0]), dtype=x.dtype)
+    # Indexing the first axis accumulates the repeated indices of `h`.
+    return T.inc_subtensor(y[h], signed_x.T).T
 
 
 # 1d Convolution
@@ -4215,28 +4422,28 @@ def scan_conv1d(u, v):
     """1D convolution over a set of vectors. All inputs will be treated by pairs.
         #x must be equal to #kernel
 
-    # Arguments
-        u: first set of vectors
-        v: second set of vectors
-    """
-
-    def __vec_conv(u, v,  # Sequences
-                   w,  # Outputs info
-                   ):
-        u = u.dimshuffle(('x', 0))
-        v = v.dimshuffle(('x', 0))
-        conv_out = vec_conv(u, v,
-                            border_mode='full')
+    The convolution of each pair of rows is computed as the product of their
+    real FFTs, zero-padded to avoid the wrap-around of circular convolution,
+    and cut to the central `n` values (`'same'` convolution).
 
-        init_cut = u.shape[1] / 2
-        end_cut = init_cut + u.shape[1]
-        return conv_out[0, init_cut:end_cut]
+    # Arguments
+        u: first set of vectors, of shape `(batch_size, n)`.
+        v: second set of vectors, of shape `(batch_size, n)`.
 
-    conv_out, updates = theano.scan(__vec_conv,
-                                    sequences=[u, v],
-                                    outputs_info=T.alloc(0., u.shape[1]),  # , d),
-                                    non_sequences=[], n_steps=u.shape[0])
-    return conv_out
+    # Returns
+        A tensor of shape `(batch_size, n)`.
+    """
+    n = u.shape[1]
+    padding = T.zeros((u.shape[0], n - 1), dtype=u.dtype)
+    # The last axis of the rfft output holds the real and imaginary parts.
+    fft_u = fft(T.concatenate([u, padding], axis=1))
+    fft_v = fft(T.concatenate([v, padding], axis=1))
+    fft_uv = T.stack([fft_u[..., 0] * fft_v[..., 0] -
+                      fft_u[..., 1] * fft_v[..., 1],
+                      fft_u[..., 0] * fft_v[..., 1] +
+                      fft_u[..., 1] * fft_v[..., 0]], axis=-1)
+    conv_out = ifft(fft_uv, is_odd=True)
+    return T.cast(conv_out[:, n // 2:n // 2 + n], u.dtype)
 
 
 # Theano implementation of CTC
@@ -4443,13 +4650,15 @@ def local_conv1d(inputs, kernel, kernel_size, strides, data_format=None):
     kernel_shape = int_shape(kernel)
     output_length, feature_dim, filters = kernel_shape
 
+    # Gather the patches with one strided slice per kernel offset,
+    # so that the graph does not grow with the output length.
+    stop = stride * (output_length - 1) + 1
     xs = []
-    for i in range(output_length):
-        slice_length = py_slice(i * stride,
-                                i * stride + kernel_size[0])
-        xs.append(reshape(inputs[:, slice_length, :],
-                          (1, -1, feature_dim)))
-    x_aggregate = concatenate(xs, axis=0)
+    for i in range(kernel_size[0]):
+        xs.append(inputs[:, i:i + stop:stride, :])
+    # Shape: `(batch_size, output_length, kernel_size * input_dim)`.
+    x_aggregate = reshape(stack(xs, axis=2), (-1, output_length, feature_dim))
+    x_aggregate = permute_dimensions(x_aggregate, (1, 0, 2))
     # Shape: `(output_length, batch_size, filters)`.
     output = batch_dot(x_aggregate, kernel)
     return permute_dimensions(output, (1, 0, 2))
@@ -4498,37 +4707,34 @@ def local_conv2d(inputs,
     kernel_shape = int_shape(kernel)
     _, feature_dim, filters = kernel_shape
 
+    # Gather the patches with one strided slice per kernel offset,
+    # so that the graph does not grow with the number of output positions.
+    stop_row = stride_row * (output_row - 1) + 1
+    stop_col = stride_col * (output_col - 1) + 1
+    xs = []
+    for i in range(kernel_size[0]):
+        for j in range(kernel_size[1]):
+            slice_row = py_slice(i, i + stop_row, stride_row)
+            slice_col = py_slice(j, j + stop_col, stride_col)
+            if data_format == 'channels_first':
+                xs.append(inputs[:, :, slice_row, slice_col])
+            else:
+                xs.append(inputs[:, slice_row, slice_col, :])
+    if data_format == 'channels_first':
+        # Features are ordered as (channels, kernel_rows, kernel_cols).
+        x_aggregate = permute_dimensions(stack(xs, axis=2), (0, 3, 4, 1, 2))
+    else:
+        # Features are ordered as (kernel_rows, kernel_cols, channels).
+        x_aggregate = stack(xs, axis=3)
+    x_aggregate = reshape(x_aggregate,
+                          (-1, output_row * output_col, feature_dim))
+    x_aggregate = permute_dimensions(x_aggregate, (1, 0, 2))
+    output = batch_dot(x_aggregate, kernel)
+    output = reshape(output,
+                     (output_row, output_col, -1, filters))
     if data_format == 'channels_first':
-        output = []
-        for i in range(output_row):
-            for j in range(output_col):
-                slice_row = py_slice(i * stride_row,
-                                     i * stride_row + kernel_size[0])
-                slice_col = py_slice(j * stride_col,
-                                     j * stride_col + kernel_size[1])
-                x_flatten = reshape(inputs[:, :, slice_row, slice_col],
-                                    (1, -1, feature_dim))
-                output.append(dot(x_flatten,
-                                  kernel[i * output_col + j, :, :]))
-        output = concatenate(output, axis=0)
-        output = reshape(output,
-                         (output_row, output_col, -1, filters))
         output = permute_dimensions(output, (2, 3, 0, 1))
     else:
-        xs = []
-        for i in range(output_row):
-            for j in range(output_col):
-                slice_row = py_slice(i * stride_row,
-                                     i * stride_row + kernel_size[0])
-                slice_col = py_slice(j * stride_col,
-                                     j * stride_col + kernel_size[1])
-                xs.append(reshape(inputs[:, slice_row, slice_col, :],
-                                  (1, -1, feature_dim)))
-
-        x_aggregate = concatenate(xs, axis=0)
-        output = batch_dot(x_aggregate, kernel)
-        output = reshape(output,
-                         (output_row, output_col, -1, filters))
         output = permute_dimensions(output, (2, 0, 1, 3))
     return output
 
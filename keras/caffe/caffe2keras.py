@@ -6,6 +6,8 @@ import argparse
 USAGE EXAMPLE
     python caffe2keras.py -load_path 'models/' -prototxt 'train_val_for_keras.prototxt'
                            -caffemodel 'bvlc_googlenet.caffemodel'
+
+    python caffe2keras.py -load_path 'models/' -caffemodel 'bvlc_googlenet.caffemodel' -weights_only
 """
 
 parser = argparse.ArgumentParser(description='Converts a Caffe model to Keras.')
@@ -17,6 +19,9 @@ parser.add_argument('-caffemodel', type=str,
                     help='name of the .caffemodel file')
 parser.add_argument('-store_path', type=str, default='',
                     help='path to the folder where the Keras model will be stored (default: -load_path).')
+parser.add_argument('-weights_only', action='store_true', default=0,
+                    help='only convert the weights, layer by layer, without building the model '
+                         '(load them with model.load_weights(path, by_name=True))')
 parser.add_argument('-debug', action='store_true', default=0,
                     help='use debug mode')
 
@@ -30,6 +35,13 @@ def main(args):
     else:
         store_path = args.store_path
 
+    if args.weights_only:
+        print("Converting weights...")
+        convert.caffemodel_to_hdf5(args.load_path + '/' + args.caffemodel,
+                                   store_path + '/Keras_model_weights.h5', debug=args.debug)
+        print("Finished storing the converted weights to " + store_path)
+        return
+
     print("Converting model...")
     model = convert.caffe_to_keras(args.load_path + '/' + args.prototxt, args.load_path + '/' + args.caffemodel,
                                    debug=args.debug)
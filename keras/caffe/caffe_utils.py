@@ -1,3 +1,8 @@
+import numpy as np
+import six
+
+from . import caffe_pb2 as caffe
+
 layer_num_to_name = {  # Maps layer number to names.
     0: 'NONE',
     1: 'ACCURACY',
@@ -221,3 +226,157 @@ def get_data_dim(layer):
         except AttributeError:
             pass
     return []
+
+
+# Field numbers of the caffe.proto messages read by `iter_caffemodel`.
+NET_LAYER_FIELD = 100  # NetParameter.layer (V2)
+NET_LAYERS_FIELD = 2  # NetParameter.layers (V1)
+LAYER_BLOBS_FIELD = {'V1': 6, 'V2': 7}  # V1LayerParameter/LayerParameter.blobs
+BLOB_DIMS_FIELDS = (1, 2, 3, 4)  # BlobProto.num/channels/height/width
+BLOB_DATA_FIELD = 5
+BLOB_SHAPE_FIELD = 7
+BLOB_DOUBLE_DATA_FIELD = 8
+
+
+def read_varint(data, pos):
+    """Decodes the protobuf varint starting at data[pos].
+    Returns the value and the position following it.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = six.indexbytes(data, pos)
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def read_varint_from_file(f):
+    """Decodes a protobuf varint from a file.
+    Returns None at the end of the file.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = f.read(1)
+        if not byte:
+            if shift:
+                raise IOError('truncated caffemodel file')
+            return None
+        byte = ord(byte)
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result
+        shift += 7
+
+
+def iter_fields(data):
+    """Iterates over the fields of a serialized protobuf message.
+    Yields (field number, wire type, value, start, end) tuples, where the
+    value is an int for varints and a memoryview of the payload otherwise,
+    and data[start:end] is the whole serialized field.
+    """
+    data = memoryview(data)
+    pos = 0
+    while pos < len(data):
+        start = pos
+        key, pos = read_varint(data, pos)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, pos = read_varint(data, pos)
+        elif wire_type == 1:
+            value, pos = data[pos:pos + 8], pos + 8
+        elif wire_type == 2:
+            length, pos = read_varint(data, pos)
+            value, pos = data[pos:pos + length], pos + length
+        elif wire_type == 5:
+            value, pos = data[pos:pos + 4], pos + 4
+        else:
+            raise ValueError('unsupported protobuf wire type %d' % wire_type)
+        yield number, wire_type, value, start, pos
+
+
+def read_varints(value):
+    """Decodes a packed (memoryview) or single (int) repeated varint field.
+    """
+    if isinstance(value, six.integer_types):
+        return [value]
+    values = []
+    pos = 0
+    while pos < len(value):
+        v, pos = read_varint(value, pos)
+        values.append(v)
+    return values
+
+
+def parse_blob(data):
+    """Parses a serialized BlobProto into a float32 numpy array of the
+    shape of the blob. The data is read directly from the packed bytes.
+    """
+    chunks = []
+    dims = None
+    legacy_dims = [1, 1, 1, 1]
+    for number, wire_type, value, _, _ in iter_fields(data):
+        if number == BLOB_DATA_FIELD and wire_type in (2, 5):
+            chunks.append(np.frombuffer(value, dtype='<f4'))
+        elif number == BLOB_DOUBLE_DATA_FIELD and wire_type in (1, 2):
+            chunks.append(np.frombuffer(value, dtype='<f8').astype(np.float32))
+        elif number == BLOB_SHAPE_FIELD:
+            dims = []
+            for _, _, dim, _, _ in iter_fields(value):
+                dims.extend(read_varints(dim))
+        elif number in BLOB_DIMS_FIELDS and wire_type == 0:
+            legacy_dims[number - 1] = value
+    if len(chunks) == 1:
+        array = chunks[0]
+    else:
+        array = np.concatenate(chunks or [np.zeros(0, np.float32)])
+    return array.reshape(dims if dims is not None else legacy_dims)
+
+
+def parse_layer(data, v):
+    """Parses a serialized (V1)LayerParameter without copying its blobs into
+    protobuf objects. Returns the layer (without blobs) and the list of its
+    blobs as numpy arrays.
+    """
+    header = bytearray()
+    blobs = []
+    for number, _, value, start, end in iter_fields(data):
+        if number == LAYER_BLOBS_FIELD[v]:
+            blobs.append(parse_blob(value))
+        else:
+            header += data[start:end]
+    layer = caffe.V1LayerParameter() if v == 'V1' else caffe.LayerParameter()
+    layer.ParseFromString(bytes(header))
+    return layer, blobs
+
+
+def iter_caffemodel(caffemodel):
+    """Reads a .caffemodel file layer by layer.
+    Yields a (layer, blobs) tuple for each layer, as returned by
+    `parse_layer`. Only one layer is held in memory at a time.
+    """
+    with open(caffemodel, 'rb') as f:
+        while True:
+            key = read_varint_from_file(f)
+            if key is None:
+                break
+            number, wire_type = key >> 3, key & 7
+            if wire_type == 0:
+                read_varint_from_file(f)
+            elif wire_type == 1:
+                f.seek(8, 1)
+            elif wire_type == 5:
+                f.seek(4, 1)
+            elif wire_type == 2:
+                length = read_varint_from_file(f)
+                if number == NET_LAYER_FIELD:
+                    yield parse_layer(f.read(length), 'V2')
+                elif number == NET_LAYERS_FIELD:
+                    yield parse_layer(f.read(length), 'V1')
+                else:
+                    f.seek(length, 1)
+            else:
+                raise ValueError('unsupported protobuf wire type %d' % wire_type)
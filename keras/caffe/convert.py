@@ -1,3 +1,4 @@
+import h5py
 import numpy as np
 from google.protobuf import text_format
 
@@ -5,7 +6,9 @@ from . import caffe_pb2 as caffe
 from .caffe_utils import *
 from .extra_layers import *
 from ..layers import *
+from .. import backend as K
 from ..models import Model
+from ..utils import conv_utils
 
 
 def caffe_to_keras(prototext, caffemodel, phase='train', debug=False):
@@ -42,25 +45,17 @@ def caffe_to_keras(prototext, caffemodel, phase='train', debug=False):
     model = create_model(layers,
                          0 if phase == 'train' else 1,
                          tuple(input_dim[1:]), debug)
-    params = caffe.NetParameter()
-    params.MergeFromString(open(caffemodel, 'rb').read())
-
-    if len(params.layers) != 0:
-        param_layers = params.layers[:]  # V1
-        v = 'V1'
-    elif len(params.layer) != 0:
-        param_layers = params.layer[:]  # V2
-        v = 'V2'
-    else:
-        raise Exception('could not load any layers from caffemodel')
-
     model.summary()
 
     print('')
     print("LOADING WEIGHTS")
-    weights = convert_weights(param_layers, v, debug)
-
-    load_weights(model, weights)
+    # the caffemodel is read layer by layer
+    model_layers = set(layer.name for layer in model.layers)
+    for layer, blobs in iter_caffemodel(caffemodel):
+        layer_weights = convert_layer_weights(layer, blobs, debug)
+        if layer_weights is not None and layer.name in model_layers:
+            model.get_layer(layer.name).set_weights(layer_weights)
+            print("Copied wts for layer:", layer.name)
 
     return model
 
@@ -400,143 +395,150 @@ def create_model(layers, phase, input_dim, debug=False):
     return model
 
 
-def rot90(W):
-    for i in range(W.shape[0]):
-        for j in range(W.shape[1]):
-            W[i, j] = np.rot90(W[i, j], 2)
-    return W
-
-
-def convert_weights(param_layers, v='V1', debug=False):
-    weights = {}
-
-    for layer in param_layers:
-        typ = layer_type(layer)
-        if typ == 'innerproduct':
-            blobs = layer.blobs
-
-            if v == 'V1':
-                nb_filter = blobs[0].num
-                stack_size = blobs[0].channels
-                nb_col = blobs[0].height
-                nb_row = blobs[0].width
-            elif v == 'V2':
-                if len(blobs[0].shape.dim) == 4:
-                    nb_filter = int(blobs[0].shape.dim[0])
-                    stack_size = int(blobs[0].shape.dim[1])
-                    nb_col = int(blobs[0].shape.dim[2])
-                    nb_row = int(blobs[0].shape.dim[3])
-                else:
-                    nb_filter = 1
-                    stack_size = 1
-                    nb_col = int(blobs[0].shape.dim[0])
-                    nb_row = int(blobs[0].shape.dim[1])
-            else:
-                raise RuntimeError('incorrect caffemodel version "' + v + '"')
-
-            weights_p = np.array(blobs[0].data).reshape(nb_filter, stack_size, nb_col, nb_row)[0, 0, :, :]
-            weights_p = weights_p.T  # need to swapaxes here, hence transpose. See comment in conv
-            weights_b = np.array(blobs[1].data)
-            layer_weights = [weights_p.astype(dtype=np.float32), weights_b.astype(dtype=np.float32)]
-
-            weights[layer.name] = layer_weights
-
-        elif typ == 'batchnorm':
-            blobs = layer.blobs
-            if v == 'V2':
-                nb_kernels = int(blobs[0].shape.dim[0])
-            else:
-                raise NotImplementedError(
-                    'Conversion on layer type "' + typ + '"not implemented forcaffemodel version "' + v + '"')
-
-            weights_mean = np.array(blobs[0].data)
-            weights_std_dev = np.array(blobs[1].data)
-
-            weights[layer.name] = [np.ones(nb_kernels), np.zeros(nb_kernels), weights_mean.astype(dtype=np.float32),
-                                   weights_std_dev.astype(dtype=np.float32)]
-
-        elif typ == 'scale':
-            blobs = layer.blobs
-            if v == 'V2':
-                nb_gamma = int(blobs[0].shape.dim[0])
-                nb_beta = int(blobs[1].shape.dim[0])
-                assert nb_gamma == nb_beta
-            else:
-                raise NotImplementedError(
-                    'Conversion on layer type "' + typ + '"not implemented forcaffemodel version "' + v + '"')
-
-            weights_gamma = np.array(blobs[0].data)
-            weights_beta = np.array(blobs[1].data)
-
-            weights[layer.name] = [weights_gamma.astype(dtype=np.float32), weights_beta.astype(dtype=np.float32)]
-
-        elif typ == 'convolution' or typ == 'deconvolution':
-            blobs = layer.blobs
-
-            if v == 'V1':
-                nb_filter = blobs[0].num
-                temp_stack_size = blobs[0].channels
-                nb_col = blobs[0].height
-                nb_row = blobs[0].width
-            elif v == 'V2':
-                nb_filter = int(blobs[0].shape.dim[0])
-                temp_stack_size = int(blobs[0].shape.dim[1])
-                nb_col = int(blobs[0].shape.dim[2])
-                nb_row = int(blobs[0].shape.dim[3])
-            else:
-                raise RuntimeError('incorrect caffemodel version "' + v + '"')
-
-            # NOTE: on model parallel networks
-            # if group is > 1, that means the conv filters are split up
-            # into a number of 'groups' and each group lies on a seperate GPU.
-            # Each group only acts on the select group of outputs from pervious layer
-            # that was in the same GPU (not the entire stack)
-            # Here, we add zeros to simulate the same effect
-            # This was famously used in AlexNet and few other models from 2012-14
+def blob_to_array(blob):
+    """Converts a parsed BlobProto into a float32 numpy array of its shape.
+    """
+    if len(blob.shape.dim) != 0:
+        shape = [int(dim) for dim in blob.shape.dim]
+    else:
+        shape = [blob.num, blob.channels, blob.height, blob.width]
+    data = list(blob.data) + list(blob.double_data)
+    return np.asarray(data, dtype=np.float32).reshape(shape)
 
-            group = layer.convolution_param.group
-            stack_size = temp_stack_size * group
 
-            weights_p = np.zeros((nb_filter, stack_size, nb_col, nb_row))
+def convert_layer_weights(layer, blobs, debug=False):
+    """Converts the blobs of a Caffe layer into the weights of the Keras layer
+        layer: (V1)LayerParameter
+        blobs: list of numpy arrays, with the shapes of the Caffe blobs
 
-            if layer.convolution_param.bias_term:
-                weights_b = np.array(blobs[1].data)
-            else:
-                weights_b = np.zeros((nb_filter,))
+        Returns the list of Keras weights, or None if the layer has none.
+    """
+    typ = layer_type(layer)
+    if not blobs:
+        return None
+
+    if typ == 'innerproduct':
+        # (out, in) in Caffe (V1 blobs are (1, 1, out, in)), (in, out) in Keras
+        weights_p = blobs[0].reshape(-1, blobs[0].shape[-1]).T
+        if len(blobs) > 1:
+            weights_b = blobs[1].ravel()
+        else:
+            weights_b = np.zeros(weights_p.shape[1], dtype=np.float32)
+        return [weights_p, weights_b]
+
+    elif typ == 'batchnorm':
+        # The moving statistics are stored multiplied by a scale factor
+        mean, variance = blobs[0].ravel(), blobs[1].ravel()
+        if len(blobs) > 2 and blobs[2].ravel()[0] != 0:
+            factor = 1. / blobs[2].ravel()[0]
+            mean, variance = mean * factor, variance * factor
+        nb_kernels = mean.shape[0]
+        return [np.ones(nb_kernels, dtype=np.float32),
+                np.zeros(nb_kernels, dtype=np.float32), mean, variance]
+
+    elif typ == 'scale':
+        gamma = blobs[0].ravel()
+        if len(blobs) > 1:
+            beta = blobs[1].ravel()
+        else:
+            beta = np.zeros_like(gamma)
+        return [gamma, beta]
+
+    elif typ == 'convolution' or typ == 'deconvolution':
+        weights_p = blobs[0]
+        nb_filter, stack_size, nb_col, nb_row = weights_p.shape
+
+        # NOTE: on model parallel networks
+        # if group is > 1, that means the conv filters are split up
+        # into a number of 'groups' and each group lies on a seperate GPU.
+        # Each group only acts on the select group of outputs from pervious layer
+        # that was in the same GPU (not the entire stack)
+        # Here, we add zeros to simulate the same effect
+        # This was famously used in AlexNet and few other models from 2012-14
+        group = layer.convolution_param.group or 1
+        if debug:
+            print(layer.name)
+            print("nb_filter")
+            print(nb_filter)
+            print("(channels x height x width)")
+            print("(" + str(stack_size) + " x " + str(nb_col) + " x " + str(nb_row) + ")")
+            print("groups")
+            print(group)
+        if group > 1:
+            # block diagonal kernel: (group, nb_filter / group, group, stack_size, ...)
+            grouped = weights_p.reshape((group, nb_filter // group, 1, stack_size, nb_col, nb_row))
+            mask = np.eye(group, dtype=np.float32).reshape((group, 1, group, 1, 1, 1))
+            weights_p = (grouped * mask).reshape((nb_filter, group * stack_size, nb_col, nb_row))
+
+        # (nb_filter, stack_size, rows, cols) -> (rows, cols, stack_size, nb_filter)
+        weights_p = np.transpose(weights_p, (2, 3, 1, 0))
+        # caffe, like tensorflow, does correlation, theano does convolution:
+        # flip the kernels 180 deg
+        if K.backend() == 'theano':
+            weights_p = conv_utils.convert_kernel(weights_p)
+        weights_p = np.ascontiguousarray(weights_p)
+
+        if not layer.convolution_param.bias_term:
+            return [weights_p]
+        return [weights_p, blobs[1].ravel()]
+
+    return None
 
-            group_data_size = len(blobs[0].data) // group
-            stacks_size_per_group = stack_size // group
-            nb_filter_per_group = nb_filter // group
 
-            if debug:
-                print(layer.name)
-                print("nb_filter")
-                print(nb_filter)
-                print("(channels x height x width)")
-                print("(" + str(temp_stack_size) + " x " + str(nb_col) + " x " + str(nb_row) + ")")
-                print("groups")
-                print(group)
-
-            for i in range(group):
-                group_weights = weights_p[i * nb_filter_per_group: (i + 1) * nb_filter_per_group, i * stacks_size_per_group: (i + 1) * stacks_size_per_group, :, :]
-                group_weights[:] = np.array(blobs[0].data[i * group_data_size: (i + 1) * group_data_size]).reshape(
-                    group_weights.shape)
-
-            # caffe, unlike theano, does correlation not convolution. We need to flip the weights 180 deg
-            weights_p = rot90(weights_p)
-
-            if weights_b is not None:
-                layer_weights = [weights_p.astype(dtype=np.float32), weights_b.astype(dtype=np.float32)]
-            else:
-                layer_weights = [weights_p.astype(dtype=np.float32)]
+def convert_weights(param_layers, v='V1', debug=False):
+    """Converts the weights of the layers of a parsed caffemodel
+        param_layers: list of (V1)LayerParameter
+        v: caffemodel version, 'V1' or 'V2'
 
+        Returns a dictionary mapping layer names to lists of Keras weights.
+    """
+    if v not in ('V1', 'V2'):
+        raise RuntimeError('incorrect caffemodel version "' + v + '"')
+    weights = {}
+    for layer in param_layers:
+        blobs = [blob_to_array(blob) for blob in layer.blobs]
+        layer_weights = convert_layer_weights(layer, blobs, debug)
+        if layer_weights is not None:
             weights[layer.name] = layer_weights
-
     return weights
 
 
 def load_weights(model, weights):
     for layer in model.layers:
-        if weights in layer.name:
+        if layer.name in weights:
             model.get_layer(layer.name).set_weights(weights[layer.name])
             print("Copied wts for layer:", layer.name)
+
+
+def caffemodel_to_hdf5(caffemodel, filepath, debug=False):
+    """Converts the weights of a .caffemodel into a Keras weights file,
+    without building the Keras model. The caffemodel is read and the
+    weights are written layer by layer, so that only the weights of one
+    layer are held in memory.
+        caffemodel: stored weights file
+        filepath: path of the HDF5 file to write
+
+        The weights can be loaded in the converted model with
+        `model.load_weights(filepath, by_name=True)`.
+    """
+    from .. import __version__ as keras_version
+    from ..engine.saving import save_attributes_to_hdf5_group
+
+    layer_names = []
+    with h5py.File(filepath, 'w') as f:
+        for layer, blobs in iter_caffemodel(caffemodel):
+            layer_weights = convert_layer_weights(layer, blobs, debug)
+            if layer_weights is None:
+                continue
+            g = f.create_group(layer.name)
+            weight_names = [('param_' + str(i)).encode('utf8')
+                            for i in range(len(layer_weights))]
+            save_attributes_to_hdf5_group(g, 'weight_names', weight_names)
+            for name, value in zip(weight_names, layer_weights):
+                g.create_dataset(name, data=value.astype(np.float32))
+            layer_names.append(layer.name.encode('utf8'))
+            if debug:
+                print("Converted wts for layer:", layer.name)
+        save_attributes_to_hdf5_group(f, 'layer_names', layer_names)
+        f.attrs['backend'] = K.backend().encode('utf8')
+        f.attrs['keras_version'] = str(keras_version).encode('utf8')
@@ -11,12 +11,29 @@ from .callbacks import EarlyStopping
 from .callbacks import RemoteMonitor
 from .callbacks import LearningRateScheduler
 from .callbacks import ReduceLROnPlateau
+from .callbacks import ExponentialMovingAverage
 from .callbacks import CSVLogger
 from .callbacks import LambdaCallback
 
+import sys
+
 from .. import backend as K
 
-if K.backend() == 'tensorflow' and not K.tensorflow_backend._is_tf_1():
-    from .tensorboard_v2 import TensorBoard
+
+def _tensorboard_class():
+    if K.backend() == 'tensorflow' and not K.tensorflow_backend._is_tf_1():
+        from .tensorboard_v2 import TensorBoard
+    else:
+        from .tensorboard_v1 import TensorBoard
+    return TensorBoard
+
+
+if sys.version_info >= (3, 7):
+    # `TensorBoard` imports TensorFlow, so it is imported on first access.
+    def __getattr__(name):
+        if name == 'TensorBoard':
+            return _tensorboard_class()
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
 else:
-    from .tensorboard_v1 import TensorBoard
+    TensorBoard = _tensorboard_class()
@@ -280,6 +280,11 @@ class Callback(object):
             (eg. verbosity, batch size, number of epochs...).
         model: instance of `keras.models.Model`.
             Reference of the model being trained.
+        needs_batch_logs: boolean. Whether the callback needs the loss
+            and metrics of every batch in `on_batch_end`. If no callback
+            needs them, `fit(log_freq=...)` only fetches them every few
+            batches. Defaults to `True`; callbacks which only use the
+            epoch logs should set it to `False`.
 
     The `logs` dictionary that callback methods
     take as argument will contain keys for quantities relevant to
@@ -299,6 +304,8 @@ class Callback(object):
             (if accuracy monitoring is enabled).
     """
 
+    needs_batch_logs = True
+
     def __init__(self):
         self.validation_data = None
         self.model = None
@@ -486,6 +493,8 @@ class BaseLogger(Callback):
             All others will be averaged in `on_epoch_end`.
     """
 
+    needs_batch_logs = False
+
     def __init__(self, stateful_metrics=None):
         if stateful_metrics:
             self.stateful_metrics = set(stateful_metrics)
@@ -523,8 +532,13 @@ class BaseLogger(Callback):
 
 class TerminateOnNaN(Callback):
     """Callback that terminates training when a NaN loss is encountered.
+
+    With `fit(log_freq=...)`, the loss is only checked on the batches
+    where the logs are fetched, i.e. every `log_freq` batches.
     """
 
+    needs_batch_logs = False
+
     def on_batch_end(self, batch, logs=None):
         logs = logs or {}
         loss = logs.get('loss')
@@ -550,6 +564,8 @@ class ProgbarLogger(Callback):
         ValueError: In case of invalid `count_mode`.
     """
 
+    needs_batch_logs = False
+
     def __init__(self, count_mode='samples',
                  stateful_metrics=None):
         super(ProgbarLogger, self).__init__()
@@ -619,6 +635,8 @@ class History(Callback):
     gets returned by the `fit` method of models.
     """
 
+    needs_batch_logs = False
+
     def on_train_begin(self, logs=None):
         self.epoch = []
         self.history = {}
@@ -662,6 +680,8 @@ class ModelCheckpoint(Callback):
         period: Interval (number of epochs) between checkpoints.
     """
 
+    needs_batch_logs = False
+
     def __init__(self, filepath, monitor='val_loss', verbose=0,
                  save_best_only=False, save_weights_only=False,
                  mode='auto', period=1):
@@ -730,6 +750,49 @@ class ModelCheckpoint(Callback):
                     self.model.save(filepath, overwrite=True)
 
 
+class _BestWeights(object):
+    """Keeps the weights of a model from its best epoch so far.
+
+    The weights are kept in a `WeightsSnapshot` of the model, allocated on
+    the first save, so that saving them again at every improvement does
+    not copy the model to Numpy. Models that do not support snapshots
+    fall back to `get_weights()` / `set_weights()`.
+    """
+
+    def __init__(self):
+        self.model = None
+        self.snapshot = None
+        self.weights = None
+
+    @property
+    def saved(self):
+        return self.snapshot is not None or self.weights is not None
+
+    def save(self, model):
+        if not hasattr(model, 'snapshot_weights'):
+            self.weights = model.get_weights()
+            return
+        if self.model is not model:
+            self.model = model
+            self.snapshot = model.snapshot_weights()
+        self.snapshot.save()
+
+    def restore(self, model):
+        if self.snapshot is not None:
+            if self.model is not model:
+                raise ValueError('The best weights were saved from the model ' +
+                                 self.model.name + ', they cannot be '
+                                 'restored in another model.')
+            self.snapshot.restore()
+        elif self.weights is not None:
+            model.set_weights(self.weights)
+
+    def get_values(self):
+        if self.snapshot is not None:
+            return self.snapshot.get_values()
+        return self.weights
+
+
 class EarlyStopping(Callback):
     """Stop training when a monitored quantity has stopped improving.
 
@@ -762,6 +825,8 @@ class EarlyStopping(Callback):
             training are used.
     """
 
+    needs_batch_logs = False
+
     def __init__(self,
                  monitor='val_loss',
                  min_delta=0,
@@ -780,7 +845,7 @@ class EarlyStopping(Callback):
         self.wait = 0
         self.stopped_epoch = 0
         self.restore_best_weights = restore_best_weights
-        self.best_weights = None
+        self._best_weights = _BestWeights()
 
         if mode not in ['auto', 'min', 'max']:
             warnings.warn('EarlyStopping mode %s is unknown, '
@@ -821,22 +886,28 @@ class EarlyStopping(Callback):
             self.best = current
             self.wait = 0
             if self.restore_best_weights:
-                self.best_weights = self.model.get_weights()
+                self._best_weights.save(self.model)
         else:
             self.wait += 1
             if self.wait >= self.patience:
                 self.stopped_epoch = epoch
                 self.model.stop_training = True
-                if self.restore_best_weights:
+                if self.restore_best_weights and self._best_weights.saved:
                     if self.verbose > 0:
                         print('Restoring model weights from the end of '
                               'the best epoch')
-                    self.model.set_weights(self.best_weights)
+                    self._best_weights.restore(self.model)
 
     def on_train_end(self, logs=None):
         if self.stopped_epoch > 0 and self.verbose > 0:
             print('Epoch %05d: early stopping' % (self.stopped_epoch + 1))
 
+    @property
+    def best_weights(self):
+        """The weights from the best epoch, as a list of Numpy arrays.
+        """
+        return self._best_weights.get_values()
+
     def get_monitor_value(self, logs):
         monitor_value = logs.get(self.monitor)
         if monitor_value is None:
@@ -869,6 +940,8 @@ class RemoteMonitor(Callback):
             application/json.
     """
 
+    needs_batch_logs = False
+
     def __init__(self,
                  root='http://localhost:9000',
                  path='/publish/epoch/end/',
@@ -917,6 +990,8 @@ class LearningRateScheduler(Callback):
         verbose: int. 0: quiet, 1: update messages.
     """
 
+    needs_batch_logs = False
+
     def __init__(self, schedule, verbose=0):
         super(LearningRateScheduler, self).__init__()
         self.schedule = schedule
@@ -982,11 +1057,17 @@ class ReduceLROnPlateau(Callback):
         cooldown: number of epochs to wait before resuming
             normal operation after lr has been reduced.
         min_lr: lower bound on the learning rate.
+        restore_best_weights: whether to restore model weights from
+            the epoch with the best value of the monitored quantity
+            when the learning rate is reduced, so that training
+            resumes from the best weights found so far.
     """
 
+    needs_batch_logs = False
+
     def __init__(self, monitor='val_loss', factor=0.1, patience=10,
                  verbose=0, mode='auto', min_delta=1e-4, cooldown=0, min_lr=0,
-                 **kwargs):
+                 restore_best_weights=False, **kwargs):
         super(ReduceLROnPlateau, self).__init__()
 
         self.monitor = monitor
@@ -1008,6 +1089,8 @@ class ReduceLROnPlateau(Callback):
         self.best = 0
         self.mode = mode
         self.monitor_op = None
+        self.restore_best_weights = restore_best_weights
+        self._best_weights = _BestWeights()
         self._reset()
 
     def _reset(self):
@@ -1050,6 +1133,8 @@ class ReduceLROnPlateau(Callback):
             if self.monitor_op(current, self.best):
                 self.best = current
                 self.wait = 0
+                if self.restore_best_weights:
+                    self._best_weights.save(self.model)
             elif not self.in_cooldown():
                 self.wait += 1
                 if self.wait >= self.patience:
@@ -1061,6 +1146,12 @@ class ReduceLROnPlateau(Callback):
                         if self.verbose > 0:
                             print('\nEpoch %05d: ReduceLROnPlateau reducing '
                                   'learning rate to %s.' % (epoch + 1, new_lr))
+                        if (self.restore_best_weights and
+                                self._best_weights.saved):
+                            if self.verbose > 0:
+                                print('Restoring model weights from the end '
+                                      'of the best epoch')
+                            self._best_weights.restore(self.model)
                         self.cooldown_counter = self.cooldown
                         self.wait = 0
 
@@ -1068,6 +1159,60 @@ class ReduceLROnPlateau(Callback):
         return self.cooldown_counter > 0
 
 
+class ExponentialMovingAverage(Callback):
+    """Maintains an exponential moving average of the weights of the model.
+
+    After every batch, the average `ema` of each trainable weight `w` is
+    updated to `decay * ema + (1 - decay) * w`. At the end of training,
+    the weights of the model are set to their averages, which often
+    generalize better than the weights from the last batch.
+
+    The averages are kept in a `WeightsSnapshot` of the model
+    (see `Network.snapshot_weights`).
+
+    # Example
+
+    ```python
+    ema = ExponentialMovingAverage(decay=0.999)
+    model.fit(X_train, Y_train, callbacks=[ema])
+    ```
+
+    # Arguments
+        decay: float between 0 and 1, decay rate of the averages.
+        verbose: int. 0: quiet, 1: update messages.
+
+    # Raises
+        ValueError: In case of invalid `decay`.
+    """
+
+    needs_batch_logs = False
+
+    def __init__(self, decay=0.999, verbose=0):
+        super(ExponentialMovingAverage, self).__init__()
+        if not 0. <= decay < 1.:
+            raise ValueError('ExponentialMovingAverage expects a decay '
+                             'between 0 and 1, got: ' + str(decay))
+        self.decay = decay
+        self.verbose = verbose
+        self.snapshot = None
+
+    def on_train_begin(self, logs=None):
+        weights = self.model.trainable_weights
+        if (self.snapshot is None or
+                [id(w) for w in self.snapshot.weights] !=
+                [id(w) for w in weights]):
+            self.snapshot = self.model.snapshot_weights(weights)
+        self.snapshot.save()
+
+    def on_batch_end(self, batch, logs=None):
+        self.snapshot.average(self.decay)
+
+    def on_train_end(self, logs=None):
+        if self.verbose > 0:
+            print('Setting model weights to their moving averages')
+        self.snapshot.restore()
+
+
 class CSVLogger(Callback):
     """Callback that streams epoch results to a csv file.
 
@@ -1088,6 +1233,8 @@ class CSVLogger(Callback):
             training). False: overwrite existing file,
     """
 
+    needs_batch_logs = False
+
     def __init__(self, filename, separator=',', append=False):
         self.sep = separator
         self.filename = filename
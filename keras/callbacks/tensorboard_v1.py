@@ -135,6 +135,10 @@ class TensorBoard(Callback):
         self.samples_seen = 0
         self.samples_seen_at_last_write = 0
 
+    @property
+    def needs_batch_logs(self):
+        return self.update_freq != 'epoch'
+
     def set_model(self, model):
         self.model = model
         if K.backend() == 'tensorflow':
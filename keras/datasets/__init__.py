@@ -1,9 +1,23 @@
 from __future__ import absolute_import
 
-from . import mnist
-from . import imdb
-from . import reuters
-from . import cifar10
-from . import cifar100
-from . import boston_housing
-from . import fashion_mnist
+import importlib
+import sys
+
+_DATASETS = ('mnist', 'imdb', 'reuters', 'cifar10', 'cifar100',
+             'boston_housing', 'fashion_mnist')
+
+if sys.version_info >= (3, 7):
+    # Datasets are imported on first access, e.g. `keras.datasets.mnist`.
+    def __getattr__(name):
+        if name in _DATASETS:
+            return importlib.import_module('.' + name, __name__)
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+else:
+    from . import mnist
+    from . import imdb
+    from . import reuters
+    from . import cifar10
+    from . import cifar100
+    from . import boston_housing
+    from . import fashion_mnist
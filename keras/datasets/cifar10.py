@@ -6,6 +6,7 @@ from __future__ import print_function
 
 from .cifar import load_batch
 from ..utils.data_utils import get_file
+from ..utils.data_utils import load_cached_arrays
 from .. import backend as K
 import numpy as np
 import os
@@ -16,26 +17,37 @@ def load_data():
 
     # Returns
         Tuple of Numpy arrays: `(x_train, y_train), (x_test, y_test)`.
+        The arrays are memory-mapped from an uncompressed cache
+        created on the first call.
     """
     dirname = 'cifar-10-batches-py'
     origin = 'https://www.cs.toronto.edu/~kriz/cifar-10-python.tar.gz'
     path = get_file(dirname, origin=origin, untar=True)
 
-    num_train_samples = 50000
+    train_paths = [os.path.join(path, 'data_batch_' + str(i))
+                   for i in range(1, 6)]
+    test_path = os.path.join(path, 'test_batch')
 
-    x_train = np.empty((num_train_samples, 3, 32, 32), dtype='uint8')
-    y_train = np.empty((num_train_samples,), dtype='uint8')
+    def load():
+        num_train_samples = 50000
 
-    for i in range(1, 6):
-        fpath = os.path.join(path, 'data_batch_' + str(i))
-        (x_train[(i - 1) * 10000: i * 10000, :, :, :],
-         y_train[(i - 1) * 10000: i * 10000]) = load_batch(fpath)
+        x_train = np.empty((num_train_samples, 3, 32, 32), dtype='uint8')
+        y_train = np.empty((num_train_samples,), dtype='uint8')
 
-    fpath = os.path.join(path, 'test_batch')
-    x_test, y_test = load_batch(fpath)
+        for i, fpath in enumerate(train_paths):
+            (x_train[i * 10000: (i + 1) * 10000, :, :, :],
+             y_train[i * 10000: (i + 1) * 10000]) = load_batch(fpath)
 
-    y_train = np.reshape(y_train, (len(y_train), 1))
-    y_test = np.reshape(y_test, (len(y_test), 1))
+        x_test, y_test = load_batch(test_path)
+        return {'x_train': x_train,
+                'y_train': np.reshape(y_train, (len(y_train), 1)),
+                'x_test': x_test,
+                'y_test': np.reshape(y_test, (len(y_test), 1))}
+
+    arrays = load_cached_arrays(path + '.cache', train_paths + [test_path],
+                                load)
+    x_train, y_train = arrays['x_train'], arrays['y_train']
+    x_test, y_test = arrays['x_test'], arrays['y_test']
 
     if K.image_data_format() == 'channels_last':
         x_train = x_train.transpose(0, 2, 3, 1)
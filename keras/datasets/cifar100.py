@@ -6,6 +6,7 @@ from __future__ import print_function
 
 from .cifar import load_batch
 from ..utils.data_utils import get_file
+from ..utils.data_utils import load_cached_arrays
 from .. import backend as K
 import numpy as np
 import os
@@ -19,6 +20,8 @@ def load_data(label_mode='fine'):
 
     # Returns
         Tuple of Numpy arrays: `(x_train, y_train), (x_test, y_test)`.
+        The arrays are memory-mapped from an uncompressed cache
+        created on the first call.
 
     # Raises
         ValueError: in case of invalid `label_mode`.
@@ -30,14 +33,22 @@ def load_data(label_mode='fine'):
     origin = 'https://www.cs.toronto.edu/~kriz/cifar-100-python.tar.gz'
     path = get_file(dirname, origin=origin, untar=True)
 
-    fpath = os.path.join(path, 'train')
-    x_train, y_train = load_batch(fpath, label_key=label_mode + '_labels')
-
-    fpath = os.path.join(path, 'test')
-    x_test, y_test = load_batch(fpath, label_key=label_mode + '_labels')
-
-    y_train = np.reshape(y_train, (len(y_train), 1))
-    y_test = np.reshape(y_test, (len(y_test), 1))
+    train_path = os.path.join(path, 'train')
+    test_path = os.path.join(path, 'test')
+
+    def load():
+        arrays = {}
+        for split, fpath in [('train', train_path), ('test', test_path)]:
+            for mode in ['fine', 'coarse']:
+                x, y = load_batch(fpath, label_key=mode + '_labels')
+                arrays['y_%s_%s' % (split, mode)] = np.reshape(y, (len(y), 1))
+            arrays['x_' + split] = x
+        return arrays
+
+    arrays = load_cached_arrays(path + '.cache', [train_path, test_path],
+                                load)
+    x_train, y_train = arrays['x_train'], arrays['y_train_' + label_mode]
+    x_test, y_test = arrays['x_test'], arrays['y_test_' + label_mode]
 
     if K.image_data_format() == 'channels_last':
         x_train = x_train.transpose(0, 2, 3, 1)
@@ -5,6 +5,7 @@ from __future__ import division
 from __future__ import print_function
 
 from ..utils.data_utils import get_file
+from ..utils.data_utils import load_cached_arrays
 from ..preprocessing.sequence import _remove_long_seq
 import numpy as np
 import json
@@ -55,9 +56,15 @@ def load_data(path='imdb.npz', num_words=None, skip_top=0,
     path = get_file(path,
                     origin='https://s3.amazonaws.com/text-datasets/imdb.npz',
                     file_hash='599dadb1135973df5b59232a0e9a887c')
-    with np.load(path, allow_pickle=True) as f:
-        x_train, labels_train = f['x_train'], f['y_train']
-        x_test, labels_test = f['x_test'], f['y_test']
+
+    def load():
+        with np.load(path, allow_pickle=True) as f:
+            return dict((name, f[name]) for name in
+                        ['x_train', 'y_train', 'x_test', 'y_test'])
+
+    arrays = load_cached_arrays(path + '.cache', [path], load)
+    x_train, labels_train = arrays['x_train'], arrays['y_train']
+    x_test, labels_test = arrays['x_test'], arrays['y_test']
 
     rng = np.random.RandomState(seed)
     indices = np.arange(len(x_train))
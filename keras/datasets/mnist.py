@@ -5,6 +5,7 @@ from __future__ import division
 from __future__ import print_function
 
 from ..utils.data_utils import get_file
+from ..utils.data_utils import load_cached_arrays
 import numpy as np
 
 
@@ -17,11 +18,18 @@ def load_data(path='mnist.npz'):
 
     # Returns
         Tuple of Numpy arrays: `(x_train, y_train), (x_test, y_test)`.
+        The arrays are memory-mapped from an uncompressed cache
+        created on the first call.
     """
     path = get_file(path,
                     origin='https://s3.amazonaws.com/img-datasets/mnist.npz',
                     file_hash='8a61469f7ea1b51cbae51d4f78837e45')
-    with np.load(path, allow_pickle=True) as f:
-        x_train, y_train = f['x_train'], f['y_train']
-        x_test, y_test = f['x_test'], f['y_test']
-    return (x_train, y_train), (x_test, y_test)
+
+    def load():
+        with np.load(path, allow_pickle=True) as f:
+            return dict((name, f[name]) for name in
+                        ['x_train', 'y_train', 'x_test', 'y_test'])
+
+    arrays = load_cached_arrays(path + '.cache', [path], load)
+    return ((arrays['x_train'], arrays['y_train']),
+            (arrays['x_test'], arrays['y_test']))
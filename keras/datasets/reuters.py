@@ -6,6 +6,7 @@ from __future__ import division
 from __future__ import print_function
 
 from ..utils.data_utils import get_file
+from ..utils.data_utils import load_cached_arrays
 from ..preprocessing.sequence import _remove_long_seq
 import numpy as np
 import json
@@ -53,8 +54,13 @@ def load_data(path='reuters.npz', num_words=None, skip_top=0,
     path = get_file(path,
                     origin='https://s3.amazonaws.com/text-datasets/reuters.npz',
                     file_hash='87aedbeb0cb229e378797a632c1997b6')
-    with np.load(path, allow_pickle=True) as f:
-        xs, labels = f['x'], f['y']
+
+    def load():
+        with np.load(path, allow_pickle=True) as f:
+            return {'x': f['x'], 'y': f['y']}
+
+    arrays = load_cached_arrays(path + '.cache', [path], load)
+    xs, labels = arrays['x'], arrays['y']
 
     rng = np.random.RandomState(seed)
     indices = np.arange(len(xs))
@@ -5,6 +5,7 @@ from __future__ import absolute_import
 from __future__ import division
 
 import re
+import numpy as np
 from six.moves import zip
 import threading
 
@@ -73,6 +74,11 @@ class Layer(object):
         weights: The concatenation of the lists trainable_weights and
             non_trainable_weights (in this order).
         dtype:  Default dtype of the layers's weights.
+        weight_quantization: `None`, or `'int8'` to store the 2D weights
+            of the layer (kernels and embeddings) as int8 values with
+            per-channel scales (see `keras.models.quantize_model`).
+            Weights of other ranks, such as the biases or the
+            `attention_context_wa` vector of `AttLSTMCond`, stay in float.
 
 
     # Methods
@@ -140,6 +146,7 @@ class Layer(object):
                           'name',
                           'trainable',
                           'weights',
+                          'weight_quantization',
                           'input_dtype',  # legacy
                           }
         for kwarg in kwargs:
@@ -173,6 +180,15 @@ class Layer(object):
 
         self._initial_weights = kwargs.get('weights')
 
+        self.weight_quantization = kwargs.get('weight_quantization')
+        if self.weight_quantization not in {None, 'int8'}:
+            raise ValueError('Unknown weight quantization: ' +
+                             str(self.weight_quantization) +
+                             '. Expected `None` or "int8".')
+        # Maps the names of the quantized weights to their
+        # `(values, scales)` variables.
+        self._quantized_weights = {}
+
     @staticmethod
     def _node_key(layer, node_index):
         """Converts a layer and its index to a unique (immutable type) name.
@@ -269,13 +285,18 @@ class Layer(object):
             constraint: An optional Constraint instance.
 
         # Returns
-            The created weight variable.
+            The created weight variable. If the layer quantizes its
+            weights and the weight is 2D (a kernel or an embedding matrix),
+            a tensor computing the weight from its quantized values.
         """
         if shape is None:
             shape = ()
         initializer = initializers.get(initializer)
         if dtype is None:
             dtype = self.dtype
+        if (getattr(self, 'weight_quantization', None) and len(shape) == 2 and
+                name):
+            return self._add_quantized_weight(name, shape, dtype, trainable)
         weight = K.variable(initializer(shape, dtype=str(dtype)),
                             dtype=dtype,
                             name=name,
@@ -290,6 +311,40 @@ class Layer(object):
         weight._tracked = True
         return weight
 
+    def _add_quantized_weight(self, name, shape, dtype, trainable):
+        """Adds a weight stored as int8 values with per-channel scales.
+
+        Embedding matrices have one scale per row (per token), other
+        kernels one scale per column (per output unit). The values and
+        the scales take the place of the weight in the weights of the
+        layer, and are initialized to zeros and ones: they are meant to
+        be set from a trained model.
+
+        # Arguments
+            name: String, the name of the weight.
+            shape: The shape tuple of the weight.
+            dtype: The dtype of the dequantized weight.
+            trainable: Boolean, whether the weight would be trainable.
+
+        # Returns
+            The tensor of the dequantized weight.
+        """
+        if name == 'embeddings':
+            scale_shape = (shape[0], 1)
+        else:
+            scale_shape = (1, shape[1])
+        values = K.variable(np.zeros(shape, dtype='int8'), dtype='int8',
+                            name=name + '_quantized')
+        scales = K.variable(np.ones(scale_shape), dtype=dtype,
+                            name=name + '_scale')
+        weights = (self._trainable_weights if trainable
+                   else self._non_trainable_weights)
+        for weight in (values, scales):
+            weights.append(weight)
+            weight._tracked = True
+        self._quantized_weights[name] = (values, scales)
+        return K.cast(values, dtype) * scales
+
     def assert_input_compatibility(self, inputs):
         """Checks compatibility between the layer and provided inputs.
 
@@ -1158,6 +1213,8 @@ class Layer(object):
             config['batch_input_shape'] = self.batch_input_shape
         if hasattr(self, 'dtype'):
             config['dtype'] = self.dtype
+        if getattr(self, 'weight_quantization', None):
+            config['weight_quantization'] = self.weight_quantization
         return config
 
     @classmethod
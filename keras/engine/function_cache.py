@@ -0,0 +1,242 @@
+"""On-disk cache of the compiled backend functions of models.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+import os
+import tempfile
+import warnings
+
+import six
+
+from .. import backend as K
+from ..utils.data_utils import _keras_dir
+
+# Unlike `os.rename`, `os.replace` (Python 3) overwrites existing
+# entries on Windows too.
+_replace = getattr(os, 'replace', os.rename)
+
+
+class FunctionCache(object):
+    """Size-bounded on-disk cache of compiled backend functions.
+
+    Compiled functions are stored in `directory`, one file per function,
+    under a key derived from the structure, dtypes and shapes of their graph
+    (see `K.function_signature`). When the total size of the cache exceeds
+    `max_size`, the least recently used entries are removed.
+
+    The cache is only used by backends that can serialize compiled
+    functions (currently Theano, where compiling the functions of large
+    models takes minutes). With other backends, functions are built as
+    usual.
+
+    Entries are loaded with `pickle`, which can execute arbitrary code:
+    the cache directory must only be writable by trusted users.
+
+    # Arguments
+        directory: Directory where the functions are stored. It is created
+            if needed. Defaults to `~/.keras/function_cache`.
+        max_size: Maximum total size of the cache, in bytes.
+
+    # Example
+
+    ```python
+        cache = FunctionCache(max_size=2 ** 30)
+        model.compile('adam', 'categorical_crossentropy',
+                      function_cache=cache)
+        model.fit(x, y)
+        print(cache.stats)
+    ```
+    """
+
+    def __init__(self, directory=None, max_size=2 ** 31):
+        if directory is None:
+            directory = os.path.join(_keras_dir(), 'function_cache')
+        self.directory = os.path.expanduser(directory)
+        self.max_size = max_size
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0,
+                      'evictions': 0, 'errors': 0}
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def get(self, key):
+        """Returns the data stored under `key`, or `None` if there is none.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except (IOError, OSError):
+            self.stats['misses'] += 1
+            return None
+        try:
+            # Marks the entry as recently used.
+            os.utime(path, None)
+        except OSError:
+            pass
+        self.stats['hits'] += 1
+        return data
+
+    def put(self, key, data):
+        """Stores `data` under `key`, and evicts old entries if needed.
+        """
+        if not os.path.exists(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                # Except permission denied and potential race conditions
+                # in multi-process environments.
+                pass
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # Renaming is atomic, so that concurrent processes
+            # never read partially written entries.
+            _replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.stats['stores'] += 1
+        self.evict()
+
+    def remove(self, key):
+        """Removes the entry stored under `key`, if any.
+        """
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits in
+        `max_size`.
+        """
+        entries = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.pkl'):
+                continue
+            path = os.path.join(self.directory, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            self.stats['evictions'] += 1
+
+    def summary(self):
+        """Returns a one-line report of the hits and misses of the cache.
+        """
+        lookups = self.stats['hits'] + self.stats['misses']
+        hit_rate = 100. * self.stats['hits'] / lookups if lookups else 0.
+        return ('Function cache %s: %d hits, %d misses (%.1f%% hit rate), '
+                '%d stores, %d evictions, %d errors' % (
+                    self.directory, self.stats['hits'], self.stats['misses'],
+                    hit_rate, self.stats['stores'], self.stats['evictions'],
+                    self.stats['errors']))
+
+
+_DEFAULT_CACHE = None
+
+
+def get(identifier):
+    """Retrieves a `FunctionCache`.
+
+    # Arguments
+        identifier: A `FunctionCache` instance, a directory path, `False`
+            (no caching) or `None`, in which case the cache given by the
+            `KERAS_FUNCTION_CACHE` environment variable (a directory path)
+            is used, if it is set. The maximum size of that cache, in
+            megabytes, can be set with `KERAS_FUNCTION_CACHE_SIZE`.
+
+    # Returns
+        A `FunctionCache` instance, or `None` if caching is disabled.
+
+    # Raises
+        ValueError: In case of invalid `identifier`.
+    """
+    global _DEFAULT_CACHE
+    if identifier is None:
+        directory = os.environ.get('KERAS_FUNCTION_CACHE')
+        if not directory:
+            return None
+        if _DEFAULT_CACHE is None or _DEFAULT_CACHE.directory != directory:
+            max_size = os.environ.get('KERAS_FUNCTION_CACHE_SIZE')
+            if max_size:
+                _DEFAULT_CACHE = FunctionCache(directory,
+                                               int(max_size) * 2 ** 20)
+            else:
+                _DEFAULT_CACHE = FunctionCache(directory)
+        return _DEFAULT_CACHE
+    if identifier is False:
+        return None
+    if isinstance(identifier, FunctionCache):
+        return identifier
+    if isinstance(identifier, six.string_types):
+        return FunctionCache(identifier)
+    raise ValueError('Could not interpret function cache identifier: ' +
+                     str(identifier))
+
+
+def cached_function(cache, inputs, outputs, updates=None, name=None, **kwargs):
+    """Instantiates a backend function, loading it from `cache` if possible.
+
+    The function is looked up in the cache by the signature of its graph.
+    On a miss, it is built with `K.function` and stored in the cache.
+
+    # Arguments
+        cache: A `FunctionCache` instance or `None`.
+        inputs: List of placeholder tensors.
+        outputs: List of output tensors.
+        updates: List of update ops.
+        name: Name of the function.
+        **kwargs: Passed to `K.function`.
+
+    # Returns
+        A backend function, as returned by `K.function`.
+    """
+    updates = updates or []
+    if cache is None or not hasattr(K, 'function_signature'):
+        return K.function(inputs, outputs, updates=updates, name=name,
+                          **kwargs)
+    signature = K.function_signature(inputs, outputs, updates=updates,
+                                     **kwargs)
+    key = hashlib.sha256(
+        ('%s\n%s\n%s' % (K.backend(), name, signature)).encode('utf-8'))
+    key = key.hexdigest()
+
+    data = cache.get(key)
+    if data is not None:
+        try:
+            return K.deserialize_function(data, inputs, outputs,
+                                          updates=updates, name=name)
+        except Exception as e:
+            # Unusable entries count as errors, not as hits.
+            cache.stats['hits'] -= 1
+            cache.stats['errors'] += 1
+            cache.remove(key)
+            warnings.warn('Could not load the cached function %s (%s), '
+                          'building it again.' % (name, e))
+
+    function = K.function(inputs, outputs, updates=updates, name=name,
+                          **kwargs)
+    try:
+        cache.put(key, K.serialize_function(function))
+    except Exception as e:
+        cache.stats['errors'] += 1
+        warnings.warn('Could not store the function %s in the function '
+                      'cache (%s).' % (name, e))
+    return function
@@ -10,13 +10,16 @@ import yaml
 import warnings
 import copy
 import os
+import six
 from six.moves import zip
 
 from . import saving
 from .base_layer import Layer
 from .base_layer import Node
+from .input_layer import Input
 from .input_layer import InputLayer
 from .saving import preprocess_weights_for_loading
+from .weights_snapshot import WeightsSnapshot
 from .. import backend as K
 from ..utils.io_utils import ask_to_proceed_with_overwrite
 from ..utils.layer_utils import print_summary as print_layer_summary
@@ -244,6 +247,8 @@ class Network(Layer):
         self._nodes_by_depth = nodes_by_depth
         self._layers = layers
         self._layers_by_depth = layers_by_depth
+        # Built on the first call of `run_internal_graph`.
+        self._execution_plan = None
 
         # Create the node linking internal inputs to internal outputs.
         Node(outbound_layer=self,
@@ -365,6 +370,103 @@ class Network(Layer):
 
         raise ValueError('No such layer: ' + name)
 
+    def get_submodel(self, outputs, inputs=None, name=None):
+        """Extracts the minimal model computing some tensors of the network.
+
+        Only the nodes needed to compute `outputs` are kept, so unused
+        branches and inputs are pruned. Tensors of the network given as
+        `inputs` are replaced by new `Input` placeholders: the layers
+        producing them are cut off, which allows feeding values that
+        were already computed, e.g. the states of an encoder to a model
+        running a single decoding step. The weights are shared with this
+        network.
+
+        # Arguments
+            outputs: Tensor or layer name, or list of them. The outputs of
+                the submodel. Layer names refer to the (single) output of
+                the layer.
+            inputs: Tensor or layer name, or list of them, to be fed to the
+                submodel instead of being computed. The inputs of the
+                network needed to compute `outputs` are appended to them.
+            name: Name of the submodel.
+
+        # Returns
+            A `Model` instance.
+
+        # Raises
+            ValueError: In case of invalid `outputs` or `inputs`.
+        """
+        from .training import Model
+
+        outputs = [self._get_network_tensor(x) for x in to_list(outputs)]
+        if inputs is None:
+            inputs = []
+        cut_tensors = [self._get_network_tensor(x) for x in to_list(inputs)]
+        cut_ids = set(id(x) for x in cut_tensors)
+
+        # Gather the nodes the outputs depend on, up to the cut tensors.
+        needed_nodes = set()
+        used_inputs = set()
+        stack = list(outputs)
+        while stack:
+            x = stack.pop()
+            if id(x) in cut_ids:
+                continue
+            layer, node_index, _ = x._keras_history
+            if isinstance(layer, InputLayer):
+                used_inputs.add(id(x))
+                continue
+            node = layer._inbound_nodes[node_index]
+            if node in needed_nodes:
+                continue
+            needed_nodes.add(node)
+            stack.extend(node.input_tensors)
+
+        # Replay the needed nodes on the new placeholders. Nodes which do
+        # not depend on the cut tensors keep their original outputs.
+        new_inputs = []
+        tensor_map = {}
+        for x in cut_tensors:
+            layer, node_index, tensor_index = x._keras_history
+            input_name = layer.name + '_output'
+            if len(layer._inbound_nodes[node_index].output_tensors) > 1:
+                input_name += '_%d' % tensor_index
+            new_input = Input(batch_shape=x._keras_shape, dtype=K.dtype(x),
+                              name=input_name)
+            new_inputs.append(new_input)
+            tensor_map[id(x)] = new_input
+        depth_keys = sorted(self._nodes_by_depth.keys(), reverse=True)
+        for depth in depth_keys:
+            for node in self._nodes_by_depth[depth]:
+                if node not in needed_nodes:
+                    continue
+                if not any(id(x) in tensor_map for x in node.input_tensors):
+                    continue
+                computed_tensors = [tensor_map.get(id(x), x)
+                                    for x in node.input_tensors]
+                kwargs = node.arguments or {}
+                output_tensors = to_list(node.outbound_layer(
+                    unpack_singleton(computed_tensors), **kwargs))
+                for x, y in zip(node.output_tensors, output_tensors):
+                    tensor_map[id(x)] = y
+
+        new_inputs += [x for x in self.inputs if id(x) in used_inputs]
+        new_outputs = [tensor_map.get(id(x), x) for x in outputs]
+        return Model(new_inputs, unpack_singleton(new_outputs), name=name)
+
+    def _get_network_tensor(self, x):
+        if isinstance(x, six.string_types):
+            x = self.get_layer(x).output
+        if not hasattr(x, '_keras_history'):
+            raise ValueError('Expected a layer name or a tensor of the '
+                             'network, got: ' + str(x))
+        layer, node_index, _ = x._keras_history
+        node_key = _make_node_key(layer.name, node_index)
+        if node_key not in self._network_nodes:
+            raise ValueError('The tensor ' + str(x) + ' is not part of '
+                             'the network "' + self.name + '".')
+        return x
+
     @property
     def updates(self):
         """Retrieves the model's updates.
@@ -527,6 +629,26 @@ class Network(Layer):
             weights = weights[num_param:]
         K.batch_set_value(tuples)
 
+    def snapshot_weights(self, weights=None):
+        """Creates an in-memory snapshot of the weights of the model.
+
+        The snapshot is held in backend variables allocated once, so that
+        it can be refreshed and restored repeatedly (e.g. every time a
+        monitored quantity improves) without copying the model to Numpy.
+
+        # Arguments
+            weights: List of weights to snapshot. Defaults to all the
+                weights of the model.
+
+        # Returns
+            A `WeightsSnapshot` instance. Its `save()` method copies the
+                current weights into the snapshot, and `restore()` copies
+                them back.
+        """
+        if weights is None:
+            weights = self.weights
+        return WeightsSnapshot(weights, name=self.name + '_snapshot')
+
     @property
     def input_spec(self):
         """Gets the model's input specs.
@@ -698,125 +820,107 @@ class Network(Layer):
         """
         if masks is None:
             masks = [None for _ in range(len(inputs))]
+        if self._execution_plan is None:
+            self._execution_plan = self._build_execution_plan()
+        steps, input_slots, output_slots, num_slots = self._execution_plan
 
-        # Dictionary mapping reference tensors to tuples
-        # (computed tensor, compute mask)
+        # List mapping the slot of each reference tensor to a tuple
+        # (computed tensor, computed mask).
         # we assume a 1:1 mapping from tensor to mask
         # TODO: raise exception when a `.compute_mask()` call
         # does not return a list the same size as `call`
-        tensor_map = {}
-        for x, y, mask in zip(self.inputs, inputs, masks):
-            tensor_map[str(id(x))] = (y, mask)
+        computed = [None] * num_slots
+        for slot, y, mask in zip(input_slots, inputs, masks):
+            computed[slot] = (y, mask)
+
+        for layer, node, node_input_slots, node_output_slots, uses_mask in steps:
+            # If all previous input tensors are available,
+            # then call node.inbound_layer on them.
+            computed_data = [computed[slot] for slot in node_input_slots]
+            if any(data is None for data in computed_data):
+                continue
 
-        depth_keys = list(self._nodes_by_depth.keys())
-        depth_keys.sort(reverse=True)
-        for depth in depth_keys:
-            nodes = self._nodes_by_depth[depth]
-            for node in nodes:
-                # This is always a single layer, never a list.
-                layer = node.outbound_layer
-                reference_input_tensors = node.input_tensors
-                reference_output_tensors = node.output_tensors
-
-                # If all previous input tensors are available in tensor_map,
-                # then call node.inbound_layer on them.
-                computed_data = []  # List of tuples (input, mask).
-                for x in reference_input_tensors:
-                    if str(id(x)) in tensor_map:
-                        computed_data.append(tensor_map[str(id(x))])
-
-                if len(computed_data) == len(reference_input_tensors):
-                    # call layer
-                    with K.name_scope(layer.name):
-                        if node.arguments:
-                            kwargs = node.arguments
-                        else:
-                            kwargs = {}
-                        if len(computed_data) == 1:
-                            computed_tensor, computed_mask = computed_data[0]
-                            if has_arg(layer.call, 'mask'):
-                                if 'mask' not in kwargs:
-                                    kwargs['mask'] = computed_mask
-                            output_tensors = to_list(
-                                layer.call(computed_tensor, **kwargs))
-                            output_masks = layer.compute_mask(computed_tensor,
-                                                              computed_mask)
-                            if output_masks is None:
-                                output_masks = [None for _ in output_tensors]
-                            else:
-                                output_masks = to_list(output_masks)
-                            computed_tensors = [computed_tensor]
-
-                            # computed_masks might be used in the future.
-                            computed_masks = [computed_mask]
-                        else:
-                            computed_tensors = [x[0] for x in computed_data]
-                            computed_masks = [x[1] for x in computed_data]
-                            if has_arg(layer.call, 'mask'):
-                                if 'mask' not in kwargs:
-                                    kwargs['mask'] = computed_masks
-                            output_tensors = to_list(
-                                layer.call(computed_tensors, **kwargs))
-                            output_masks = layer.compute_mask(computed_tensors,
-                                                              computed_masks)
-                            if output_masks is None:
-                                output_masks = [None for _ in output_tensors]
-                            else:
-                                output_masks = to_list(output_masks)
-                        # Apply activity regularizer if any:
-                        if (hasattr(layer, 'activity_regularizer') and
-                                layer.activity_regularizer is not None):
-                            with K.name_scope('activity_regularizer'):
-                                regularization_losses = [
-                                    layer.activity_regularizer(x)
-                                    for x in output_tensors]
-                            layer.add_loss(regularization_losses,
-                                           inputs=computed_tensors)
-
-                        if len(output_masks) != len(output_tensors):
-                            raise Exception(
-                                'Layers should have equal number of output tensors '
-                                'and output masks. Layer ' + str(layer.name) + ' has'
-                                ' ' + str(len(output_tensors)) + ' output tensors '
-                                'and ' + str(len(output_masks)) + ' output masks.')
-                    # Update model updates and losses:
-                    # Keep track of updates that depend on the inputs
-                    # (e.g. BN updates).
-                    self.add_update(layer.get_updates_for(computed_tensors), inputs)
-                    # Keep track of unconditional updates (e.g. a counter).
-                    self.add_update(layer.get_updates_for(None), None)
-                    # Keep track of losses that depend on the inputs
-                    # (e.g. activity regularizers).
-                    self.add_loss(layer.get_losses_for(computed_tensors), inputs)
-                    # Keep track of unconditional losses
-                    # (e.g. weight regularizers).
-                    self.add_loss(layer.get_losses_for(None), None)
-
-                    # Update _keras_shape.
-                    if all([hasattr(x, '_keras_shape') for x in computed_tensors]):
-                        input_shapes = unpack_singleton(
-                            [x._keras_shape for x in computed_tensors])
-                        shapes = to_list(layer.compute_output_shape(input_shapes))
-                        uses_learning_phase = any(
-                            [x._uses_learning_phase for x in computed_tensors])
-
-                        for x, s in zip(output_tensors, shapes):
-                            x._keras_shape = s
-                            _u = getattr(x, '_uses_learning_phase', False)
-                            x._uses_learning_phase = _u or uses_learning_phase
-
-                    # Update tensor_map.
-                    for x, y, mask in zip(reference_output_tensors,
-                                          output_tensors,
-                                          output_masks):
-                        tensor_map[str(id(x))] = (y, mask)
+            # call layer
+            with K.name_scope(layer.name):
+                if node.arguments:
+                    kwargs = dict(node.arguments)
+                else:
+                    kwargs = {}
+                if len(computed_data) == 1:
+                    computed_tensor, computed_mask = computed_data[0]
+                    if uses_mask and 'mask' not in kwargs:
+                        kwargs['mask'] = computed_mask
+                    output_tensors = to_list(
+                        layer.call(computed_tensor, **kwargs))
+                    output_masks = layer.compute_mask(computed_tensor,
+                                                      computed_mask)
+                    computed_tensors = [computed_tensor]
+                else:
+                    computed_tensors = [x[0] for x in computed_data]
+                    computed_masks = [x[1] for x in computed_data]
+                    if uses_mask and 'mask' not in kwargs:
+                        kwargs['mask'] = computed_masks
+                    output_tensors = to_list(
+                        layer.call(computed_tensors, **kwargs))
+                    output_masks = layer.compute_mask(computed_tensors,
+                                                      computed_masks)
+                if output_masks is None:
+                    output_masks = [None for _ in output_tensors]
+                else:
+                    output_masks = to_list(output_masks)
+                # Apply activity regularizer if any:
+                if (hasattr(layer, 'activity_regularizer') and
+                        layer.activity_regularizer is not None):
+                    with K.name_scope('activity_regularizer'):
+                        regularization_losses = [
+                            layer.activity_regularizer(x)
+                            for x in output_tensors]
+                    layer.add_loss(regularization_losses,
+                                   inputs=computed_tensors)
+
+                if len(output_masks) != len(output_tensors):
+                    raise Exception(
+                        'Layers should have equal number of output tensors '
+                        'and output masks. Layer ' + str(layer.name) + ' has'
+                        ' ' + str(len(output_tensors)) + ' output tensors '
+                        'and ' + str(len(output_masks)) + ' output masks.')
+            # Update model updates and losses:
+            # Keep track of updates that depend on the inputs
+            # (e.g. BN updates).
+            self.add_update(layer.get_updates_for(computed_tensors), inputs)
+            # Keep track of unconditional updates (e.g. a counter).
+            self.add_update(layer.get_updates_for(None), None)
+            # Keep track of losses that depend on the inputs
+            # (e.g. activity regularizers).
+            self.add_loss(layer.get_losses_for(computed_tensors), inputs)
+            # Keep track of unconditional losses
+            # (e.g. weight regularizers).
+            self.add_loss(layer.get_losses_for(None), None)
+
+            # Update _keras_shape.
+            if all([hasattr(x, '_keras_shape') for x in computed_tensors]):
+                input_shapes = unpack_singleton(
+                    [x._keras_shape for x in computed_tensors])
+                shapes = to_list(layer.compute_output_shape(input_shapes))
+                uses_learning_phase = any(
+                    [x._uses_learning_phase for x in computed_tensors])
+
+                for x, s in zip(output_tensors, shapes):
+                    x._keras_shape = s
+                    _u = getattr(x, '_uses_learning_phase', False)
+                    x._uses_learning_phase = _u or uses_learning_phase
+
+            for slot, y, mask in zip(node_output_slots,
+                                     output_tensors,
+                                     output_masks):
+                computed[slot] = (y, mask)
 
         output_tensors = []
         output_masks = []
         output_shapes = []
-        for x in self.outputs:
-            assert str(id(x)) in tensor_map, 'Could not compute output ' + str(x)
-            tensor, mask = tensor_map[str(id(x))]
+        for x, slot in zip(self.outputs, output_slots):
+            assert computed[slot] is not None, 'Could not compute output ' + str(x)
+            tensor, mask = computed[slot]
             if hasattr(tensor, '_keras_shape') and output_shapes is not None:
                 shape = tensor._keras_shape
                 output_shapes.append(shape)
@@ -844,6 +948,46 @@ class Network(Layer):
             self._output_shape_cache[cache_key] = output_shapes
         return output_tensors, output_masks, output_shapes
 
+    def _build_execution_plan(self):
+        """Orders the nodes of the network for `run_internal_graph`.
+
+        Reference tensors are assigned integer slots, and the signature of
+        the `call` method of each layer is inspected once, so that running
+        the graph does not need to sort, hash or inspect anything.
+
+        # Returns
+            A tuple `(steps, input_slots, output_slots, num_slots)`.
+            - steps: list of tuples `(layer, node, input_slots,
+                output_slots, uses_mask)`, one per node, in execution order.
+            - input_slots: the slots of `self.inputs`.
+            - output_slots: the slots of `self.outputs`.
+            - num_slots: the number of slots.
+        """
+        slots = {}
+
+        def get_slot(x):
+            if id(x) not in slots:
+                slots[id(x)] = len(slots)
+            return slots[id(x)]
+
+        input_slots = [get_slot(x) for x in self.inputs]
+        steps = []
+        uses_mask = {}
+        depth_keys = list(self._nodes_by_depth.keys())
+        depth_keys.sort(reverse=True)
+        for depth in depth_keys:
+            for node in self._nodes_by_depth[depth]:
+                # This is always a single layer, never a list.
+                layer = node.outbound_layer
+                if layer not in uses_mask:
+                    uses_mask[layer] = has_arg(layer.call, 'mask')
+                steps.append((layer, node,
+                              [get_slot(x) for x in node.input_tensors],
+                              [get_slot(x) for x in node.output_tensors],
+                              uses_mask[layer]))
+        output_slots = [get_slot(x) for x in self.outputs]
+        return steps, input_slots, output_slots, len(slots)
+
     def get_config(self):
         if not self._is_graph_network:
             # Subclassed networks are not serializable
@@ -1492,9 +1636,7 @@ def _map_graph_network(inputs, outputs):
     # Check that all tensors required are computable.
     # computable_tensors: all tensors in the graph
     # that can be computed from the inputs provided.
-    computable_tensors = []
-    for x in inputs:
-        computable_tensors.append(x)
+    computable_tensors = set(id(x) for x in inputs)
 
     layers_with_complete_input = []  # To provide a better error msg.
     for depth in depth_keys:
@@ -1502,7 +1644,7 @@ def _map_graph_network(inputs, outputs):
             layer = node.outbound_layer
             if layer:
                 for x in node.input_tensors:
-                    if id(x) not in [id(ct) for ct in computable_tensors]:
+                    if id(x) not in computable_tensors:
                         raise ValueError('Graph disconnected: '
                                          'cannot obtain value for tensor ' +
                                          str(x) + ' at layer "' +
@@ -1511,16 +1653,17 @@ def _map_graph_network(inputs, outputs):
                                          'were accessed without issue: ' +
                                          str(layers_with_complete_input))
                 for x in node.output_tensors:
-                    computable_tensors.append(x)
+                    computable_tensors.add(id(x))
                 layers_with_complete_input.append(layer.name)
 
     # Ensure name unicity, which will be crucial for serialization
     # (since serialized nodes refer to layers by their name).
-    all_names = [layer.name for layer in layers]
-    for name in all_names:
-        if all_names.count(name) != 1:
+    name_counts = {}
+    for layer in layers:
+        name_counts[layer.name] = name_counts.get(layer.name, 0) + 1
+    for name, count in name_counts.items():
+        if count != 1:
             raise ValueError('The name "' + name + '" is used ' +
-                             str(all_names.count(name)) +
-                             ' times in the model. '
+                             str(count) + ' times in the model. '
                              'All layer names should be unique.')
     return network_nodes, nodes_by_depth, layers, layers_by_depth
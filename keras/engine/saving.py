@@ -147,10 +147,10 @@ def _serialize_model(model, h5dict, include_optimizer=True):
                 name = str(w.name)
             else:
                 name = 'param_' + str(i)
-            if name in weight_names:
+            if name.encode('utf8') in weight_names:
                 idx = 2
                 unique_name = name + '_1'
-                while unique_name in weight_names:
+                while unique_name.encode('utf8') in weight_names:
                     unique_name = name + '_' + str(idx)
                     idx += 1
                 name = unique_name
@@ -986,6 +986,9 @@ def preprocess_weights_for_loading(layer, weights,
     # convert CuDNN layers
     weights = _convert_rnn_weights(layer, weights)
 
+    # convert between float and int8 quantized weights
+    weights = _convert_quantized_weights(layer, weights)
+
     return weights
 
 
@@ -1137,6 +1140,68 @@ def _convert_rnn_weights(layer, weights):
     return weights
 
 
+def quantize_weight(weight, scale_shape):
+    """Quantizes a weight to int8 values with symmetric scales.
+
+    The scales are computed over the axes where `scale_shape` is 1, so that
+    `values * scales` approximates `weight`.
+
+    # Arguments
+        weight: Numpy array.
+        scale_shape: Shape tuple of the scales, broadcastable to the shape
+            of `weight`, e.g. `(1, units)` for one scale per column.
+
+    # Returns
+        A tuple `(values, scales)` of Numpy arrays, of dtype int8 and of
+        the dtype of `weight`.
+    """
+    axes = tuple(i for i, dim in enumerate(scale_shape)
+                 if dim == 1 and weight.shape[i] != 1)
+    scales = np.max(np.abs(weight), axis=axes, keepdims=True) / 127.
+    scales[scales == 0] = 1.
+    values = np.clip(np.round(weight / scales), -127, 127).astype('int8')
+    return values, np.reshape(scales, scale_shape).astype(weight.dtype)
+
+
+def _convert_quantized_weights(layer, weights):
+    """Converts weights between their float and int8 quantized forms.
+
+    Quantized weights are stored as two arrays, the int8 values and the
+    scales (see `Layer.weight_quantization`). The float weights of a model
+    can thus be loaded in its quantized version and conversely.
+
+    # Arguments
+        layer: Target layer instance.
+        weights: List of source weights values (Numpy arrays).
+
+    # Returns
+        A list of weights values (Numpy arrays).
+    """
+    symbolic_weights = layer.weights
+    if len(symbolic_weights) == len(weights):
+        return weights
+    new_weights = []
+    i = j = 0
+    while i < len(symbolic_weights) and j < len(weights):
+        quantized = K.dtype(symbolic_weights[i]) == 'int8'
+        if quantized and weights[j].dtype != np.int8:
+            scale_shape = K.int_shape(symbolic_weights[i + 1])
+            new_weights.extend(quantize_weight(weights[j], scale_shape))
+            i += 2
+            j += 1
+        elif (not quantized and weights[j].dtype == np.int8 and
+              j + 1 < len(weights)):
+            new_weights.append((weights[j] * weights[j + 1]).astype(
+                weights[j + 1].dtype))
+            i += 1
+            j += 2
+        else:
+            new_weights.append(weights[j])
+            i += 1
+            j += 1
+    return new_weights + list(weights[j:])
+
+
 def _need_convert_kernel(original_backend):
     """Checks if conversion on kernel matrices is required during weight loading.
 
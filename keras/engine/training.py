@@ -5,15 +5,19 @@ from __future__ import division
 from __future__ import print_function
 
 import collections
+import contextlib
 import warnings
 import copy
 import numpy as np
+from scipy.sparse import issparse
 
 from .network import Network
+from .weights_snapshot import WeightsSnapshot
 from .base_layer import Layer
 from . import training_utils
 from . import training_arrays
 from . import training_generator
+from . import function_cache as function_cache_module
 from .. import backend as K
 from .. import optimizers
 from .. import losses
@@ -37,6 +41,8 @@ class Model(Network):
                 sample_weight_mode=None,
                 weighted_metrics=None,
                 target_tensors=None,
+                function_cache=None,
+                ema_decay=None,
                 **kwargs):
         """Configures the model for training.
 
@@ -83,6 +89,21 @@ class Model(Network):
                 can specify them via the `target_tensors` argument. It can be
                 a single tensor (for a single-output model), a list of tensors,
                 or a dict mapping output names to target tensors.
+            function_cache: On-disk cache of the compiled train, test and
+                predict functions, so that models with the same graph
+                structure skip compilation, even in another process.
+                A `keras.engine.function_cache.FunctionCache` instance,
+                a directory path, or `False` to disable caching.
+                Defaults to the directory in the `KERAS_FUNCTION_CACHE`
+                environment variable, if set.
+                Only the Theano backend supports function caching.
+            ema_decay: If set, float between 0 and 1. The train function then
+                also maintains an exponential moving average of the trainable
+                weights with this decay rate, in shadow variables updated at
+                every training step. The averages are initialized with the
+                weights at the first training step, and can be swapped in
+                with `swap_ema_weights()`, e.g. for evaluation or
+                checkpointing.
             **kwargs: When using the Theano/CNTK backends, these arguments
                 are passed into `K.function`.
                 When using the TensorFlow backend,
@@ -90,14 +111,22 @@ class Model(Network):
 
         # Raises
             ValueError: In case of invalid arguments for
-                `optimizer`, `loss`, `metrics` or `sample_weight_mode`.
+                `optimizer`, `loss`, `metrics`, `sample_weight_mode`
+                or `ema_decay`.
         """
+        if ema_decay is not None and not 0. <= ema_decay < 1.:
+            raise ValueError('`ema_decay` should be between 0 and 1, '
+                             'got: ' + str(ema_decay))
         self.optimizer = optimizers.get(optimizer)
         self.loss = loss or {}
         self._compile_metrics = metrics or []
         self.loss_weights = loss_weights
         self.sample_weight_mode = sample_weight_mode
         self._compile_weighted_metrics = weighted_metrics
+        self._function_cache = function_cache_module.get(function_cache)
+        self.ema_decay = ema_decay
+        self._ema_weights = None
+        self._ema_backup = None
 
         # List of stateful metric functions. Used for resetting metric state during
         # training/eval.
@@ -235,12 +264,23 @@ class Model(Network):
 
         self.train_function = None
         self.test_function = None
+        self.test_function_only_metrics = None
         self.predict_function = None
+        self.streamed_train_function = None
+        self.streamed_test_function = None
+        self._training_updates = None
+        self._streamed_loss = None
+        self._streamed_logs_function = None
 
         # Collected trainable weights, sorted in topological order.
         trainable_weights = self.trainable_weights
         self._collected_trainable_weights = trainable_weights
 
+        if self.ema_decay is not None:
+            self._ema_weights = WeightsSnapshot(
+                trainable_weights, name=self.name + '_ema')
+            self._ema_weights.save()
+
     @property
     def metrics(self):
         """Returns the model's metrics added using `compile`, `add_metric` APIs."""
@@ -276,9 +316,47 @@ class Model(Network):
     def reset_metrics(self):
         """Resets the state of metrics."""
         metrics = self._get_training_eval_metrics()
+        if getattr(self, '_streamed_loss', None) is not None:
+            metrics.append(self._streamed_loss)
         for m in metrics:
             m.reset_states()
 
+    @contextlib.contextmanager
+    def swap_ema_weights(self):
+        """Context manager swapping in the moving averages of the weights.
+
+        Within the context, the trainable weights of the model are set to
+        the exponential moving averages maintained during training (see
+        the `ema_decay` argument of `compile`). The weights are copied
+        between backend variables only, and the training weights are put
+        back when leaving the context.
+
+        # Example
+
+        ```python
+            model.compile('adam', 'mse', ema_decay=0.999)
+            model.fit(x, y)
+            with model.swap_ema_weights():
+                model.evaluate(x_val, y_val)
+                model.save_weights('ema_weights.h5')
+        ```
+
+        # Raises
+            RuntimeError: If the model was not compiled with `ema_decay`.
+        """
+        if getattr(self, '_ema_weights', None) is None:
+            raise RuntimeError('The model does not maintain moving averages '
+                               'of its weights, compile it with `ema_decay`.')
+        if self._ema_backup is None:
+            self._ema_backup = WeightsSnapshot(self._ema_weights.weights,
+                                               name=self.name + '_ema_backup')
+        self._ema_backup.save()
+        self._ema_weights.restore()
+        try:
+            yield
+        finally:
+            self._ema_backup.restore()
+
     def _check_trainable_weights_consistency(self):
         """Check trainable weights count consistency.
 
@@ -309,28 +387,84 @@ class Model(Network):
             if self._uses_dynamic_learning_phase():
                 inputs += [K.learning_phase()]
 
+            updates = self._get_training_updates()
+            metrics = self._get_training_eval_metrics()
+            metrics_tensors = [
+                m._call_result for m in metrics if hasattr(m, '_call_result')
+            ]
+            metrics_updates = []
+            for m in metrics:
+                metrics_updates.extend(m.updates)
+
+            # Gets loss and metrics. Updates weights at each call.
+            self.train_function = function_cache_module.cached_function(
+                self._function_cache,
+                inputs,
+                [self.total_loss] + metrics_tensors,
+                updates=updates + metrics_updates,
+                name='train_function',
+                **self._function_kwargs)
+
+    def _get_training_updates(self):
+        """Returns the updates of a training step.
+
+        They are created once, so that all the train functions share the
+        weights of the optimizer.
+        """
+        if self._training_updates is None:
             with K.name_scope('training'):
                 with K.name_scope(self.optimizer.__class__.__name__):
                     training_updates = self.optimizer.get_updates(
                         params=self._collected_trainable_weights,
                         loss=self.total_loss)
                 updates = self.updates + training_updates
+                if self._ema_weights is not None:
+                    # The averages start from the weights the model is
+                    # trained from, rather than from their initial values,
+                    # and are updated with the weights after each step.
+                    self._ema_weights.save()
+                    updates += self._ema_weights.average_updates(
+                        self.ema_decay, after=training_updates)
+            self._training_updates = updates
+        return self._training_updates
+
+    def _get_streamed_loss_updates(self):
+        """Returns the updates accumulating the loss in `_streamed_loss`.
+
+        The loss of each batch is weighted by the number of samples.
+        """
+        if self._streamed_loss is None:
+            self._streamed_loss = metrics_module.Mean(name='loss')
+        num_samples = K.cast(K.shape(self.outputs[0])[0], K.floatx())
+        return [K.update_add(self._streamed_loss.total,
+                             self.total_loss * num_samples),
+                K.update_add(self._streamed_loss.count, num_samples)]
+
+    def _make_streamed_train_function(self):
+        if not hasattr(self, 'streamed_train_function'):
+            raise RuntimeError('You must compile your model before using it.')
+        self._check_trainable_weights_consistency()
+        if self.streamed_train_function is None:
+            inputs = (self._feed_inputs +
+                      self._feed_targets +
+                      self._feed_sample_weights)
+            if self._uses_dynamic_learning_phase():
+                inputs += [K.learning_phase()]
 
-                metrics = self._get_training_eval_metrics()
-                metrics_tensors = [
-                    m._call_result for m in metrics if hasattr(m, '_call_result')
-                ]
-                metrics_updates = []
-                for m in metrics:
-                    metrics_updates.extend(m.updates)
+            metrics_updates = self._get_streamed_loss_updates()
+            for m in self._get_training_eval_metrics():
+                metrics_updates.extend(m.updates)
 
-                # Gets loss and metrics. Updates weights at each call.
-                self.train_function = K.function(
+            # Fetches nothing: the loss and the metrics are accumulated in
+            # backend variables, and read with `_get_streamed_logs`.
+            self.streamed_train_function = (
+                function_cache_module.cached_function(
+                    self._function_cache,
                     inputs,
-                    [self.total_loss] + metrics_tensors,
-                    updates=updates + metrics_updates,
-                    name='train_function',
-                    **self._function_kwargs)
+                    [],
+                    updates=self._get_training_updates() + metrics_updates,
+                    name='streamed_train_function',
+                    **self._function_kwargs))
 
     def _make_test_function(self):
         if not hasattr(self, 'test_function'):
@@ -353,13 +487,91 @@ class Model(Network):
 
             # Return loss and metrics, no gradient updates.
             # Does update the network states.
-            self.test_function = K.function(
+            self.test_function = function_cache_module.cached_function(
+                self._function_cache,
                 inputs,
                 [self.total_loss] + metrics_tensors,
                 updates=self.state_updates + metrics_updates,
                 name='test_function',
                 **self._function_kwargs)
 
+    def _make_streamed_test_function(self):
+        if not hasattr(self, 'streamed_test_function'):
+            raise RuntimeError('You must compile your model before using it.')
+        if self.streamed_test_function is None:
+            inputs = (self._feed_inputs +
+                      self._feed_targets +
+                      self._feed_sample_weights)
+            if self._uses_dynamic_learning_phase():
+                inputs += [K.learning_phase()]
+
+            metrics_updates = self._get_streamed_loss_updates()
+            for m in self._get_training_eval_metrics():
+                metrics_updates.extend(m.updates)
+
+            self.streamed_test_function = (
+                function_cache_module.cached_function(
+                    self._function_cache,
+                    inputs,
+                    [],
+                    updates=self.state_updates + metrics_updates,
+                    name='streamed_test_function',
+                    **self._function_kwargs))
+
+    def _get_streamed_logs(self):
+        """Fetches the loss and metrics accumulated by the streamed functions.
+
+        # Returns
+            List of scalars, labelled by `metrics_names`: the loss averaged
+            over the samples seen since the last `reset_metrics()`, and the
+            current values of the metrics.
+        """
+        if self._streamed_logs_function is None:
+            metrics = [m for m in self._get_training_eval_metrics()
+                       if hasattr(m, '_call_result')]
+            # The unwrapped `result` methods are called, since the wrapped
+            # ones would replace the `_call_result` of the metrics.
+            results = [type(m).result(m)
+                       for m in [self._streamed_loss] + metrics]
+            self._streamed_logs_function = K.function(
+                [], results, name='streamed_logs_function')
+        return self._streamed_logs_function([])
+
+    def _get_metrics_only(self):
+        """Returns the metrics reported by `evaluate_on_metrics`.
+
+        These are the metrics of `self.metrics` which have a result,
+        i.e. all the reported metrics except the losses.
+        """
+        return [m for m in self.metrics if hasattr(m, '_call_result')]
+
+    def _make_test_function_only_metrics(self):
+        if not hasattr(self, 'test_function_only_metrics'):
+            raise RuntimeError('You must compile your model before using it.')
+        if self.test_function_only_metrics is None:
+            inputs = (self._feed_inputs +
+                      self._feed_targets +
+                      self._feed_sample_weights)
+            if self._uses_dynamic_learning_phase():
+                inputs += [K.learning_phase()]
+
+            metrics = self._get_metrics_only()
+            metrics_tensors = [m._call_result for m in metrics]
+            metrics_updates = []
+            for m in metrics:
+                metrics_updates.extend(m.updates)
+
+            # Return metrics only: neither the loss nor the regularization
+            # terms are computed. Does update the network states.
+            self.test_function_only_metrics = (
+                function_cache_module.cached_function(
+                    self._function_cache,
+                    inputs,
+                    metrics_tensors,
+                    updates=self.state_updates + metrics_updates,
+                    name='test_function_only_metrics',
+                    **self._function_kwargs))
+
     def _make_predict_function(self):
         if not hasattr(self, 'predict_function'):
             self.predict_function = None
@@ -371,11 +583,17 @@ class Model(Network):
             # Gets network outputs. Does not update weights.
             # Does update the network states.
             kwargs = getattr(self, '_function_kwargs', {})
-            self.predict_function = K.function(inputs,
-                                               self.outputs,
-                                               updates=self.state_updates,
-                                               name='predict_function',
-                                               **kwargs)
+            if hasattr(self, '_function_cache'):
+                cache = self._function_cache
+            else:
+                cache = function_cache_module.get(None)
+            self.predict_function = function_cache_module.cached_function(
+                cache,
+                inputs,
+                self.outputs,
+                updates=self.state_updates,
+                name='predict_function',
+                **kwargs)
 
     def _uses_dynamic_learning_phase(self):
         return (self.uses_learning_phase and
@@ -547,7 +765,9 @@ class Model(Network):
                              metrics=self._compile_metrics,
                              weighted_metrics=self._compile_weighted_metrics,
                              loss_weights=self.loss_weights,
-                             target_tensors=target_tensors)
+                             target_tensors=target_tensors,
+                             function_cache=self._function_cache or False,
+                             ema_decay=self.ema_decay)
 
         # If `x` and `y` were all symbolic,
         # then the model should not be fed any inputs and targets.
@@ -556,9 +776,29 @@ class Model(Network):
         if any(K.is_tensor(v) for v in all_inputs):
             return [], [], []
 
-        # What follows is input validation and standardization to list format,
-        # in the case where all inputs are value arrays.
+        return self._standardize_arrays(
+            x, y,
+            sample_weight=sample_weight,
+            class_weight=class_weight,
+            check_array_lengths=check_array_lengths,
+            batch_size=batch_size)
+
+    def _standardize_arrays(self, x,
+                            y=None,
+                            sample_weight=None,
+                            class_weight=None,
+                            check_array_lengths=True,
+                            batch_size=None):
+        """Validates and standardizes arrays to the list format of the feeds.
 
+        This is the part of `_standardize_user_data` for Numpy arrays, once
+        the model is built and compiled. It only uses Numpy and attributes
+        of the model, not the backend graph, so `fit_generator` runs it in
+        a background thread.
+
+        # Returns
+            A tuple `(x, y, sample_weights)` of lists of Numpy arrays.
+        """
         if not self._is_graph_network:
             # Case: symbolic-mode subclassed network.
             # Do not do shape validation.
@@ -971,6 +1211,8 @@ class Model(Network):
             max_queue_size=10,
             workers=1,
             use_multiprocessing=False,
+            validation_metrics_only=False,
+            log_freq=None,
             **kwargs):
         """Trains the model for a fixed number of epochs (iterations on a dataset).
 
@@ -1096,6 +1338,28 @@ class Model(Network):
                 `False`. Note that because this implementation relies on
                 multiprocessing, you should not pass non-picklable arguments to
                 the generator as they can't be passed easily to children processes.
+            validation_metrics_only: Boolean. If `True`, only the metrics
+                are computed on the validation data (as with
+                `evaluate_on_metrics`), not the validation loss.
+                Not supported when `x` is a generator or a
+                `keras.utils.Sequence`.
+            log_freq: Integer or `None`. If set, the loss and the metrics
+                are accumulated in backend variables during each epoch,
+                and only fetched every `log_freq` batches and at the end
+                of the epoch, instead of after every batch. This avoids a
+                device to host transfer per batch, which may speed up
+                training with small batches (this has not been measured
+                yet). The batch logs passed to the callbacks then only
+                hold the loss and metrics on the batches where they are
+                fetched, and the loss is averaged since the start of the
+                epoch. It is only used if none of the `callbacks` needs
+                the logs of every batch (see `Callback.needs_batch_logs`).
+                Note that `TerminateOnNaN` does not need them: with
+                `log_freq`, it only detects a NaN loss every `log_freq`
+                batches, and training may run for up to `log_freq - 1`
+                batches after the loss became NaN.
+                Not supported when `x` is a generator or a
+                `keras.utils.Sequence`.
             **kwargs: Used for backwards compatibility.
 
         # Returns
@@ -1130,6 +1394,14 @@ class Model(Network):
         if training_utils.is_generator_or_sequence(x):
             training_utils.check_generator_arguments(
                 y, sample_weight, validation_split=validation_split)
+            if validation_metrics_only:
+                raise ValueError('`validation_metrics_only` is not supported '
+                                 'when training from a generator or '
+                                 'a `keras.utils.Sequence`.')
+            if log_freq is not None:
+                raise ValueError('`log_freq` is not supported '
+                                 'when training from a generator or '
+                                 'a `keras.utils.Sequence`.')
             return self.fit_generator(
                 x,
                 steps_per_epoch=steps_per_epoch,
@@ -1210,13 +1482,27 @@ class Model(Network):
             fit_inputs = x + y + sample_weights + [1]
         else:
             fit_inputs = x + y + sample_weights
-        self._make_train_function()
-        fit_function = self.train_function
+        if training_utils.should_stream_logs(log_freq, callbacks):
+            self._make_streamed_train_function()
+            fit_function = self.streamed_train_function
+        else:
+            log_freq = None
+            self._make_train_function()
+            fit_function = self.train_function
 
         # Prepare display labels.
         out_labels = self.metrics_names
 
-        if do_validation:
+        if do_validation and validation_metrics_only:
+            if not self._get_metrics_only():
+                raise ValueError('`validation_metrics_only` requires '
+                                 'the model to have metrics.')
+            self._make_test_function_only_metrics()
+            val_function = self.test_function_only_metrics
+        elif do_validation and log_freq:
+            self._make_streamed_test_function()
+            val_function = self.streamed_test_function
+        elif do_validation:
             self._make_test_function()
             val_function = self.test_function
         else:
@@ -1236,7 +1522,10 @@ class Model(Network):
                                         initial_epoch=initial_epoch,
                                         steps_per_epoch=steps_per_epoch,
                                         validation_steps=validation_steps,
-                                        validation_freq=validation_freq)
+                                        validation_freq=validation_freq,
+                                        validation_metrics_only=(
+                                            validation_metrics_only),
+                                        log_freq=log_freq)
 
     def evaluate(self,
                  x=None,
@@ -1248,7 +1537,8 @@ class Model(Network):
                  callbacks=None,
                  max_queue_size=10,
                  workers=1,
-                 use_multiprocessing=False):
+                 use_multiprocessing=False,
+                 log_freq=None):
         """Returns the loss value & metrics values for the model in test mode.
 
         Computation is done in batches.
@@ -1312,6 +1602,12 @@ class Model(Network):
                 `False`. Note that because this implementation relies on
                 multiprocessing, you should not pass non-picklable arguments to
                 the generator as they can't be passed easily to children processes.
+            log_freq: Integer or `None`. If set, the loss and the metrics
+                are accumulated in backend variables, and only fetched every
+                `log_freq` batches and after the last one, instead of after
+                every batch (see `fit`).
+                Not supported when `x` is a generator or a
+                `keras.utils.Sequence`.
 
         # Raises
             ValueError: in case of invalid arguments.
@@ -1328,6 +1624,10 @@ class Model(Network):
         # Case 1: generator-like. Input is Python generator, or Sequence object.
         if training_utils.is_generator_or_sequence(x):
             training_utils.check_generator_arguments(y, sample_weight)
+            if log_freq is not None:
+                raise ValueError('`log_freq` is not supported '
+                                 'when evaluating a generator or '
+                                 'a `keras.utils.Sequence`.')
             return self.evaluate_generator(
                 x,
                 steps=steps,
@@ -1352,52 +1652,91 @@ class Model(Network):
             ins = x + y + sample_weights + [0]
         else:
             ins = x + y + sample_weights
-        self._make_test_function()
-        f = self.test_function
+        if training_utils.should_stream_logs(log_freq, callbacks):
+            self._make_streamed_test_function()
+            f = self.streamed_test_function
+        else:
+            log_freq = None
+            self._make_test_function()
+            f = self.test_function
         return training_arrays.test_loop(self, f, ins,
                                          batch_size=batch_size,
                                          verbose=verbose,
                                          steps=steps,
-                                         callbacks=callbacks)
+                                         callbacks=callbacks,
+                                         log_freq=log_freq)
+
+    def evaluate_on_metrics(self,
+                            x=None,
+                            y=None,
+                            batch_size=None,
+                            verbose=1,
+                            sample_weight=None,
+                            steps=None,
+                            callbacks=None):
+        """Returns the metrics values for the model in test mode.
+
+        Unlike `evaluate`, neither the loss nor the regularization terms
+        are computed, only the metrics given to `compile` (and those added
+        by the layers). Computation is done in batches.
 
-    def evaluate_on_metrics(self, x, y, batch_size=32, verbose=1, sample_weight=None):
-        '''Returns the metrics values for the model
-        in test mode. Computation is done in batches.
         # Arguments
-            x: Numpy array of test data,
-                or list of Numpy arrays if the model has multiple inputs.
-                If all inputs in the model are named,
-                you can also pass a dictionary
-                mapping input names to Numpy arrays.
-            y: Numpy array of target data,
-                or list of Numpy arrays if the model has multiple outputs.
-                If all outputs in the model are named,
-                you can also pass a dictionary
-                mapping output names to Numpy arrays.
-            batch_size: integer. Number of samples per gradient update.
+            x: Input data, as in `evaluate`: Numpy array(s), a dict mapping
+                input names to arrays, or `None` if feeding from
+                framework-native tensors.
+            y: Target data, as in `evaluate`.
+            batch_size: Integer or `None`.
+                Number of samples per evaluation step.
+                If unspecified, `batch_size` will default to 32.
+            verbose: 0 or 1. Verbosity mode.
+                0 = silent, 1 = progress bar.
+            sample_weight: Optional Numpy array of weights for
+                the test samples, used for weighting the metrics.
+            steps: Integer or `None`.
+                Total number of steps (batches of samples)
+                before declaring the evaluation round finished.
+                Ignored with the default value of `None`.
+            callbacks: List of `keras.callbacks.Callback` instances.
+                List of callbacks to apply during evaluation.
 
         # Returns
-            Scalar test loss (if the model has a single output and no metrics)
-            or list of scalars (if the model has multiple outputs
-            and/or metrics). The attribute `model.metrics_names` will give you
-            the display labels for the scalar outputs.
-        '''
-        # validate user data
+            Scalar metric value (if the model has a single metric)
+            or list of scalars. The names of the metrics are given by
+            `[m.name for m in model.metrics]`.
+
+        # Raises
+            ValueError: in case of invalid arguments,
+                or if the model has no metrics.
+        """
+        if not hasattr(self, 'test_function_only_metrics'):
+            raise RuntimeError('You must compile your model before using it.')
+        if not self._get_metrics_only():
+            raise ValueError('The model has no metrics to evaluate. '
+                             'Pass `metrics` to `compile()` '
+                             'or use `evaluate()`.')
+        batch_size = self._validate_or_infer_batch_size(batch_size, steps, x)
+        if x is None and y is None and steps is None:
+            raise ValueError('If evaluating from data tensors, '
+                             'you should specify the `steps` '
+                             'argument.')
+        # Validate user data.
         x, y, sample_weights = self._standardize_user_data(
             x, y,
             sample_weight=sample_weight,
-            check_batch_dim=False,
             batch_size=batch_size)
-        # prepare inputs, delegate logic to _test_loop
-        if self.uses_learning_phase and not isinstance(K.learning_phase, int):
-            ins = x + y + sample_weights + [0.]
+        # Prepare inputs, delegate logic to `test_loop`.
+        if self._uses_dynamic_learning_phase():
+            ins = x + y + sample_weights + [0]
         else:
             ins = x + y + sample_weights
         self._make_test_function_only_metrics()
         f = self.test_function_only_metrics
-        return self._test_loop(f, ins,
-                               batch_size=batch_size,
-                               verbose=verbose)
+        return training_arrays.test_loop(self, f, ins,
+                                         batch_size=batch_size,
+                                         verbose=verbose,
+                                         steps=steps,
+                                         callbacks=callbacks,
+                                         metrics_only=True)
 
     def predict(self, x,
                 batch_size=None,
@@ -1545,10 +1884,15 @@ class Model(Network):
             x, y,
             sample_weight=sample_weight,
             class_weight=class_weight)
+        ins = x + y + sample_weights
+        feed = (self._feed_inputs +
+                self._feed_targets +
+                self._feed_sample_weights)
+        for i in range(len(ins)):
+            if issparse(ins[i]) and not K.is_sparse(feed[i]):
+                ins[i] = ins[i].toarray()
         if self._uses_dynamic_learning_phase():
-            ins = x + y + sample_weights + [1]
-        else:
-            ins = x + y + sample_weights
+            ins += [1]
         self._make_train_function()
         outputs = self.train_function(ins)
 
@@ -31,7 +31,9 @@ def fit_loop(model, fit_function, fit_inputs,
              initial_epoch=0,
              steps_per_epoch=None,
              validation_steps=None,
-             validation_freq=1):
+             validation_freq=1,
+             validation_metrics_only=False,
+             log_freq=None):
     """Abstract fit function for `fit_function(fit_inputs)`.
 
     Assumes that fit_function returns a list, labeled by out_labels.
@@ -65,6 +67,13 @@ def fit_loop(model, fit_function, fit_inputs,
             tuple, or set, specifies the epochs on which to run validation,
             e.g. `validation_freq=[1, 2, 10]` runs validation at the end
             of the 1st, 2nd, and 10th epochs.
+        validation_metrics_only: Whether `val_function` only returns
+            the metrics, without the losses.
+        log_freq: If set, `fit_function` and `val_function` are streamed
+            functions (see `Model._make_streamed_train_function`), which
+            return nothing. The loss and the metrics are then fetched with
+            `model._get_streamed_logs()` every `log_freq` batches and at
+            the end of each epoch only, and passed to the callbacks.
 
     # Returns
         `History` object.
@@ -97,14 +106,19 @@ def fit_loop(model, fit_function, fit_inputs,
         index_array = np.arange(num_train_samples)
 
     model.history = cbks.History()
-    _callbacks = [cbks.BaseLogger(stateful_metrics=model.metrics_names[1:])]
+    if log_freq:
+        # The streamed loss is averaged over the epoch like the metrics.
+        stateful_metrics = model.metrics_names
+    else:
+        stateful_metrics = model.metrics_names[1:]
+    _callbacks = [cbks.BaseLogger(stateful_metrics=stateful_metrics)]
     if verbose:
         if steps_per_epoch is not None:
             count_mode = 'steps'
         else:
             count_mode = 'samples'
         _callbacks.append(
-            cbks.ProgbarLogger(count_mode, stateful_metrics=model.metrics_names[1:]))
+            cbks.ProgbarLogger(count_mode, stateful_metrics=stateful_metrics))
     _callbacks += (callbacks or []) + [model.history]
     callbacks = cbks.CallbackList(_callbacks)
     out_labels = out_labels or []
@@ -113,8 +127,17 @@ def fit_loop(model, fit_function, fit_inputs,
     # (used by Sequential models)
     callback_model = model._get_callback_model()
     callback_metrics = list(model.metrics_names)
+    if validation_metrics_only:
+        val_labels = [m.name for m in model._get_metrics_only()]
+        callback_val_labels = val_labels
+    else:
+        # Same labels assumed.
+        val_labels = out_labels
+        callback_val_labels = model.metrics_names
     if do_validation:
-        callback_metrics += ['val_' + n for n in model.metrics_names]
+        callback_metrics += ['val_' + n for n in callback_val_labels]
+    # Metrics-only validation functions are never streamed.
+    val_log_freq = None if validation_metrics_only else log_freq
 
     callbacks.set_model(callback_model)
     callbacks.set_params({
@@ -150,6 +173,9 @@ def fit_loop(model, fit_function, fit_inputs,
                 batch_logs = {'batch': step_index, 'size': 1}
                 callbacks._call_batch_hook('train', 'begin', step_index, batch_logs)
                 outs = fit_function(fit_inputs)
+                if log_freq and _should_fetch(step_index, steps_per_epoch,
+                                              log_freq):
+                    outs = model._get_streamed_logs()
 
                 outs = to_list(outs)
                 for l, o in zip(out_labels, outs):
@@ -163,27 +189,27 @@ def fit_loop(model, fit_function, fit_inputs,
                 val_outs = test_loop(model, val_function, val_inputs,
                                      steps=validation_steps,
                                      callbacks=callbacks,
-                                     verbose=0)
+                                     verbose=0,
+                                     metrics_only=validation_metrics_only,
+                                     log_freq=val_log_freq)
                 val_outs = to_list(val_outs)
-                # Same labels assumed.
-                for l, o in zip(out_labels, val_outs):
+                for l, o in zip(val_labels, val_outs):
                     epoch_logs['val_' + l] = o
         else:
-            if shuffle == 'batch':
-                index_array = batch_shuffle(index_array, batch_size)
-            elif shuffle:
-                np.random.shuffle(index_array)
+            epoch_inputs = fit_inputs
+            if shuffle:
+                if shuffle == 'batch':
+                    index_array = batch_shuffle(index_array, batch_size)
+                else:
+                    np.random.shuffle(index_array)
+                epoch_inputs = _permute_sparse(fit_inputs, index_array)
 
             batches = make_batches(num_train_samples, batch_size)
             for batch_index, (batch_start, batch_end) in enumerate(batches):
                 batch_ids = index_array[batch_start:batch_end]
                 try:
-                    if isinstance(fit_inputs[-1], int):
-                        # Do not slice the training phase flag.
-                        ins_batch = slice_arrays(
-                            fit_inputs[:-1], batch_ids) + [fit_inputs[-1]]
-                    else:
-                        ins_batch = slice_arrays(fit_inputs, batch_ids)
+                    ins_batch = _slice_batch(epoch_inputs, batch_ids,
+                                             batch_start, batch_end)
                 except TypeError:
                     raise TypeError('TypeError while preparing batch. '
                                     'If using HDF5 input data, '
@@ -194,6 +220,9 @@ def fit_loop(model, fit_function, fit_inputs,
                     ins_batch[i] = ins_batch[i].toarray()
 
                 outs = fit_function(ins_batch)
+                if log_freq and _should_fetch(batch_index, len(batches),
+                                              log_freq):
+                    outs = model._get_streamed_logs()
                 outs = to_list(outs)
                 for l, o in zip(out_labels, outs):
                     batch_logs[l] = o
@@ -207,10 +236,11 @@ def fit_loop(model, fit_function, fit_inputs,
                     val_outs = test_loop(model, val_function, val_inputs,
                                          batch_size=batch_size,
                                          callbacks=callbacks,
-                                         verbose=0)
+                                         verbose=0,
+                                         metrics_only=validation_metrics_only,
+                                         log_freq=val_log_freq)
                     val_outs = to_list(val_outs)
-                    # Same labels assumed.
-                    for l, o in zip(out_labels, val_outs):
+                    for l, o in zip(val_labels, val_outs):
                         epoch_logs['val_' + l] = o
 
         callbacks.on_epoch_end(epoch, epoch_logs)
@@ -311,11 +341,7 @@ def predict_loop(model, f, ins,
         index_array = np.arange(num_samples)
         for batch_index, (batch_start, batch_end) in enumerate(batches):
             batch_ids = index_array[batch_start:batch_end]
-            if ins and isinstance(ins[-1], int):
-                # Do not slice the training phase flag.
-                ins_batch = slice_arrays(ins[:-1], batch_ids) + [ins[-1]]
-            else:
-                ins_batch = slice_arrays(ins, batch_ids)
+            ins_batch = _slice_batch(ins, batch_ids, batch_start, batch_end)
             for i in indices_for_conversion_to_dense:
                 ins_batch[i] = ins_batch[i].toarray()
 
@@ -343,7 +369,9 @@ def test_loop(model, f, ins,
               batch_size=None,
               verbose=0,
               steps=None,
-              callbacks=None):
+              callbacks=None,
+              metrics_only=False,
+              log_freq=None):
     """Abstract method to loop over some data in batches.
 
     # Arguments
@@ -357,15 +385,36 @@ def test_loop(model, f, ins,
             Ignored with the default value of `None`.
         callbacks: List of callbacks or an instance of
             `keras.callbacks.CallbackList` to be called during evaluation.
+        metrics_only: Whether `f` only returns the values of the stateful
+            metrics, without the loss.
+        log_freq: If set, `f` is a streamed function (see
+            `Model._make_streamed_test_function`), which returns nothing.
+            The loss and the metrics are then fetched with
+            `model._get_streamed_logs()` every `log_freq` batches and after
+            the last batch only.
 
     # Returns
         Scalar loss (if the model has a single output and no metrics)
         or list of scalars (if the model has multiple outputs
         and/or metrics). The attribute `model.metrics_names` will give you
         the display labels for the scalar outputs.
+        If `metrics_only` is `True`, the values of the metrics
+        of `model._get_metrics_only()`.
     """
 
     model.reset_metrics()
+    if metrics_only:
+        out_labels = [m.name for m in model._get_metrics_only()]
+        # All the outputs are streamed by their metric.
+        num_averaged = 0
+    elif log_freq:
+        out_labels = model.metrics_names
+        # The loss is averaged in a backend variable, like the metrics.
+        num_averaged = 0
+    else:
+        out_labels = model.metrics_names
+        # Index 0 == `Loss`, averaged over the batches.
+        num_averaged = 1
     num_samples = check_num_samples(ins,
                                     batch_size=batch_size,
                                     steps=steps,
@@ -376,7 +425,7 @@ def test_loop(model, f, ins,
         callbacks = cbks.CallbackList(callbacks)
         callback_model = model._get_callback_model()
         callbacks.set_model(callback_model)
-        callback_metrics = list(model.metrics_names)
+        callback_metrics = list(out_labels)
         callback_params = {
             'batch_size': batch_size,
             'steps': steps,
@@ -411,61 +460,106 @@ def test_loop(model, f, ins,
             batch_logs = {'batch': step, 'size': 1}
             callbacks._call_batch_hook('test', 'begin', step, batch_logs)
             batch_outs = f(ins)
-            if isinstance(batch_outs, list):
-                if step == 0:
-                    outs.extend([0.] * len(batch_outs))
-                for i, batch_out in enumerate(batch_outs):
-                    if i == 0:  # Index 0 == `Loss`
-                        outs[i] = float(batch_out)
-                    else:
-                        outs[i] += float(batch_out)
-            else:
-                if step == 0:
-                    outs.append(0.)
-                outs[0] += float(batch_outs)
-
-            for l, o in zip(model.metrics_names, batch_outs):
+            if log_freq and _should_fetch(step, steps, log_freq):
+                batch_outs = model._get_streamed_logs()
+            batch_outs = to_list(batch_outs)
+            if not outs:
+                outs.extend([0.] * len(batch_outs))
+            for i, batch_out in enumerate(batch_outs):
+                if i < num_averaged:
+                    outs[i] += float(batch_out)
+                else:
+                    outs[i] = float(batch_out)
+
+            for l, o in zip(out_labels, batch_outs):
                 batch_logs[l] = o
             callbacks._call_batch_hook('test', 'end', step, batch_logs)
 
             if verbose == 1:
                 progbar.update(step + 1)
-        outs[0] /= steps  # Index 0 == `Loss`
+        for i in range(num_averaged):
+            outs[i] /= steps
     else:
         batches = make_batches(num_samples, batch_size)
         index_array = np.arange(num_samples)
         for batch_index, (batch_start, batch_end) in enumerate(batches):
             batch_ids = index_array[batch_start:batch_end]
-            if isinstance(ins[-1], int):
-                # Do not slice the training phase flag.
-                ins_batch = slice_arrays(ins[:-1], batch_ids) + [ins[-1]]
-            else:
-                ins_batch = slice_arrays(ins, batch_ids)
+            ins_batch = _slice_batch(ins, batch_ids, batch_start, batch_end)
             for i in indices_for_conversion_to_dense:
                 ins_batch[i] = ins_batch[i].toarray()
 
             batch_logs = {'batch': batch_index, 'size': len(batch_ids)}
             callbacks._call_batch_hook('test', 'begin', batch_index, batch_logs)
             batch_outs = f(ins_batch)
-            if isinstance(batch_outs, list):
-                if batch_index == 0:
-                    outs.extend([0.] * len(batch_outs))
-                for i, batch_out in enumerate(batch_outs):
-                    if i == 0:  # Index 0 == `Loss`
-                        outs[i] += float(batch_out) * len(batch_ids)
-                    else:
-                        outs[i] = float(batch_out)
-            else:
-                if batch_index == 0:
-                    outs.append(0.)
-                outs[0] += float(batch_outs) * len(batch_ids)
-
-            for l, o in zip(model.metrics_names, batch_outs):
+            if log_freq and _should_fetch(batch_index, len(batches), log_freq):
+                batch_outs = model._get_streamed_logs()
+            batch_outs = to_list(batch_outs)
+            if not outs:
+                outs.extend([0.] * len(batch_outs))
+            for i, batch_out in enumerate(batch_outs):
+                if i < num_averaged:
+                    outs[i] += float(batch_out) * len(batch_ids)
+                else:
+                    outs[i] = float(batch_out)
+
+            for l, o in zip(out_labels, batch_outs):
                 batch_logs[l] = float(o)
             callbacks._call_batch_hook('test', 'end', batch_index, batch_logs)
 
             if verbose == 1:
                 progbar.update(batch_end)
-        outs[0] /= num_samples  # Index 0 == `Loss`
+        for i in range(num_averaged):
+            outs[i] /= num_samples
     callbacks._call_end_hook('test')
     return unpack_singleton(outs)
+
+
+def _should_fetch(batch_index, num_batches, log_freq):
+    """Checks if the streamed logs should be fetched after a batch.
+    """
+    return ((batch_index + 1) % log_freq == 0 or
+            batch_index + 1 == num_batches)
+
+
+def _permute_sparse(inputs, index_array):
+    """Permutes the rows of the sparse matrices of `inputs` once.
+
+    Indexing the rows of a sparse matrix is much slower than slicing
+    a contiguous range of rows, so the sparse matrices are shuffled once
+    per epoch, instead of indexing the rows of every batch.
+
+    # Arguments
+        inputs: List of arrays.
+        index_array: Permutation of the samples.
+
+    # Returns
+        The list of arrays, where the sparse matrices have their rows in
+        the order of `index_array`. The other arrays are left as is.
+    """
+    return [x[index_array] if issparse(x) else x for x in inputs]
+
+
+def _slice_batch(inputs, batch_ids, batch_start, batch_end):
+    """Slices a batch of samples out of `inputs`.
+
+    # Arguments
+        inputs: List of arrays, with their sparse matrices already in the
+            order of the samples of the batches (see `_permute_sparse`).
+        batch_ids: Indices of the samples of the batch.
+        batch_start: Position of the first sample of the batch.
+        batch_end: Position after the last sample of the batch.
+
+    # Returns
+        The list of arrays of the batch. The sparse matrices are sliced by
+        a contiguous range of rows, the other arrays by `batch_ids`.
+    """
+    if inputs and isinstance(inputs[-1], int):
+        # Do not slice the training phase flag.
+        return _slice_batch(inputs[:-1], batch_ids,
+                            batch_start, batch_end) + [inputs[-1]]
+    ins_batch = slice_arrays([None if issparse(x) else x for x in inputs],
+                             batch_ids)
+    for i, x in enumerate(inputs):
+        if issparse(x):
+            ins_batch[i] = x[batch_start:batch_end]
+    return ins_batch
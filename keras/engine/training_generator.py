@@ -4,8 +4,10 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import itertools
 import warnings
 import numpy as np
+from scipy.sparse import issparse
 
 from .training_utils import is_sequence
 from .training_utils import iter_sequence_infinite
@@ -14,6 +16,7 @@ from .. import backend as K
 from ..utils.data_utils import Sequence
 from ..utils.data_utils import GeneratorEnqueuer
 from ..utils.data_utils import OrderedEnqueuer
+from ..utils.data_utils import prefetch
 from ..utils.generic_utils import Progbar
 from ..utils.generic_utils import to_list
 from ..utils.generic_utils import unpack_singleton
@@ -109,6 +112,7 @@ def fit_generator(model,
 
     enqueuer = None
     val_enqueuer = None
+    batches = None
 
     try:
         if do_validation:
@@ -181,43 +185,16 @@ def fit_generator(model,
             callbacks.on_epoch_begin(epoch)
             steps_done = 0
             batch_index = 0
+            # The next batches are standardized while training on this one.
+            batches = prefetch(_standardize_batches(
+                model, output_generator, steps_per_epoch, class_weight))
             while steps_done < steps_per_epoch:
-                generator_output = next(output_generator)
-
-                if not hasattr(generator_output, '__len__'):
-                    raise ValueError('Output of generator should be '
-                                     'a tuple `(x, y, sample_weight)` '
-                                     'or `(x, y)`. Found: ' +
-                                     str(generator_output))
-
-                if len(generator_output) == 2:
-                    x, y = generator_output
-                    sample_weight = None
-                elif len(generator_output) == 3:
-                    x, y, sample_weight = generator_output
-                else:
-                    raise ValueError('Output of generator should be '
-                                     'a tuple `(x, y, sample_weight)` '
-                                     'or `(x, y)`. Found: ' +
-                                     str(generator_output))
-                if x is None or len(x) == 0:
-                    # Handle data tensors support when no input given
-                    # step-size = 1 for data tensors
-                    batch_size = 1
-                elif isinstance(x, list):
-                    batch_size = x[0].shape[0]
-                elif isinstance(x, dict):
-                    batch_size = list(x.values())[0].shape[0]
-                else:
-                    batch_size = x.shape[0]
+                batch_size, ins = next(batches)
                 # build batch logs
                 batch_logs = {'batch': batch_index, 'size': batch_size}
                 callbacks.on_batch_begin(batch_index, batch_logs)
 
-                outs = model.train_on_batch(x, y,
-                                            sample_weight=sample_weight,
-                                            class_weight=class_weight,
-                                            reset_metrics=False)
+                outs = model.train_function(ins)
 
                 outs = to_list(outs)
                 for l, o in zip(out_labels, outs):
@@ -257,6 +234,7 @@ def fit_generator(model,
                 if callbacks.model.stop_training:
                     break
 
+            batches.close()
             callbacks.on_epoch_end(epoch, epoch_logs)
             epoch += 1
             if callbacks.model.stop_training:
@@ -283,6 +261,8 @@ def fit_generator(model,
 
     finally:
         try:
+            if batches is not None:
+                batches.close()
             if enqueuer is not None:
                 enqueuer.stop()
         finally:
@@ -293,6 +273,79 @@ def fit_generator(model,
     return model.history
 
 
+def _standardize_batches(model, output_generator, steps, class_weight):
+    """Standardizes the batches of a generator for the train function.
+
+    This is the data preparation of `model.train_on_batch`, which
+    `fit_generator` runs in a background thread (see `prefetch`) while the
+    model trains on the current batch. The backend is only queried here,
+    in the calling thread: the background thread only runs the Numpy part
+    of the standardization (see `Model._standardize_arrays`) and the
+    densification of sparse inputs fed to dense placeholders.
+
+    # Arguments
+        model: Keras model instance, already built and compiled.
+        output_generator: Generator yielding tuples `(x, y)` or
+            `(x, y, sample_weight)`.
+        steps: Number of batches to take from `output_generator`.
+        class_weight: Optional dictionary mapping class indices to weights.
+
+    # Returns
+        A generator of tuples `(batch_size, ins)`, where `ins` is the list
+        of values to feed to `model.train_function`. It raises a
+        `ValueError` in case of invalid generator output.
+    """
+    feed = (model._feed_inputs +
+            model._feed_targets +
+            model._feed_sample_weights)
+    dense_indices = [i for i in range(len(feed)) if not K.is_sparse(feed[i])]
+    learning_phase = [1] if model._uses_dynamic_learning_phase() else []
+    return _standardize_batches_from(model, output_generator, steps,
+                                     class_weight, dense_indices,
+                                     learning_phase)
+
+
+def _standardize_batches_from(model, output_generator, steps, class_weight,
+                              dense_indices, learning_phase):
+    for generator_output in itertools.islice(output_generator, steps):
+        if not hasattr(generator_output, '__len__'):
+            raise ValueError('Output of generator should be '
+                             'a tuple `(x, y, sample_weight)` '
+                             'or `(x, y)`. Found: ' +
+                             str(generator_output))
+
+        if len(generator_output) == 2:
+            x, y = generator_output
+            sample_weight = None
+        elif len(generator_output) == 3:
+            x, y, sample_weight = generator_output
+        else:
+            raise ValueError('Output of generator should be '
+                             'a tuple `(x, y, sample_weight)` '
+                             'or `(x, y)`. Found: ' +
+                             str(generator_output))
+        if x is None or (not issparse(x) and len(x) == 0):
+            # Handle data tensors support when no input given
+            # step-size = 1 for data tensors
+            batch_size = 1
+        elif isinstance(x, list):
+            batch_size = x[0].shape[0]
+        elif isinstance(x, dict):
+            batch_size = list(x.values())[0].shape[0]
+        else:
+            batch_size = x.shape[0]
+
+        x, y, sample_weights = model._standardize_arrays(
+            x, y,
+            sample_weight=sample_weight,
+            class_weight=class_weight)
+        ins = x + y + sample_weights
+        for i in dense_indices:
+            if issparse(ins[i]):
+                ins[i] = ins[i].toarray()
+        yield batch_size, ins + learning_phase
+
+
 def evaluate_generator(model, generator,
                        steps=None,
                        callbacks=None,
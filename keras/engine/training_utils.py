@@ -6,6 +6,7 @@ from __future__ import print_function
 
 import inspect
 import collections
+import numbers
 import copy
 import numpy as np
 import six
@@ -642,6 +643,34 @@ def should_run_validation(validation_freq, epoch):
     return one_indexed_epoch in validation_freq
 
 
+def should_stream_logs(log_freq, callbacks):
+    """Checks if the logs of the batches can be fetched every few batches.
+
+    This is the case if `log_freq` is set and none of `callbacks` needs the
+    logs of every batch (see `Callback.needs_batch_logs`).
+
+    # Arguments
+        log_freq: Integer or `None`, number of batches between two fetches
+            of the loss and the metrics.
+        callbacks: List of callbacks or `None`.
+
+    # Returns
+        Bool, True if the loss and the metrics should be accumulated in
+        backend variables and fetched every `log_freq` batches.
+
+    # Raises
+        ValueError: if `log_freq` is not `None` and not a positive integer.
+    """
+    if log_freq is None:
+        return False
+    if (not isinstance(log_freq, numbers.Integral) or
+            isinstance(log_freq, bool) or log_freq < 1):
+        raise ValueError('`log_freq` should be a positive integer, '
+                         'got: ' + str(log_freq))
+    return not any(getattr(cbk, 'needs_batch_logs', True)
+                   for cbk in callbacks or [])
+
+
 def get_static_batch_size(layer):
     """Gets the static batch size of a Layer.
 
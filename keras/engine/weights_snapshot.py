@@ -0,0 +1,122 @@
+"""In-memory snapshots of the weights of models.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from .. import backend as K
+
+
+class WeightsSnapshot(object):
+    """Copy of a list of weights, kept in backend-side shadow variables.
+
+    The shadow variables are allocated once, when the snapshot is created.
+    Saving and restoring the snapshot then run a single backend function
+    each, which copies all the weights at once without going through
+    Numpy arrays (unlike `model.get_weights()` / `model.set_weights()`,
+    which allocate a new copy of the model on the host every time).
+
+    The snapshot can also hold an exponential moving average of the
+    weights, see `average()`.
+
+    # Arguments
+        weights: List of variables to snapshot.
+        name: Prefix of the names of the shadow variables.
+
+    # Example
+
+    ```python
+        snapshot = WeightsSnapshot(model.weights)
+        snapshot.save()
+        model.fit(x, y)
+        snapshot.restore()  # The weights from before `fit`.
+    ```
+    """
+
+    def __init__(self, weights, name='snapshot'):
+        self.weights = list(weights)
+        self.shadows = []
+        for i, w in enumerate(self.weights):
+            self.shadows.append(K.zeros(K.int_shape(w), dtype=K.dtype(w),
+                                        name='%s_%d' % (name, i)))
+        self._save_function = None
+        self._restore_function = None
+        self._average_functions = {}
+
+    def save(self):
+        """Copies the current values of the weights into the snapshot.
+        """
+        if self._save_function is None:
+            self._save_function = K.function(
+                [], [], updates=list(zip(self.shadows, self.weights)),
+                name='save_snapshot')
+        self._save_function([])
+
+    def restore(self):
+        """Sets the weights to the values stored in the snapshot.
+        """
+        if self._restore_function is None:
+            self._restore_function = K.function(
+                [], [], updates=list(zip(self.weights, self.shadows)),
+                name='restore_snapshot')
+        self._restore_function([])
+
+    def average(self, decay):
+        """Updates the snapshot with an exponential moving average step.
+
+        Each shadow variable `s` of a weight `w` is set to
+        `decay * s + (1 - decay) * w`.
+
+        # Arguments
+            decay: Float between 0 and 1, decay rate of the average.
+        """
+        function = self._average_functions.get(decay)
+        if function is None:
+            function = K.function([], [], updates=self.average_updates(decay),
+                                  name='average_snapshot')
+            self._average_functions[decay] = function
+        function([])
+
+    def average_updates(self, decay, after=None):
+        """Returns the update ops of an exponential moving average step.
+
+        They can be added to the updates of another backend function (e.g.
+        the train function of a model), to update the average at every call
+        of that function, see `average()`.
+
+        # Arguments
+            decay: Float between 0 and 1, decay rate of the average.
+            after: Optional list of updates of the weights run by the same
+                backend function (e.g. the updates of an optimizer). The
+                average then uses the values of the weights after these
+                updates.
+
+        # Returns
+            A list of update tuples `(shadow_variable, new_value)`.
+        """
+        # Updates given as tuples (Theano, NumPy) are all applied at once
+        # at the end of the function, so their new values are used
+        # directly. The other ones are ops, run before reading the weights.
+        new_values = {}
+        ops = []
+        for update in after or []:
+            if isinstance(update, (list, tuple)):
+                new_values[id(update[0])] = update[1]
+            else:
+                ops.append(update)
+        updates = []
+        with K.control_dependencies(ops):
+            for s, w in zip(self.shadows, self.weights):
+                value = new_values.get(id(w))
+                if value is None:
+                    value = K.identity(w) if ops else w
+                updates.append((s, decay * s + (1. - decay) * value))
+        return updates
+
+    def get_values(self):
+        """Returns the values stored in the snapshot.
+
+        # Returns
+            A list of Numpy arrays, in the order of `weights`.
+        """
+        return K.batch_get_value(self.shadows)
@@ -2468,7 +2468,7 @@ class CompactBilinearPooling(Layer):
         if self.conv_type == 'conv':
             for i in range(self.nmodes):
                 v[i] = K.count_sketch(self.h[i], self.s[i], x[i], self.d)
-            out = K.conv1d(v[0], v[1])
+            out = K.scan_conv1d(v[0], v[1])
 
         elif self.conv_type == 'fft':
             raise NotImplementedError()
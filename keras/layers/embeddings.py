@@ -141,6 +141,11 @@ class Embedding(Layer):
     def call(self, inputs):
         if K.dtype(inputs) != 'int32':
             inputs = K.cast(inputs, 'int32')
+        if 'embeddings' in self._quantized_weights:
+            # Only dequantizes the gathered rows.
+            values, scales = self._quantized_weights['embeddings']
+            return (K.cast(K.gather(values, inputs), self.dtype) *
+                    K.gather(scales, inputs))
         out = K.gather(self.embeddings, inputs)
         return out
 
@@ -87,8 +87,8 @@ class Scale(Layer):
                  gamma_init='one', **kwargs):
         self.momentum = momentum
         self.axis = axis
-        self.beta_init = initializations.get(beta_init)
-        self.gamma_init = initializations.get(gamma_init)
+        self.beta_init = initializers.get(beta_init)
+        self.gamma_init = initializers.get(gamma_init)
         self.initial_weights = weights
         super(Scale, self).__init__(**kwargs)
 
@@ -96,13 +96,17 @@ class Scale(Layer):
         self.input_spec = [InputSpec(shape=input_shape)]
         shape = (input_shape[self.axis],)
 
-        self.gamma = self.gamma_init(shape, name='{}_gamma'.format(self.name))
-        self.beta = self.beta_init(shape, name='{}_beta'.format(self.name))
-        self.trainable_weights = [self.gamma, self.beta]
+        self.gamma = self.add_weight(shape=shape,
+                                     name='gamma',
+                                     initializer=self.gamma_init)
+        self.beta = self.add_weight(shape=shape,
+                                    name='beta',
+                                    initializer=self.beta_init)
 
         if self.initial_weights is not None:
             self.set_weights(self.initial_weights)
             del self.initial_weights
+        self.built = True
 
     def call(self, x, mask=None):
         input_shape = self.input_spec[0].shape
@@ -113,7 +117,8 @@ class Scale(Layer):
         return out
 
     def get_config(self):
-        config = {"momentum": self.momentum}
+        config = {"momentum": self.momentum,
+                  "axis": self.axis}
         base_config = super(Scale, self).get_config()
         return dict(list(base_config.items()) + list(config.items()))
 
@@ -383,3 +388,142 @@ class BatchNormalization(Layer):
 
     def compute_output_shape(self, input_shape):
         return input_shape
+
+
+class LayerNormalization(Layer):
+    """Layer normalization layer (Ba et al., 2016).
+
+    Normalizes the activations of the previous layer for each sample
+    independently (rather than across a batch like `BatchNormalization`),
+    i.e. applies a transformation that maintains the mean activation of
+    every sample close to 0 and its standard deviation close to 1.
+
+    The normalization is computed by the fused `K.layer_normalization`
+    backend op, which does not materialize the intermediate tensors of a
+    `K.mean` / `K.var` composition.
+
+    # Arguments
+        axis: Integer or list of integers, the axes that should be
+            normalized (typically the features axis).
+        epsilon: Small float added to variance to avoid dividing by zero.
+        center: If True, add offset of `beta` to normalized tensor.
+            If False, `beta` is ignored.
+        scale: If True, multiply by `gamma`.
+            If False, `gamma` is not used.
+        beta_initializer: Initializer for the beta weight.
+        gamma_initializer: Initializer for the gamma weight.
+        beta_regularizer: Optional regularizer for the beta weight.
+        gamma_regularizer: Optional regularizer for the gamma weight.
+        beta_constraint: Optional constraint for the beta weight.
+        gamma_constraint: Optional constraint for the gamma weight.
+
+    # Input shape
+        Arbitrary. Use the keyword argument `input_shape`
+        (tuple of integers, does not include the samples axis)
+        when using this layer as the first layer in a model.
+
+    # Output shape
+        Same shape as input.
+
+    # References
+        - [Layer Normalization](https://arxiv.org/abs/1607.06450)
+    """
+
+    def __init__(self,
+                 axis=-1,
+                 epsilon=1e-3,
+                 center=True,
+                 scale=True,
+                 beta_initializer='zeros',
+                 gamma_initializer='ones',
+                 beta_regularizer=None,
+                 gamma_regularizer=None,
+                 beta_constraint=None,
+                 gamma_constraint=None,
+                 **kwargs):
+        super(LayerNormalization, self).__init__(**kwargs)
+        self.supports_masking = True
+        if isinstance(axis, (list, tuple)):
+            self.axis = list(axis)
+        else:
+            self.axis = axis
+        self.epsilon = epsilon
+        self.center = center
+        self.scale = scale
+        self.beta_initializer = initializers.get(beta_initializer)
+        self.gamma_initializer = initializers.get(gamma_initializer)
+        self.beta_regularizer = regularizers.get(beta_regularizer)
+        self.gamma_regularizer = regularizers.get(gamma_regularizer)
+        self.beta_constraint = constraints.get(beta_constraint)
+        self.gamma_constraint = constraints.get(gamma_constraint)
+
+    def build(self, input_shape):
+        ndim = len(input_shape)
+        if isinstance(self.axis, list):
+            axes = [axis % ndim for axis in self.axis]
+        else:
+            axes = [self.axis % ndim]
+        for axis in axes:
+            if input_shape[axis] is None:
+                raise ValueError('Axis ' + str(axis) + ' of '
+                                 'input tensor should have a defined dimension '
+                                 'but the layer received an input with shape ' +
+                                 str(input_shape) + '.')
+        self.input_spec = InputSpec(ndim=ndim,
+                                    axes={axis: input_shape[axis]
+                                          for axis in axes})
+        shape = tuple(input_shape[axis] for axis in sorted(axes))
+
+        if self.scale:
+            self.gamma = self.add_weight(shape=shape,
+                                         name='gamma',
+                                         initializer=self.gamma_initializer,
+                                         regularizer=self.gamma_regularizer,
+                                         constraint=self.gamma_constraint)
+        else:
+            self.gamma = None
+        if self.center:
+            self.beta = self.add_weight(shape=shape,
+                                        name='beta',
+                                        initializer=self.beta_initializer,
+                                        regularizer=self.beta_regularizer,
+                                        constraint=self.beta_constraint)
+        else:
+            self.beta = None
+        self.built = True
+
+    def call(self, inputs, training=None):
+        gamma = self.gamma
+        beta = self.beta
+        ndim = K.ndim(inputs)
+        axes = sorted(axis % ndim for axis in self.input_spec.axes)
+        if axes != list(range(ndim - len(axes), ndim)):
+            # The weights need to be reshaped to broadcast.
+            broadcast_shape = [1] * ndim
+            for axis in axes:
+                broadcast_shape[axis] = self.input_spec.axes[axis]
+            if self.scale:
+                gamma = K.reshape(gamma, broadcast_shape)
+            if self.center:
+                beta = K.reshape(beta, broadcast_shape)
+        return K.layer_normalization(inputs, gamma, beta,
+                                     axis=axes, epsilon=self.epsilon)
+
+    def get_config(self):
+        config = {
+            'axis': self.axis,
+            'epsilon': self.epsilon,
+            'center': self.center,
+            'scale': self.scale,
+            'beta_initializer': initializers.serialize(self.beta_initializer),
+            'gamma_initializer': initializers.serialize(self.gamma_initializer),
+            'beta_regularizer': regularizers.serialize(self.beta_regularizer),
+            'gamma_regularizer': regularizers.serialize(self.gamma_regularizer),
+            'beta_constraint': constraints.serialize(self.beta_constraint),
+            'gamma_constraint': constraints.serialize(self.gamma_constraint)
+        }
+        base_config = super(LayerNormalization, self).get_config()
+        return dict(list(base_config.items()) + list(config.items()))
+
+    def compute_output_shape(self, input_shape):
+        return input_shape
@@ -409,6 +409,11 @@ class RNN(Layer):
                              'one integer per RNN state).')
         super(RNN, self).__init__(**kwargs)
         self._set_cell(cell)
+        if self.weight_quantization:
+            # The weights are those of the cells.
+            cells = cell.cells if isinstance(cell, StackedRNNCells) else [cell]
+            for c in cells:
+                c.weight_quantization = self.weight_quantization
         self.return_sequences = return_sequences
         self.return_state = return_state
         self.go_backwards = go_backwards
@@ -1247,6 +1252,12 @@ class GRUCell(Layer):
             batch them into fewer, larger operations. These modes will
             have different performance profiles on different hardware and
             for different applications.
+        layer_normalization: Boolean (default False). If True, the
+            projections of the inputs and of the hidden state are
+            layer-normalized separately for every gate
+            (see [Layer Normalization](https://arxiv.org/abs/1607.06450)),
+            and the bias is added after the normalization. The
+            `implementation` mode is then ignored.
         reset_after: GRU convention (whether to apply reset gate after or
             before matrix multiplication). False = "before" (default),
             True = "after" (CuDNN compatible).
@@ -1269,6 +1280,7 @@ class GRUCell(Layer):
                  recurrent_dropout=0.,
                  implementation=2,
                  reset_after=False,
+                 layer_normalization=False,
                  **kwargs):
         super(GRUCell, self).__init__(**kwargs)
         self.units = units
@@ -1292,6 +1304,7 @@ class GRUCell(Layer):
         self.recurrent_dropout = min(1., max(0., recurrent_dropout))
         self.implementation = implementation
         self.reset_after = reset_after
+        self.layer_normalization = layer_normalization
         self.state_size = self.units
         self.output_size = self.units
         self._dropout_mask = None
@@ -1374,6 +1387,14 @@ class GRUCell(Layer):
                 self.recurrent_bias_z = None
                 self.recurrent_bias_r = None
                 self.recurrent_bias_h = None
+
+        if self.layer_normalization:
+            self.input_gamma = self.add_weight(shape=(3, self.units),
+                                               name='input_gamma',
+                                               initializer='ones')
+            self.recurrent_gamma = self.add_weight(shape=(3, self.units),
+                                                   name='recurrent_gamma',
+                                                   initializer='ones')
         self.built = True
 
     def call(self, inputs, states, training=None):
@@ -1398,7 +1419,45 @@ class GRUCell(Layer):
         # dropout matrices for recurrent units
         rec_dp_mask = self._recurrent_dropout_mask
 
-        if self.implementation == 1:
+        if self.layer_normalization:
+            if 0. < self.dropout < 1.:
+                inputs *= dp_mask[0]
+            # The projections of the inputs and of the hidden state are
+            # normalized separately, before adding the biases.
+            matrix_x = _layer_normalize_gates(K.dot(inputs, self.kernel),
+                                              self.input_gamma)
+            if self.use_bias:
+                matrix_x = K.bias_add(matrix_x, self.input_bias)
+            x_z = matrix_x[:, :self.units]
+            x_r = matrix_x[:, self.units: 2 * self.units]
+            x_h = matrix_x[:, 2 * self.units:]
+
+            if 0. < self.recurrent_dropout < 1.:
+                h_tm1 *= rec_dp_mask[0]
+
+            if self.reset_after:
+                matrix_inner = _layer_normalize_gates(
+                    K.dot(h_tm1, self.recurrent_kernel), self.recurrent_gamma)
+                if self.use_bias:
+                    matrix_inner = K.bias_add(matrix_inner, self.recurrent_bias)
+            else:
+                matrix_inner = _layer_normalize_gates(
+                    K.dot(h_tm1, self.recurrent_kernel[:, :2 * self.units]),
+                    self.recurrent_gamma[:2])
+
+            z = self.recurrent_activation(x_z + matrix_inner[:, :self.units])
+            r = self.recurrent_activation(
+                x_r + matrix_inner[:, self.units: 2 * self.units])
+
+            if self.reset_after:
+                recurrent_h = r * matrix_inner[:, 2 * self.units:]
+            else:
+                recurrent_h = K.layer_normalization(
+                    K.dot(r * h_tm1, self.recurrent_kernel[:, 2 * self.units:]),
+                    self.recurrent_gamma[2])
+
+            hh = self.activation(x_h + recurrent_h)
+        elif self.implementation == 1:
             if 0. < self.dropout < 1.:
                 inputs_z = inputs * dp_mask[0]
                 inputs_r = inputs * dp_mask[1]
@@ -1517,6 +1576,8 @@ class GRUCell(Layer):
                   'recurrent_dropout': self.recurrent_dropout,
                   'implementation': self.implementation,
                   'reset_after': self.reset_after}
+        if self.layer_normalization:
+            config['layer_normalization'] = True
         base_config = super(GRUCell, self).get_config()
         return dict(list(base_config.items()) + list(config.items()))
 
@@ -1587,6 +1648,12 @@ class GRU(RNN):
             batch them into fewer, larger operations. These modes will
             have different performance profiles on different hardware and
             for different applications.
+        layer_normalization: Boolean (default False). If True, the
+            projections of the inputs and of the hidden state are
+            layer-normalized separately for every gate
+            (see [Layer Normalization](https://arxiv.org/abs/1607.06450)),
+            and the bias is added after the normalization. The
+            `implementation` mode is then ignored.
         return_sequences: Boolean. Whether to return the last output
             in the output sequence, or the full sequence.
         return_state: Boolean. Whether to return the last state
@@ -1642,6 +1709,7 @@ class GRU(RNN):
                  stateful=False,
                  unroll=False,
                  reset_after=False,
+                 layer_normalization=False,
                  **kwargs):
         if implementation == 0:
             warnings.warn('`implementation=0` has been deprecated, '
@@ -1672,7 +1740,8 @@ class GRU(RNN):
                        dropout=dropout,
                        recurrent_dropout=recurrent_dropout,
                        implementation=implementation,
-                       reset_after=reset_after)
+                       reset_after=reset_after,
+                       layer_normalization=layer_normalization)
         super(GRU, self).__init__(cell,
                                   return_sequences=return_sequences,
                                   return_state=return_state,
@@ -1758,6 +1827,10 @@ class GRU(RNN):
     def reset_after(self):
         return self.cell.reset_after
 
+    @property
+    def layer_normalization(self):
+        return self.cell.layer_normalization
+
     def get_config(self):
         config = {'units': self.units,
                   'activation': activations.serialize(self.activation),
@@ -1784,6 +1857,8 @@ class GRU(RNN):
                   'recurrent_dropout': self.recurrent_dropout,
                   'implementation': self.implementation,
                   'reset_after': self.reset_after}
+        if self.layer_normalization:
+            config['layer_normalization'] = True
         base_config = super(GRU, self).get_config()
         del base_config['cell']
         return dict(list(base_config.items()) + list(config.items()))
@@ -1854,6 +1929,13 @@ class LSTMCell(Layer):
             batch them into fewer, larger operations. These modes will
             have different performance profiles on different hardware and
             for different applications.
+        layer_normalization: Boolean (default False). If True, the
+            projections of the inputs and of the hidden state are
+            layer-normalized separately for every gate, as in the GRU
+            (see [Layer Normalization](https://arxiv.org/abs/1607.06450)),
+            and the bias is added after the normalization. The cell
+            state is also normalized before the output activation. The
+            `implementation` mode is then ignored.
     """
 
     def __init__(self, units,
@@ -1873,6 +1955,7 @@ class LSTMCell(Layer):
                  dropout=0.,
                  recurrent_dropout=0.,
                  implementation=2,
+                 layer_normalization=False,
                  **kwargs):
         super(LSTMCell, self).__init__(**kwargs)
         self.units = units
@@ -1896,6 +1979,7 @@ class LSTMCell(Layer):
         self.dropout = min(1., max(0., dropout))
         self.recurrent_dropout = min(1., max(0., recurrent_dropout))
         self.implementation = implementation
+        self.layer_normalization = layer_normalization
         self.state_size = (self.units, self.units)
         self.output_size = self.units
         self._dropout_mask = None
@@ -1965,6 +2049,20 @@ class LSTMCell(Layer):
             self.bias_f = None
             self.bias_c = None
             self.bias_o = None
+
+        if self.layer_normalization:
+            self.input_gamma = self.add_weight(shape=(4, self.units),
+                                               name='input_gamma',
+                                               initializer='ones')
+            self.recurrent_gamma = self.add_weight(shape=(4, self.units),
+                                                   name='recurrent_gamma',
+                                                   initializer='ones')
+            self.cell_gamma = self.add_weight(shape=(self.units,),
+                                              name='cell_gamma',
+                                              initializer='ones')
+            self.cell_beta = self.add_weight(shape=(self.units,),
+                                             name='cell_beta',
+                                             initializer='zeros')
         self.built = True
 
     def call(self, inputs, states, training=None):
@@ -1990,7 +2088,26 @@ class LSTMCell(Layer):
         h_tm1 = states[0]  # previous memory state
         c_tm1 = states[1]  # previous carry state
 
-        if self.implementation == 1:
+        if self.layer_normalization:
+            if 0. < self.dropout < 1.:
+                inputs *= dp_mask[0]
+            if 0. < self.recurrent_dropout < 1.:
+                h_tm1 *= rec_dp_mask[0]
+            # The projections of the inputs and of the hidden state are
+            # normalized separately, before adding the bias (as in GRUCell).
+            z = (_layer_normalize_gates(K.dot(inputs, self.kernel),
+                                        self.input_gamma) +
+                 _layer_normalize_gates(K.dot(h_tm1, self.recurrent_kernel),
+                                        self.recurrent_gamma))
+            if self.use_bias:
+                z = K.bias_add(z, self.bias)
+
+            i = self.recurrent_activation(z[:, :self.units])
+            f = self.recurrent_activation(z[:, self.units: 2 * self.units])
+            c = f * c_tm1 + i * self.activation(
+                z[:, 2 * self.units: 3 * self.units])
+            o = self.recurrent_activation(z[:, 3 * self.units:])
+        elif self.implementation == 1:
             if 0 < self.dropout < 1.:
                 inputs_i = inputs * dp_mask[0]
                 inputs_f = inputs * dp_mask[1]
@@ -2049,7 +2166,11 @@ class LSTMCell(Layer):
             c = f * c_tm1 + i * self.activation(z2)
             o = self.recurrent_activation(z3)
 
-        h = o * self.activation(c)
+        if self.layer_normalization:
+            h = o * self.activation(K.layer_normalization(c, self.cell_gamma,
+                                                          self.cell_beta))
+        else:
+            h = o * self.activation(c)
         if 0 < self.dropout + self.recurrent_dropout:
             if training is None:
                 h._uses_learning_phase = True
@@ -2079,6 +2200,8 @@ class LSTMCell(Layer):
                   'dropout': self.dropout,
                   'recurrent_dropout': self.recurrent_dropout,
                   'implementation': self.implementation}
+        if self.layer_normalization:
+            config['layer_normalization'] = True
         base_config = super(LSTMCell, self).get_config()
         return dict(list(base_config.items()) + list(config.items()))
 
@@ -2145,6 +2268,13 @@ class LSTM(RNN):
             batch them into fewer, larger operations. These modes will
             have different performance profiles on different hardware and
             for different applications.
+        layer_normalization: Boolean (default False). If True, the
+            projections of the inputs and of the hidden state are
+            layer-normalized separately for every gate, as in the GRU
+            (see [Layer Normalization](https://arxiv.org/abs/1607.06450)),
+            and the bias is added after the normalization. The cell
+            state is also normalized before the output activation. The
+            `implementation` mode is then ignored.
         return_sequences: Boolean. Whether to return the last output
             in the output sequence, or the full sequence.
         return_state: Boolean. Whether to return the last state
@@ -2193,6 +2323,7 @@ class LSTM(RNN):
                  dropout=0.,
                  recurrent_dropout=0.,
                  implementation=2,
+                 layer_normalization=False,
                  return_sequences=False,
                  return_state=False,
                  go_backwards=False,
@@ -2228,7 +2359,8 @@ class LSTM(RNN):
                         bias_constraint=bias_constraint,
                         dropout=dropout,
                         recurrent_dropout=recurrent_dropout,
-                        implementation=implementation)
+                        implementation=implementation,
+                        layer_normalization=layer_normalization)
         super(LSTM, self).__init__(cell,
                                    return_sequences=return_sequences,
                                    return_state=return_state,
@@ -2314,6 +2446,10 @@ class LSTM(RNN):
     def implementation(self):
         return self.cell.implementation
 
+    @property
+    def layer_normalization(self):
+        return self.cell.layer_normalization
+
     def get_config(self):
         config = {'units': self.units,
                   'activation': activations.serialize(self.activation),
@@ -2340,6 +2476,8 @@ class LSTM(RNN):
                   'dropout': self.dropout,
                   'recurrent_dropout': self.recurrent_dropout,
                   'implementation': self.implementation}
+        if self.layer_normalization:
+            config['layer_normalization'] = True
         base_config = super(LSTM, self).get_config()
         del base_config['cell']
         return dict(list(base_config.items()) + list(config.items()))
@@ -2351,6 +2489,22 @@ class LSTM(RNN):
         return cls(**config)
 
 
+def _layer_normalize_gates(x, gamma):
+    """Layer-normalizes the pre-activations of every gate separately.
+
+    # Arguments
+        x: Tensor of shape `(samples, num_gates * units)`.
+        gamma: Scale of shape `(num_gates, units)`.
+
+    # Returns
+        The normalized tensor, of the same shape as `x`.
+    """
+    num_gates, units = K.int_shape(gamma)
+    x = K.reshape(x, (-1, num_gates, units))
+    x = K.layer_normalization(x, gamma)
+    return K.reshape(x, (-1, num_gates * units))
+
+
 def _generate_dropout_mask(ones, rate, training=None, count=1):
     def dropped_inputs():
         return K.dropout(ones, rate)
@@ -3810,10 +3810,16 @@ class AttLSTMCond(Recurrent):
 
     def _ln(self, x, slc):
         # sample-wise normalization
+        # Kept as is rather than using K.layer_normalization, which computes
+        # (x - m) / sqrt(var + eps): epsilon is also added to the standard
+        # deviation here, and changing it would change the outputs of
+        # trained models.
         m = K.mean(x, axis=-1, keepdims=True)
-        std = K.sqrt(K.var(x, axis=-1, keepdims=True) + self.epsilon_layer_normalization)
+        std = K.sqrt(K.var(x, axis=-1, keepdims=True) +
+                     self.epsilon_layer_normalization)
         x_normed = (x - m) / (std + self.epsilon_layer_normalization)
-        x_normed = eval('self.gamma_' + slc) * x_normed + eval('self.beta_' + slc)
+        x_normed = (getattr(self, 'gamma_' + slc) * x_normed +
+                    getattr(self, 'beta_' + slc))
         return x_normed
 
     def call(self, inputs, mask=None, training=None, initial_state=None):
@@ -8,6 +8,7 @@ import abc
 import numpy as np
 import six
 import types
+import sys
 
 from . import backend as K
 from .layers import Layer
@@ -1841,51 +1842,66 @@ class AUC(Metric):
         return dict(list(base_config.items()) + list(config.items()))
 
 
-BaseMeanIoU = object
-if K.backend() == 'tensorflow':
-    import tensorflow as tf
+def _mean_iou_class():
+    # `MeanIoU` wraps the TensorFlow metric, so it is only defined when
+    # first needed, to avoid importing TensorFlow when Keras is imported.
+    base_class = object
+    if K.backend() == 'tensorflow':
+        import tensorflow as tf
 
-    if tf.__version__ >= '2.0.0':
-        BaseMeanIoU = tf.keras.metrics.MeanIoU
+        if tf.__version__ >= '2.0.0':
+            base_class = tf.keras.metrics.MeanIoU
 
+    class MeanIoU(base_class):
+        """Computes the mean Intersection-Over-Union metric.
 
-class MeanIoU(BaseMeanIoU):
-    """Computes the mean Intersection-Over-Union metric.
+        Mean Intersection-Over-Union is a common evaluation metric for semantic image
+        segmentation, which first computes the IOU for each semantic class and then
+        computes the average over classes. IOU is defined as follows:
+        IOU = true_positive / (true_positive + false_positive + false_negative).
+        The predictions are accumulated in a confusion matrix, weighted by
+        `sample_weight` and the metric is then calculated from it.
 
-    Mean Intersection-Over-Union is a common evaluation metric for semantic image
-    segmentation, which first computes the IOU for each semantic class and then
-    computes the average over classes. IOU is defined as follows:
-    IOU = true_positive / (true_positive + false_positive + false_negative).
-    The predictions are accumulated in a confusion matrix, weighted by
-    `sample_weight` and the metric is then calculated from it.
+        If `sample_weight` is `None`, weights default to 1.
+        Use `sample_weight` of 0 to mask values.
 
-    If `sample_weight` is `None`, weights default to 1.
-    Use `sample_weight` of 0 to mask values.
+        Usage with the compile API:
 
-    Usage with the compile API:
+        ```python
+        model = keras.Model(inputs, outputs)
+        model.compile(
+            'sgd',
+            loss='mse',
+            metrics=[keras.metrics.MeanIoU(num_classes=2)])
+        ```
 
-    ```python
-    model = keras.Model(inputs, outputs)
-    model.compile(
-        'sgd',
-        loss='mse',
-        metrics=[keras.metrics.MeanIoU(num_classes=2)])
-    ```
+        # Arguments
+            num_classes: The possible number of labels the prediction task can have.
+                This value must be provided, since a confusion matrix of dimension =
+                [num_classes, num_classes] will be allocated.
+            name: (Optional) string name of the metric instance.
+            dtype: (Optional) data type of the metric result.
+        """
 
-    # Arguments
-        num_classes: The possible number of labels the prediction task can have.
-            This value must be provided, since a confusion matrix of dimension =
-            [num_classes, num_classes] will be allocated.
-        name: (Optional) string name of the metric instance.
-        dtype: (Optional) data type of the metric result.
-    """
+        def __init__(self, num_classes, name=None, dtype=None):
+            if K.backend() != 'tensorflow' or base_class is object:
+                raise RuntimeError(
+                    '`MeanIoU` metric is currently supported only '
+                    'with TensorFlow backend and TF version >= 2.0.0.')
+            super(MeanIoU, self).__init__(num_classes, name=name, dtype=dtype)
 
-    def __init__(self, num_classes, name=None, dtype=None):
-        if K.backend() != 'tensorflow' or BaseMeanIoU is object:
-            raise RuntimeError(
-                '`MeanIoU` metric is currently supported only '
-                'with TensorFlow backend and TF version >= 2.0.0.')
-        super(MeanIoU, self).__init__(num_classes, name=name, dtype=dtype)
+    return MeanIoU
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name == 'MeanIoU':
+            globals()['MeanIoU'] = _mean_iou_class()
+            return globals()['MeanIoU']
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+else:
+    MeanIoU = _mean_iou_class()
 
 
 def accuracy(y_true, y_pred):
@@ -1977,6 +1993,8 @@ def serialize(metric):
 
 
 def deserialize(config, custom_objects=None):
+    if 'MeanIoU' not in globals():
+        __getattr__('MeanIoU')
     return deserialize_keras_object(config,
                                     module_objects=globals(),
                                     custom_objects=custom_objects,
@@ -4,6 +4,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy as np
+
+from . import activations
 from . import backend as K
 from .utils.generic_utils import has_arg
 from .utils.generic_utils import to_list
@@ -11,6 +14,7 @@ from .engine.input_layer import Input
 from .engine.input_layer import InputLayer
 from .engine.training import Model
 from .engine.sequential import Sequential
+from .engine import saving
 from .engine.saving import save_model
 from .engine.saving import load_model
 from .engine.saving import model_from_config
@@ -255,3 +259,324 @@ def clone_model(model, input_tensors=None):
         return _clone_sequential_model(model, input_tensors=input_tensors)
     else:
         return _clone_functional_model(model, input_tensors=input_tensors)
+
+
+def _channel_axis(layer, ndim):
+    """Returns the axis of the output channels of `layer`, in `[0, ndim)`.
+    """
+    if getattr(layer, 'data_format', 'channels_last') == 'channels_first':
+        return 1
+    return ndim - 1
+
+
+def _fold_affine(layer, weights, scale, shift):
+    """Folds `x * scale + shift` into the weights of `layer`.
+
+    # Arguments
+        layer: The layer whose outputs are scaled
+            (`Dense`, convolution or `BatchNormalization`).
+        weights: List of Numpy arrays, the weights of `layer`, with a bias.
+        scale: Numpy array of the per-channel scale.
+        shift: Numpy array of the per-channel shift.
+
+    # Returns
+        The list of the folded weights.
+    """
+    from .layers import convolutional
+    from .layers import normalization
+
+    weights = list(weights)
+    if isinstance(layer, normalization.BatchNormalization):
+        # The moving statistics are kept, only gamma and beta change.
+        gamma, beta = weights[:2]
+        return [gamma * scale, beta * scale + shift] + weights[2:]
+    if isinstance(layer, convolutional.DepthwiseConv2D):
+        # Output channel `c * depth_multiplier + m` comes from
+        # `depthwise_kernel[..., c, m]`.
+        kernel = weights[0]
+        weights[0] = kernel * scale.reshape(kernel.shape[-2:])
+    else:
+        # The output channels are the last axis of the (pointwise) kernel.
+        weights[-2] = weights[-2] * scale
+    weights[-1] = weights[-1] * scale + shift
+    return weights
+
+
+def _affine_params(layer):
+    """Returns the per-channel `(scale, shift)` applied by `layer` at inference.
+    """
+    from .layers import normalization
+
+    weights = layer.get_weights()
+    if isinstance(layer, normalization.Scale):
+        return weights[0], weights[1]
+    mean, variance = weights[-2:]
+    gamma = weights[0] if layer.scale else np.ones_like(mean)
+    beta = weights[int(layer.scale)] if layer.center else np.zeros_like(mean)
+    scale = gamma / np.sqrt(variance + layer.epsilon)
+    return scale, beta - mean * scale
+
+
+def optimize_for_inference(model):
+    """Returns an inference-only copy of `model`, with fewer layers.
+
+    The returned model computes the same outputs as `model` in the test
+    phase (up to floating point errors), with the same weights, but:
+
+    - `Dropout`, `SpatialDropout*`, `GaussianNoise`, `GaussianDropout` and
+        `AlphaDropout` layers, which are identities at inference,
+        are removed.
+    - `BatchNormalization` (using its moving statistics) and `Scale`
+        layers are folded into the kernel and the bias of the preceding
+        `Dense`, convolution or `BatchNormalization` layer, when that
+        layer has a linear activation and its output is not used by any
+        other layer.
+    - Two consecutive `Dense` layers are merged in one when the first one
+        is linear and the merged kernel is not larger than the two kernels.
+
+    The new model can not be trained (its layers are not equivalent to
+    the original ones in the training phase), only used for prediction.
+
+    # Arguments
+        model: Instance of `Model` (functional or `Sequential`).
+
+    # Returns
+        A functional `Model` instance.
+
+    # Raises
+        ValueError: in case of invalid `model` argument value.
+    """
+    from .layers import convolutional
+    from .layers import core
+    from .layers import noise
+    from .layers import normalization
+
+    if not isinstance(model, Model):
+        raise ValueError('Expected `model` argument '
+                         'to be a `Model` instance, got ', model)
+
+    identity_layers = (core.Dropout, noise.GaussianNoise,
+                       noise.GaussianDropout, noise.AlphaDropout)
+    foldable_layers = (core.Dense, convolutional.Conv1D,
+                       convolutional.Conv2D, convolutional.Conv3D,
+                       convolutional.SeparableConv1D,
+                       convolutional.SeparableConv2D,
+                       convolutional.DepthwiseConv2D)
+    transposed_layers = (convolutional.Conv2DTranspose,
+                         convolutional.Conv3DTranspose)
+
+    depth_keys = sorted(model._nodes_by_depth.keys(), reverse=True)
+    nodes = [node for depth in depth_keys
+             for node in model._nodes_by_depth[depth]]
+    # Number of uses of every tensor in the model.
+    uses = {}
+    for node in nodes:
+        for x in node.input_tensors:
+            uses[id(x)] = uses.get(id(x), 0) + 1
+    for x in model.outputs:
+        uses[id(x)] = uses.get(id(x), 0) + 1
+
+    def single_use(layer):
+        # Layers used once in the model (not shared), whose output is only
+        # used by one layer, so that their weights can be modified.
+        return (len(layer._inbound_nodes) == 1 and
+                uses.get(id(layer._inbound_nodes[0].output_tensors[0])) == 1)
+
+    def source_layer(x):
+        # The layer computing `x`, skipping the removed identity layers.
+        layer = x._keras_history[0]
+        while isinstance(layer, identity_layers) and single_use(layer):
+            layer = layer._inbound_nodes[0].input_tensors[0]._keras_history[0]
+        return layer
+
+    def is_linear(layer):
+        return (getattr(layer, 'activation', None) is activations.linear and
+                getattr(layer, 'activity_regularizer', None) is None)
+
+    # Plans the transformations: `folds` maps a layer to the list of
+    # `BatchNormalization` and `Scale` layers folded into it, `merges`
+    # maps a `Dense` layer to the linear `Dense` layer merged into it.
+    folds = {}
+    folded_into = {}
+    merges = {}
+    for node in nodes:
+        layer = node.outbound_layer
+        if len(node.input_tensors) != 1 or len(layer._inbound_nodes) != 1:
+            continue
+        previous = source_layer(node.input_tensors[0])
+        if not single_use(previous) or previous in merges.values():
+            continue
+        target = folded_into.get(previous, previous)
+        ndim = len(K.int_shape(node.input_tensors[0]))
+        if isinstance(layer, (normalization.BatchNormalization,
+                              normalization.Scale)):
+            if (isinstance(layer, normalization.BatchNormalization) and
+                    layer.mode == 1):
+                # Sample-wise normalization.
+                continue
+            axis = layer.axis % ndim
+            if isinstance(target, normalization.BatchNormalization):
+                if target.mode == 1 or target.axis % ndim != axis:
+                    continue
+            elif (not isinstance(target, foldable_layers) or
+                  isinstance(target, transposed_layers) or
+                  not is_linear(target) or
+                  _channel_axis(target, ndim) != axis):
+                continue
+            folded_into[layer] = target
+            folds.setdefault(target, []).append(layer)
+        elif (isinstance(layer, core.Dense) and
+              isinstance(previous, core.Dense) and
+              previous not in folds and previous not in merges and
+              is_linear(previous)):
+            input_dim = previous._inbound_nodes[0].input_shapes[0][-1]
+            if input_dim * layer.units <= previous.units * (input_dim +
+                                                            layer.units):
+                merges[layer] = previous
+
+    # Clones the model, skipping the removed layers.
+    removed_layers = set(folded_into) | set(merges.values())
+    layer_map = {}
+    tensor_map = {}
+    input_tensors = []
+    for layer, x in zip(model._input_layers, model.inputs):
+        input_tensor = Input(batch_shape=layer.batch_input_shape,
+                             dtype=layer.dtype,
+                             sparse=layer.sparse,
+                             name=layer.name)
+        input_tensors.append(input_tensor)
+        tensor_map[id(x)] = (input_tensor, None)
+
+    for node in nodes:
+        layer = node.outbound_layer
+        if isinstance(layer, InputLayer):
+            continue
+        computed_data = [tensor_map[id(x)] for x in node.input_tensors]
+        if isinstance(layer, identity_layers) or layer in removed_layers:
+            # Removed layers pass their input through.
+            for x in node.output_tensors:
+                tensor_map[id(x)] = computed_data[0]
+            continue
+
+        if layer not in layer_map:
+            config = layer.get_config()
+            if layer in folds or layer in merges:
+                if isinstance(layer, normalization.BatchNormalization):
+                    config['scale'] = config['center'] = True
+                else:
+                    config['use_bias'] = True
+            layer_map[layer] = layer.__class__.from_config(config)
+        new_layer = layer_map[layer]
+
+        kwargs = dict(node.arguments or {})
+        if len(computed_data) == 1:
+            computed_tensors, computed_masks = computed_data[0]
+        else:
+            computed_tensors = [x[0] for x in computed_data]
+            computed_masks = [x[1] for x in computed_data]
+        if has_arg(new_layer.call, 'mask') and 'mask' not in kwargs:
+            kwargs['mask'] = computed_masks
+        output_tensors = to_list(new_layer(computed_tensors, **kwargs))
+        if new_layer.supports_masking:
+            output_masks = to_list(new_layer.compute_mask(computed_tensors,
+                                                          computed_masks))
+        else:
+            output_masks = [None] * len(output_tensors)
+        for x, y, mask in zip(node.output_tensors, output_tensors,
+                              output_masks):
+            tensor_map[id(x)] = (y, mask)
+
+    # Sets the weights of the new layers.
+    for layer, new_layer in layer_map.items():
+        weights = layer.get_weights()
+        if layer in folds or layer in merges:
+            # Adds the missing bias, or BatchNormalization gamma and beta.
+            if isinstance(layer, normalization.BatchNormalization):
+                mean = weights[-1]
+                if not layer.scale:
+                    weights.insert(0, np.ones_like(mean))
+                if not layer.center:
+                    weights.insert(1, np.zeros_like(mean))
+            elif not layer.use_bias:
+                weights.append(np.zeros(K.int_shape(new_layer.bias),
+                                        dtype=K.floatx()))
+        if layer in merges:
+            first = merges[layer]
+            first_weights = first.get_weights()
+            bias = weights[1]
+            if first.use_bias:
+                bias = bias + np.dot(first_weights[1], weights[0])
+            weights = [np.dot(first_weights[0], weights[0]), bias]
+        for affine_layer in folds.get(layer, []):
+            scale, shift = _affine_params(affine_layer)
+            weights = _fold_affine(layer, weights, scale, shift)
+        if weights:
+            new_layer.set_weights(weights)
+    return Model(input_tensors,
+                 [tensor_map[id(x)][0] for x in model.outputs],
+                 name=model.name)
+
+
+def quantize_model(model, layers=None, custom_objects=None):
+    """Returns a copy of `model` with int8 kernels and embeddings.
+
+    The 2D weights of the quantized layers, i.e. their kernels (including
+    the recurrent and attention kernels of recurrent layers) and embedding
+    matrices, are stored as int8 values with one float scale per output
+    unit (per token for embeddings), and dequantized when the model is
+    run. This divides the memory used by these weights by 4 (in float32),
+    in memory and in the files written by `model.save` and
+    `model.save_weights`.
+    The biases and the other vector weights (e.g. `attention_context_wa`
+    in `AttLSTMCond`) are left in float.
+
+    The weights of a quantized model can be loaded from the files of the
+    float model, and conversely (see `Layer.weight_quantization`).
+    Quantized layers are not trainable.
+
+    # Arguments
+        model: Instance of `Model` (functional or `Sequential`),
+            with trained weights.
+        layers: Optional list of the names of the layers to quantize.
+            By default, all layers are quantized.
+        custom_objects: Optional dictionary mapping names
+            (strings) to custom classes or functions used by the model.
+
+    # Returns
+        A new model instance, of the class of `model`, with the quantized
+        weights of `model`.
+
+    # Raises
+        ValueError: in case of invalid `model` or `layers` argument value.
+    """
+    if not isinstance(model, Model):
+        raise ValueError('Expected `model` argument '
+                         'to be a `Model` instance, got ', model)
+    layer_names = set(layer.name for layer in model.layers)
+    if layers is not None:
+        unknown_layers = set(layers) - layer_names
+        if unknown_layers:
+            raise ValueError('Unknown layers: ' + str(sorted(unknown_layers)))
+        layer_names = set(layers)
+
+    def set_quantization(layer_config):
+        if layer_config['class_name'] in ('InputLayer', 'Model', 'Sequential'):
+            return
+        layer_config['config']['weight_quantization'] = 'int8'
+        layer_config['config']['trainable'] = False
+        if 'layer' in layer_config['config']:
+            # Wrappers.
+            set_quantization(layer_config['config']['layer'])
+
+    config = model.get_config()
+    for layer_config in config['layers']:
+        if layer_config['config']['name'] in layer_names:
+            set_quantization(layer_config)
+    new_model = model.__class__.from_config(config,
+                                            custom_objects=custom_objects)
+    for layer, new_layer in zip(model.layers, new_model.layers):
+        weights = layer.get_weights()
+        if layer.name in layer_names and weights:
+            weights = saving.preprocess_weights_for_loading(new_layer, weights)
+        new_layer.set_weights(weights)
+    return new_model
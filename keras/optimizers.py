@@ -15,9 +15,6 @@ from .utils.generic_utils import serialize_keras_object
 from .utils.generic_utils import deserialize_keras_object
 from .legacy import interfaces
 
-if K.backend() == 'tensorflow':
-    import tensorflow as tf
-
 
 def clip_norm(g, c, n):
     """Clip the gradient `g` if the L2 norm `n` exceeds `c`.
@@ -36,6 +33,7 @@ def clip_norm(g, c, n):
 
     # tf require using a special op to multiply IndexedSliced by scalar
     if K.backend() == 'tensorflow':
+        import tensorflow as tf
         condition = n >= c
         then_expression = tf.scalar_mul(c / n, g)
         else_expression = g
@@ -1800,6 +1798,7 @@ class TFOptimizer(Optimizer):
     @interfaces.legacy_get_updates_support
     @K.symbolic
     def get_updates(self, loss, params):
+        import tensorflow as tf
         if isinstance(self.optimizer, tf.keras.optimizers.Optimizer):
             return self.optimizer.get_updates(loss, params)
         else:
@@ -1821,17 +1820,20 @@ class TFOptimizer(Optimizer):
 
     @property
     def weights(self):
+        import tensorflow as tf
         if isinstance(self.optimizer, tf.keras.optimizers.Optimizer):
             return self.optimizer.weights
         raise NotImplementedError
 
     def get_config(self):
+        import tensorflow as tf
         if isinstance(self.optimizer, tf.keras.optimizers.Optimizer):
             return self.optimizer.get_config
         raise NotImplementedError
 
     @classmethod
     def from_config(cls, config):
+        import tensorflow as tf
         if tf.__version__.startswith('1.'):
             raise NotImplementedError
         return cls(**config)
@@ -1911,6 +1913,7 @@ def get(identifier):
         ValueError: If `identifier` cannot be interpreted.
     """
     if K.backend() == 'tensorflow':
+        import tensorflow as tf
         # Wrap TF optimizer instances
         if tf.__version__.startswith('1.'):
             try:
@@ -4,6 +4,7 @@ from __future__ import division
 from __future__ import print_function
 
 import hashlib
+import json
 import multiprocessing as mp
 import os
 import random
@@ -120,6 +121,20 @@ def _extract_archive(file_path, path='.', archive_format='auto'):
     return False
 
 
+def _keras_dir(cache_dir=None):
+    """Returns the Keras cache directory (`~/.keras` by default).
+    """
+    if cache_dir is None:
+        if 'KERAS_HOME' in os.environ:
+            cache_dir = os.environ.get('KERAS_HOME')
+        else:
+            cache_dir = os.path.join(os.path.expanduser('~'), '.keras')
+    datadir_base = os.path.expanduser(cache_dir)
+    if not os.access(datadir_base, os.W_OK):
+        datadir_base = os.path.join('/tmp', '.keras')
+    return datadir_base
+
+
 def get_file(fname,
              origin,
              untar=False,
@@ -169,17 +184,10 @@ def get_file(fname,
     # Returns
         Path to the downloaded file
     """  # noqa
-    if cache_dir is None:
-        if 'KERAS_HOME' in os.environ:
-            cache_dir = os.environ.get('KERAS_HOME')
-        else:
-            cache_dir = os.path.join(os.path.expanduser('~'), '.keras')
     if md5_hash is not None and file_hash is None:
         file_hash = md5_hash
         hash_algorithm = 'md5'
-    datadir_base = os.path.expanduser(cache_dir)
-    if not os.access(datadir_base, os.W_OK):
-        datadir_base = os.path.join('/tmp', '.keras')
+    datadir_base = _keras_dir(cache_dir)
     datadir = os.path.join(datadir_base, cache_subdir)
     if not os.path.exists(datadir):
         os.makedirs(datadir)
@@ -296,12 +304,155 @@ def validate_file(fpath, file_hash, algorithm='auto', chunk_size=65535):
     else:
         hasher = 'md5'
 
-    if str(_hash_file(fpath, hasher, chunk_size)) == str(file_hash):
+    if str(_cached_hash_file(fpath, hasher, chunk_size)) == str(file_hash):
         return True
     else:
         return False
 
 
+def _file_signature(fpath):
+    """Returns the size and the modification time of a file.
+    """
+    stat = os.stat(fpath)
+    return [stat.st_size, repr(stat.st_mtime)]
+
+
+def _cached_hash_file(fpath, algorithm='sha256', chunk_size=65535):
+    """Calculates a file hash, reusing the hashes computed previously.
+
+    The hashes are stored in `hashes.json` in the Keras cache directory,
+    along with the size and modification time of the files, and are
+    computed again when a file changes.
+
+    # Arguments
+        fpath: path to the file being validated
+        algorithm: hash algorithm, one of 'sha256' or 'md5'.
+        chunk_size: Bytes to read at a time, important for large files.
+
+    # Returns
+        The file hash
+    """
+    fpath = os.path.abspath(fpath)
+    cache_path = os.path.join(_keras_dir(), 'hashes.json')
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (IOError, OSError, ValueError):
+        cache = {}
+    signature = _file_signature(fpath)
+    entry = cache.get(fpath)
+    if entry is None or entry['signature'] != signature:
+        entry = {'signature': signature}
+    if algorithm not in entry:
+        entry[algorithm] = _hash_file(fpath, algorithm, chunk_size)
+        cache[fpath] = entry
+        try:
+            _write_json(cache_path, cache)
+        except (IOError, OSError):
+            # The cache directory is not writable.
+            pass
+    return entry[algorithm]
+
+
+def _write_json(fpath, data):
+    """Writes `data` to `fpath` atomically (through a temporary file).
+    """
+    dirname = os.path.dirname(fpath)
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+    tmp_path = '%s.%d.tmp' % (fpath, os.getpid())
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    try:
+        os.rename(tmp_path, fpath)
+    except OSError:
+        # Windows does not overwrite files when renaming.
+        os.remove(fpath)
+        os.rename(tmp_path, fpath)
+
+
+def load_cached_arrays(cache_path, sources, load_fn, mmap_mode='c'):
+    """Loads Numpy arrays through a cache of uncompressed `.npy` files.
+
+    The first time, the arrays are loaded with `load_fn` (typically by
+    decompressing or unpickling the `sources` files) and saved as `.npy`
+    files in `cache_path`. Later calls memory-map these files, which is
+    almost instantaneous. The cache is rebuilt when the size or the
+    modification time of one of the `sources` changes.
+
+    # Arguments
+        cache_path: Directory of the cache.
+        sources: List of the paths of the files the arrays are loaded from.
+        load_fn: Function without arguments returning a dictionary
+            mapping names to Numpy arrays. Object arrays must be arrays
+            of sequences of numbers: they are stored flattened, and
+            loaded (not memory-mapped) as object arrays of lists.
+        mmap_mode: Memory-mapping mode of the arrays, see `np.load`.
+            By default, arrays are copied on write: they can be modified
+            in place without changing the cache.
+
+    # Returns
+        A dictionary mapping the names to the arrays returned by `load_fn`.
+    """
+    manifest_path = os.path.join(cache_path, 'manifest.json')
+    signature = [[os.path.abspath(fpath)] + _file_signature(fpath)
+                 for fpath in sources]
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest['sources'] == signature:
+            arrays = {}
+            for name in manifest['arrays']:
+                arrays[name] = np.load(os.path.join(cache_path, name + '.npy'),
+                                       mmap_mode=mmap_mode)
+            for name in manifest['sequences']:
+                lengths = np.load(os.path.join(cache_path,
+                                               name + '.lengths.npy'))
+                arrays[name] = _unpack_sequences(arrays.pop(name), lengths)
+            return arrays
+    except (IOError, OSError, ValueError, KeyError):
+        pass
+
+    arrays = load_fn()
+    try:
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        if not os.path.exists(cache_path):
+            os.makedirs(cache_path)
+        sequences = []
+        for name, array in arrays.items():
+            if array.dtype == object:
+                sequences.append(name)
+                lengths = np.array([len(x) for x in array], dtype='int64')
+                np.save(os.path.join(cache_path, name + '.lengths.npy'),
+                        lengths)
+                array = np.concatenate([np.asarray(x) for x in array] or
+                                       [np.zeros(0, dtype='int64')])
+            np.save(os.path.join(cache_path, name + '.npy'), array,
+                    allow_pickle=False)
+        # The manifest is written last: it marks the cache as complete.
+        _write_json(manifest_path, {'sources': signature,
+                                    'arrays': sorted(arrays),
+                                    'sequences': sorted(sequences)})
+    except (IOError, OSError) as e:
+        warnings.warn('Could not cache the arrays in %s: %s' %
+                      (cache_path, e))
+    return arrays
+
+
+def _unpack_sequences(values, lengths):
+    """Splits `values` into an object array of lists of `lengths` items.
+    """
+    # Converting all the values at once is much faster than per sequence.
+    values = values.tolist()
+    sequences = np.empty(len(lengths), dtype=object)
+    start = 0
+    for i, end in enumerate(np.cumsum(lengths).tolist()):
+        sequences[i] = values[start:end]
+        start = end
+    return sequences
+
+
 class Sequence(object):
     """Base object for fitting to a sequence of data, such as a dataset.
 
@@ -740,3 +891,65 @@ class GeneratorEnqueuer(SequenceEnqueuer):
                     "`use_multiprocessing=False, workers > 1`."
                     "For more information see issue #1638.")
             six.reraise(*sys.exc_info())
+
+
+def prefetch(iterator, buffer_size=1):
+    """Iterates over `iterator` ahead of time, in a background thread.
+
+    While the consumer works on an item, the next items (up to
+    `buffer_size` of them, plus the one being produced) are already
+    computed by the thread. This overlaps the Python code producing the
+    items with the work done on them, e.g. the standardization of the
+    next batch with the training step of the current one.
+
+    Exceptions raised by `iterator` are re-raised by the consumer when it
+    reaches them. The thread stops, and closes `iterator`, when the
+    returned generator is exhausted or closed.
+
+    # Arguments
+        iterator: Iterator or generator, only consumed by the background
+            thread from then on.
+        buffer_size: Maximum number of items waiting for the consumer.
+
+    # Yields
+        The items of `iterator`, in order.
+    """
+    buffer = queue.Queue(maxsize=buffer_size)
+    stop_signal = threading.Event()
+    end_of_iterator = object()
+
+    def put(item):
+        while not stop_signal.is_set():
+            try:
+                buffer.put(item, block=True, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run():
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except Exception:
+            put((None, sys.exc_info()))
+        else:
+            put((end_of_iterator, None))
+        finally:
+            if hasattr(iterator, 'close'):
+                iterator.close()
+
+    thread = threading.Thread(target=run)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item, exc_info = buffer.get(block=True)
+            if exc_info is not None:
+                six.reraise(*exc_info)
+            if item is end_of_iterator:
+                return
+            yield item
+    finally:
+        stop_signal.set()
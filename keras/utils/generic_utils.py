@@ -14,9 +14,13 @@ import types as python_types
 import inspect
 import codecs
 import collections
+import weakref
 
 _GLOBAL_CUSTOM_OBJECTS = {}
 
+# Results of `has_arg`, by function.
+_HAS_ARG_CACHE = weakref.WeakKeyDictionary()
+
 
 class CustomObjectScope(object):
     """Provides a scope that changes to `_GLOBAL_CUSTOM_OBJECTS` cannot escape.
@@ -288,6 +292,23 @@ def has_arg(fn, name, accept_all=False):
     # Returns
         bool, whether `fn` accepts a `name` keyword argument.
     """
+    # Layers check the signature of `call` methods each time they are
+    # called, so the result is cached. Bound methods are created at each
+    # attribute access: the cache is keyed by the underlying function.
+    key = getattr(fn, '__func__', fn)
+    try:
+        results = _HAS_ARG_CACHE.setdefault(key, {})
+    except TypeError:
+        # `fn` cannot be weakly referenced (e.g. a builtin).
+        return _has_arg(fn, name, accept_all)
+    # The first argument of a function is not an argument of its methods.
+    result_key = (name, accept_all, key is not fn)
+    if result_key not in results:
+        results[result_key] = _has_arg(fn, name, accept_all)
+    return results[result_key]
+
+
+def _has_arg(fn, name, accept_all):
     if sys.version_info < (3,):
         arg_spec = inspect.getargspec(fn)
         if accept_all and arg_spec.keywords is not None:
@@ -161,19 +161,6 @@ class AUCSummationMethod(Enum):
             raise ValueError('Invalid AUC summation method value "%s".' % key)
 
 
-def weighted_assign_add(label, pred, weights, var):
-    # Logical and
-    label = K.expand_dims(label, 0)
-    pred = K.expand_dims(pred, 0)
-    are_different = K.concatenate([label, pred], axis=0)
-    label_and_pred = K.all(are_different, axis=0)
-
-    label_and_pred = K.cast(label_and_pred, dtype=K.floatx())
-    if weights is not None:
-        label_and_pred *= weights
-    return K.update_add(var, K.sum(label_and_pred, 1))
-
-
 def update_confusion_matrix_variables(variables_to_update,
                                       y_true,
                                       y_pred,
@@ -263,62 +250,56 @@ def update_confusion_matrix_variables(variables_to_update,
 
     thresholds = to_list(thresholds)
     num_thresholds = len(thresholds)
-    num_predictions = K.size(y_pred)
-
-    # Reshape predictions and labels.
-    predictions_2d = K.reshape(y_pred, [1, -1])
-    labels_2d = K.reshape(
-        K.cast(y_true, dtype='bool'), [1, -1])
-
-    # Tile the thresholds for every prediction.
-    thresh_tiled = K.tile(
-        K.expand_dims(K.constant(thresholds), 1),
-        K.cast(
-            K.stack([1, num_predictions]),
-            dtype='int32',
-        )
-    )
-
-    # Tile the predictions for every threshold.
-    preds_tiled = K.tile(predictions_2d, [num_thresholds, 1])
-
-    # Compare predictions and threshold.
-    pred_is_pos = K.greater(preds_tiled, thresh_tiled)
-
-    # Tile labels by number of thresholds
-    label_is_pos = K.tile(labels_2d, [num_thresholds, 1])
 
+    # Instead of comparing every prediction with every threshold, find the
+    # bucket of each prediction between the sorted thresholds: a
+    # prediction in bucket `b` is above the `b` smallest thresholds. The
+    # weighted label counts of the buckets then give the counts for all
+    # thresholds with cumulative sums, in O(N + T) memory.
+    order = sorted(range(num_thresholds), key=lambda i: thresholds[i])
+    sorted_thresholds = K.constant([thresholds[i] for i in order])
+    buckets = K.searchsorted(sorted_thresholds, K.reshape(y_pred, [-1]))
+
+    label_is_pos = K.cast(K.not_equal(K.reshape(y_true, [-1]), 0),
+                          dtype=K.floatx())
     if sample_weight is not None:
-        weights = losses_utils.broadcast_weights(
-            y_pred, K.cast(sample_weight, dtype=K.floatx()))
-        weights_tiled = K.tile(
-            K.reshape(weights, [1, -1]), [num_thresholds, 1])
+        weights = K.reshape(losses_utils.broadcast_weights(
+            y_pred, K.cast(sample_weight, dtype=K.floatx())), [-1])
+        pos_weights = label_is_pos * weights
+        neg_weights = (1. - label_is_pos) * weights
     else:
-        weights_tiled = None
+        pos_weights = label_is_pos
+        neg_weights = 1. - label_is_pos
+
+    def above_and_below(bucket_weights):
+        # Sums of the weights in the buckets above and below each
+        # threshold, in the order of `thresholds`.
+        counts = K.bincount(buckets, weights=bucket_weights,
+                            minlength=num_thresholds + 1)
+        below = K.cumsum(counts)[:num_thresholds]
+        above = K.reverse(K.cumsum(K.reverse(counts, 0)), 0)[1:]
+        if order != list(range(num_thresholds)):
+            inverse_order = sorted(range(num_thresholds),
+                                   key=lambda i: order[i])
+            below = K.gather(below, inverse_order)
+            above = K.gather(above, inverse_order)
+        return above, below
 
     update_ops = []
-    loop_vars = {
-        ConfusionMatrix.TRUE_POSITIVES: (label_is_pos, pred_is_pos),
-    }
-    update_tn = ConfusionMatrix.TRUE_NEGATIVES in variables_to_update
-    update_fp = ConfusionMatrix.FALSE_POSITIVES in variables_to_update
-    update_fn = ConfusionMatrix.FALSE_NEGATIVES in variables_to_update
-
-    if update_fn or update_tn:
-        pred_is_neg = K.equal(
-            pred_is_pos, K.zeros_like(pred_is_pos, dtype=pred_is_pos.dtype))
-        loop_vars[ConfusionMatrix.FALSE_NEGATIVES] = (label_is_pos, pred_is_neg)
-
-    if update_fp or update_tn:
-        label_is_neg = K.equal(
-            label_is_pos, K.zeros_like(label_is_pos, dtype=label_is_pos.dtype))
-        loop_vars[ConfusionMatrix.FALSE_POSITIVES] = (label_is_neg, pred_is_pos)
-        if update_tn:
-            loop_vars[ConfusionMatrix.TRUE_NEGATIVES] = (label_is_neg, pred_is_neg)
-
-    for matrix_cond, (label, pred) in loop_vars.items():
-        if matrix_cond in variables_to_update:
-            update_ops.append(
-                weighted_assign_add(label, pred, weights_tiled,
-                                    variables_to_update[matrix_cond]))
+    if (ConfusionMatrix.TRUE_POSITIVES in variables_to_update or
+            ConfusionMatrix.FALSE_NEGATIVES in variables_to_update):
+        tp, fn = above_and_below(pos_weights)
+        for matrix_cond, value in [(ConfusionMatrix.TRUE_POSITIVES, tp),
+                                   (ConfusionMatrix.FALSE_NEGATIVES, fn)]:
+            if matrix_cond in variables_to_update:
+                update_ops.append(
+                    K.update_add(variables_to_update[matrix_cond], value))
+    if (ConfusionMatrix.FALSE_POSITIVES in variables_to_update or
+            ConfusionMatrix.TRUE_NEGATIVES in variables_to_update):
+        fp, tn = above_and_below(neg_weights)
+        for matrix_cond, value in [(ConfusionMatrix.FALSE_POSITIVES, fp),
+                                   (ConfusionMatrix.TRUE_NEGATIVES, tn)]:
+            if matrix_cond in variables_to_update:
+                update_ops.append(
+                    K.update_add(variables_to_update[matrix_cond], value))
     return update_ops
@@ -1,3 +1,14 @@
 from __future__ import absolute_import
 
-from . import scikit_learn
+import importlib
+import sys
+
+if sys.version_info >= (3, 7):
+    # `keras.wrappers.scikit_learn` is imported on first access.
+    def __getattr__(name):
+        if name == 'scikit_learn':
+            return importlib.import_module('.' + name, __name__)
+        raise AttributeError('module %r has no attribute %r' %
+                             (__name__, name))
+else:
+    from . import scikit_learn
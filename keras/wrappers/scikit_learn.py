@@ -5,10 +5,14 @@ from __future__ import division
 from __future__ import print_function
 
 import copy
+import itertools
+import multiprocessing as mp
+import time
 import types
 
 import numpy as np
 
+from .. import backend as K
 from .. import losses
 from ..utils.np_utils import to_categorical
 from ..utils.generic_utils import has_arg
@@ -132,26 +136,208 @@ class BaseWrapper(object):
             history : object
                 details about the training history at each epoch.
         """
-        if self.build_fn is None:
-            self.model = self.__call__(**self.filter_sk_params(self.__call__))
-        elif (not isinstance(self.build_fn, types.FunctionType) and
-              not isinstance(self.build_fn, types.MethodType)):
-            self.model = self.build_fn(
-                **self.filter_sk_params(self.build_fn.__call__))
-        else:
-            self.model = self.build_fn(**self.filter_sk_params(self.build_fn))
+        self.model = self._get_model()
 
         if (losses.is_categorical_crossentropy(self.model.loss) and
                 len(y.shape) != 2):
             y = to_categorical(y)
 
-        fit_args = copy.deepcopy(self.filter_sk_params(Sequential.fit))
+        # `fit` does not modify its arguments, so there is no need
+        # to deep-copy them (which would copy e.g. `validation_data`).
+        fit_args = self.filter_sk_params(Sequential.fit)
         fit_args.update(kwargs)
 
         history = self.model.fit(x, y, **fit_args)
 
         return history
 
+    def _build_fn(self):
+        if self.build_fn is None:
+            return self.__call__
+        elif (not isinstance(self.build_fn, types.FunctionType) and
+              not isinstance(self.build_fn, types.MethodType)):
+            return self.build_fn.__call__
+        return self.build_fn
+
+    def _get_model(self):
+        """Builds a model with `build_fn`, or reuses a cached one.
+
+        During a hyperparameter search (see `search`), `self._model_cache`
+        is a dictionary in which the last compiled model is kept along with
+        its initial weights. When the model parameters are the same as the
+        ones of the cached model (e.g. for every fold of a configuration),
+        that model is reset to its initial state instead of being built and
+        compiled again.
+        """
+        build_fn = self._build_fn()
+        build_params = self.filter_sk_params(build_fn)
+        model_cache = getattr(self, '_model_cache', None)
+        if model_cache is None:
+            return build_fn(**build_params)
+
+        key = repr(sorted(build_params.items()))
+        if key in model_cache:
+            model, weights, optimizer_weights = model_cache[key]
+            model.set_weights(weights)
+            K.batch_set_value(zip(model.optimizer.weights, optimizer_weights))
+            model.reset_states()
+            return model
+
+        model_cache.clear()
+        model = build_fn(**build_params)
+        # Creates the optimizer weights, so that their initial
+        # values can be restored as well.
+        model._make_train_function()
+        model_cache[key] = (model, model.get_weights(),
+                            K.batch_get_value(model.optimizer.weights))
+        return model
+
+    def iter_search(self, x, y, param_grid, cv=3, workers=1,
+                    shuffle=True, seed=None):
+        """Evaluates hyperparameter configurations by cross-validation.
+
+        Every configuration of `param_grid` is fitted on the training
+        split and scored (with `score`) on the test split of every fold.
+        Results are yielded as soon as they are available.
+
+        The model built by `build_fn` is reused across the folds of a
+        configuration, and across configurations that only differ in
+        fitting parameters (e.g. `epochs` or `batch_size`): its weights and
+        optimizer state are reset to their initial values instead of
+        building and compiling a new model.
+
+        # Arguments
+            x: Numpy array of training samples.
+            y: Numpy array of targets.
+            param_grid: Dictionary mapping parameter names (any legal
+                parameter of `sk_params`) to lists of values to try,
+                or list of such dictionaries.
+            cv: Number of folds, or list of `(train, test)` pairs of
+                index arrays.
+            workers: Number of processes evaluating configurations in
+                parallel. Each process builds its models in its own
+                backend session. With `workers > 1`, `build_fn` and the
+                wrapper class must be picklable (e.g. defined at the top
+                level of a module), and the calling script should be
+                protected by `if __name__ == '__main__'`.
+            shuffle: Whether to shuffle the samples before splitting them
+                in folds (if `cv` is an integer).
+            seed: Random seed used to shuffle the samples.
+
+        # Yields
+            Dictionaries with the keys `index` (index of the
+            configuration), `params`, `fold`, `score`, `fit_time` and
+            `score_time`.
+
+        # Raises
+            ValueError: If a parameter of `param_grid` is not legal.
+        """
+        x = np.asarray(x)
+        y = np.asarray(y)
+        configs = _expand_param_grid(param_grid)
+        for params in configs:
+            self.check_params(params)
+        if isinstance(cv, int):
+            cv = _k_fold(len(x), cv, shuffle, seed)
+        cv = list(cv)
+
+        # All the folds of a configuration are evaluated by the same
+        # worker, and configurations sharing model parameters are
+        # dispatched together, to maximize model reuse.
+        build_fn = self._build_fn()
+
+        def build_key(item):
+            index, params = item
+            sk_params = dict(self.sk_params, **params)
+            return repr(sorted((name, value)
+                               for name, value in sk_params.items()
+                               if has_arg(build_fn, name)))
+
+        tasks = []
+        for index, params in sorted(enumerate(configs), key=build_key):
+            tasks.append((self.__class__, self.build_fn, self.sk_params,
+                          index, params, cv))
+
+        if workers <= 1:
+            model_cache = {}
+            for task in tasks:
+                for result in _fit_and_score(task, x, y, model_cache):
+                    yield result
+            return
+
+        if hasattr(mp, 'get_context'):
+            # Forked processes would share the backend session
+            # of the parent process.
+            mp_context = mp.get_context('spawn')
+        else:
+            mp_context = mp
+        pool = mp_context.Pool(workers,
+                               initializer=_init_search_worker,
+                               initargs=(x, y))
+        try:
+            for results in pool.imap_unordered(_search_worker, tasks):
+                for result in results:
+                    yield result
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def search(self, x, y, param_grid, cv=3, workers=1, refit=True,
+               shuffle=True, seed=None, verbose=0):
+        """Selects the best hyperparameters by cross-validation.
+
+        Like scikit-learn's `GridSearchCV`, but configurations can be
+        evaluated in parallel processes, and models are reused across
+        folds instead of being rebuilt (see `iter_search`).
+
+        # Arguments
+            x: Numpy array of training samples.
+            y: Numpy array of targets.
+            param_grid: Dictionary mapping parameter names to lists of
+                values to try, or list of such dictionaries.
+            cv: Number of folds, or list of `(train, test)` pairs of
+                index arrays.
+            workers: Number of processes evaluating configurations in
+                parallel.
+            refit: Whether to fit the wrapper on the whole data with the
+                best parameters once the search is done.
+            shuffle: Whether to shuffle the samples before splitting them
+                in folds (if `cv` is an integer).
+            seed: Random seed used to shuffle the samples.
+            verbose: Verbosity mode, 0 or 1. If 1, the score of every
+                fold is printed as soon as it is computed.
+
+        # Returns
+            self. The results are stored in `search_results_`, a list
+            with one dictionary per configuration (keys `params`,
+            `scores`, `mean_score` and `std_score`), and the best
+            configuration in `best_params_` and `best_score_`.
+        """
+        configs = _expand_param_grid(param_grid)
+        scores = [[] for _ in configs]
+        for result in self.iter_search(x, y, param_grid, cv=cv,
+                                       workers=workers, shuffle=shuffle,
+                                       seed=seed):
+            scores[result['index']].append(result['score'])
+            if verbose:
+                print('%s, fold %d: score=%.4f (%.1fs)' % (
+                    result['params'], result['fold'], result['score'],
+                    result['fit_time'] + result['score_time']))
+
+        self.search_results_ = [{'params': params,
+                                 'scores': config_scores,
+                                 'mean_score': float(np.mean(config_scores)),
+                                 'std_score': float(np.std(config_scores))}
+                                for params, config_scores
+                                in zip(configs, scores)]
+        best = max(self.search_results_, key=lambda r: r['mean_score'])
+        self.best_params_ = best['params']
+        self.best_score_ = best['mean_score']
+        if refit:
+            self.set_params(**self.best_params_)
+            self.fit(x, y)
+        return self
+
     def filter_sk_params(self, fn, override=None):
         """Filters `sk_params` and returns those in `fn`'s arguments.
 
@@ -172,6 +358,71 @@ class BaseWrapper(object):
         return res
 
 
+def _expand_param_grid(param_grid):
+    if isinstance(param_grid, dict):
+        param_grid = [param_grid]
+    configs = []
+    for grid in param_grid:
+        names = sorted(grid)
+        for values in itertools.product(*[grid[name] for name in names]):
+            configs.append(dict(zip(names, values)))
+    return configs
+
+
+def _k_fold(num_samples, num_folds, shuffle=True, seed=None):
+    if num_folds < 2:
+        raise ValueError('At least 2 folds are needed for cross-validation, '
+                         'got cv=' + str(num_folds))
+    indices = np.arange(num_samples)
+    if shuffle:
+        np.random.RandomState(seed).shuffle(indices)
+    folds = np.array_split(indices, num_folds)
+    return [(np.concatenate(folds[:i] + folds[i + 1:]), folds[i])
+            for i in range(num_folds)]
+
+
+def _fit_and_score(task, x, y, model_cache):
+    """Evaluates one configuration on every fold.
+    """
+    wrapper_class, build_fn, sk_params, index, params, cv = task
+    results = []
+    for fold, (train, test) in enumerate(cv):
+        estimator = wrapper_class(build_fn=build_fn, **sk_params)
+        estimator.set_params(**params)
+        estimator._model_cache = model_cache
+        start = time.time()
+        estimator.fit(x[train], y[train])
+        fit_time = time.time() - start
+        start = time.time()
+        score = estimator.score(x[test], y[test])
+        score_time = time.time() - start
+        results.append({'index': index, 'params': params, 'fold': fold,
+                        'score': score, 'fit_time': fit_time,
+                        'score_time': score_time})
+    return results
+
+
+# Data and model cache of the hyperparameter search worker processes.
+_SEARCH_DATA = None
+_SEARCH_MODEL_CACHE = {}
+
+
+def _init_search_worker(x, y):
+    global _SEARCH_DATA
+    _SEARCH_DATA = (x, y)
+    _SEARCH_MODEL_CACHE.clear()
+    if hasattr(K, 'clear_session'):
+        K.clear_session()
+    else:
+        # Theano has no session.
+        K.reset_uids()
+
+
+def _search_worker(task):
+    x, y = _SEARCH_DATA
+    return _fit_and_score(task, x, y, _SEARCH_MODEL_CACHE)
+
+
 class KerasClassifier(BaseWrapper):
     """Implementation of the scikit-learn classifier API for Keras.
     """
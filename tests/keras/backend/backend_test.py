@@ -569,6 +569,32 @@ class TestBackend(object):
         check_single_tensor_operation('cumprod', (4, 2), WITH_NP)
         check_single_tensor_operation('cumprod', (4, 2), WITH_NP, axis=1)
 
+    def test_searchsorted(self):
+        sorted_sequence = np.array([0., 0.25, 0.5, 1.], dtype='float32')
+        values = np.random.random((3, 5)).astype('float32')
+        values[0, :4] = sorted_sequence
+        for side in ['left', 'right']:
+            expected = np.searchsorted(sorted_sequence, values, side=side)
+            for k in WITH_NP:
+                indices = k.eval(k.searchsorted(k.constant(sorted_sequence),
+                                                k.constant(values),
+                                                side=side))
+                assert indices.shape == values.shape
+                assert_allclose(indices, expected)
+
+    def test_bincount(self):
+        x = np.array([0, 3, 3, 1, 3], dtype='int32')
+        weights = np.random.random((5,)).astype('float32')
+        for k in WITH_NP:
+            counts = k.eval(k.bincount(k.constant(x, dtype='int32'),
+                                       minlength=6))
+            assert_allclose(counts, np.bincount(x, minlength=6))
+            counts = k.eval(k.bincount(k.constant(x, dtype='int32'),
+                                       weights=k.constant(weights),
+                                       minlength=6))
+            assert_allclose(counts, np.bincount(x, weights, minlength=6),
+                            rtol=1e-6)
+
     @pytest.mark.skipif(K.backend() == 'cntk',
                         reason='cntk return -85.1 for zero or '
                                'negative number, not nan, so can\'t '
@@ -1335,6 +1361,69 @@ class TestBackend(object):
             padding=padding, data_format=data_format,
             cntk_dynamicity=True)
 
+    @pytest.mark.parametrize('input_shape,kernel_size,strides', [
+        ((2, 10, 3), (3,), (1,)),
+        ((2, 11, 3), (4,), (3,)),
+    ])
+    def test_local_conv1d(self, input_shape, kernel_size, strides):
+        output_length = (input_shape[1] - kernel_size[0]) // strides[0] + 1
+        kernel_shape = (output_length, kernel_size[0] * input_shape[2], 4)
+        check_two_tensor_operation(
+            'local_conv1d', input_shape, kernel_shape, WITH_NP,
+            kernel_size=kernel_size, strides=strides)
+
+        x = np.random.random(input_shape)
+        kernel = np.random.random(kernel_shape)
+        expected = np.zeros((input_shape[0], output_length, 4))
+        for i in range(output_length):
+            start = i * strides[0]
+            patch = x[:, start:start + kernel_size[0]]
+            expected[:, i] = np.dot(patch.reshape((input_shape[0], -1)),
+                                    kernel[i])
+        assert_allclose(KNP.local_conv1d(x, kernel, kernel_size, strides),
+                        expected, atol=1e-5)
+
+    @pytest.mark.parametrize('input_shape,kernel_size,strides,data_format', [
+        ((2, 3, 9, 8), (3, 3), (2, 2), 'channels_first'),
+        ((2, 3, 6, 7), (2, 3), (1, 2), 'channels_first'),
+        ((2, 9, 8, 3), (3, 3), (2, 2), 'channels_last'),
+        ((2, 6, 7, 3), (2, 3), (1, 2), 'channels_last'),
+    ])
+    def test_local_conv2d(self, input_shape, kernel_size, strides,
+                          data_format):
+        if data_format == 'channels_first':
+            channels, rows, cols = input_shape[1:]
+        else:
+            rows, cols, channels = input_shape[1:]
+        output_shape = ((rows - kernel_size[0]) // strides[0] + 1,
+                        (cols - kernel_size[1]) // strides[1] + 1)
+        kernel_shape = (output_shape[0] * output_shape[1],
+                        kernel_size[0] * kernel_size[1] * channels, 4)
+        check_two_tensor_operation(
+            'local_conv2d', input_shape, kernel_shape, WITH_NP,
+            kernel_size=kernel_size, strides=strides,
+            output_shape=output_shape, data_format=data_format)
+
+        x = np.random.random(input_shape)
+        kernel = np.random.random(kernel_shape)
+        expected = np.zeros((input_shape[0],) + output_shape + (4,))
+        for i in range(output_shape[0]):
+            for j in range(output_shape[1]):
+                row = slice(i * strides[0], i * strides[0] + kernel_size[0])
+                col = slice(j * strides[1], j * strides[1] + kernel_size[1])
+                if data_format == 'channels_first':
+                    patch = x[:, :, row, col]
+                else:
+                    patch = x[:, row, col, :]
+                expected[:, i, j] = np.dot(
+                    patch.reshape((input_shape[0], -1)),
+                    kernel[i * output_shape[1] + j])
+        if data_format == 'channels_first':
+            expected = np.transpose(expected, (0, 3, 1, 2))
+        assert_allclose(KNP.local_conv2d(x, kernel, kernel_size, strides,
+                                         output_shape, data_format),
+                        expected, atol=1e-5)
+
     @pytest.mark.parametrize(
         'op,input_shape,pool_size,strides,padding,data_format,pool_mode', [
             ('pool2d', (2, 3, 7, 7), (3, 3), (1, 1),
@@ -1669,6 +1758,45 @@ class TestBackend(object):
         assert_list_pairwise(output_arrays)
         assert_list_keras_shape(output_tensors, output_arrays)
 
+    @pytest.mark.parametrize('axis', [-1, [1, 2]])
+    def test_layer_normalization(self, axis):
+        x_np = np.random.random((3, 2, 4)) * 10
+        gamma_np = np.random.random((2, 4))
+        beta_np = np.random.random((2, 4))
+        axes = tuple(axis) if isinstance(axis, list) else axis
+        mean = x_np.mean(axis=axes, keepdims=True)
+        var = x_np.var(axis=axes, keepdims=True)
+        expected = (x_np - mean) / np.sqrt(var + 1e-3) * gamma_np + beta_np
+        for k in WITH_NP:
+            output = k.layer_normalization(k.variable(x_np),
+                                           k.variable(gamma_np),
+                                           k.variable(beta_np), axis=axis)
+            assert_allclose(k.eval(output), expected, atol=1e-4)
+            output = k.layer_normalization(k.variable(x_np), axis=axis)
+            assert_allclose(k.eval(output), (x_np - mean) / np.sqrt(var + 1e-3),
+                            atol=1e-4)
+
+    @pytest.mark.skipif(K.backend() not in ('tensorflow', 'theano'),
+                        reason='cntk and numpy do not support gradients '
+                               'in this way.')
+    @pytest.mark.parametrize('axis', [-1, [1, 2]])
+    def test_layer_normalization_gradient(self, axis):
+        # Inputs far from 0, for the numerical stability of the moments.
+        x_np = np.random.random((3, 2, 4)) * 10 + 100
+        dy_np = np.random.random((3, 2, 4))
+        axes = tuple(axis) if isinstance(axis, list) else axis
+        mean = x_np.mean(axis=axes, keepdims=True)
+        inv = 1. / np.sqrt(x_np.var(axis=axes, keepdims=True) + 1e-3)
+        normalized = (x_np - mean) * inv
+        expected = inv * (dy_np - dy_np.mean(axis=axes, keepdims=True) -
+                          normalized * (dy_np * normalized).mean(axis=axes,
+                                                                 keepdims=True))
+        x = K.variable(x_np)
+        output = K.layer_normalization(x, axis=axis)
+        assert_allclose(K.eval(output), normalized, atol=1e-3)
+        loss = K.sum(output * K.constant(dy_np))
+        assert_allclose(K.eval(K.gradients(loss, [x])[0]), expected, atol=1e-3)
+
     @pytest.mark.skipif(K.backend() != 'theano',
                         reason='Specific to Theano.')
     @pytest.mark.parametrize('x_shape', [(1, 4, 2, 3), (1, 2, 3, 4)])
@@ -1940,6 +2068,48 @@ class TestBackend(object):
         # not merged: A A B B
         assert np.allclose(decode(merge_repeated=False), [np.array([[0, 0, 1, 1]])])
 
+    def test_ctc_decode_numpy(self):
+        # Same inputs and truth as `test_ctc_decode_beam_search`.
+        input_prob_matrix_0 = np.asarray(
+            [[0.30999, 0.309938, 0.0679938, 0.0673362, 0.0708352, 0.173908],
+             [0.215136, 0.439699, 0.0370931, 0.0393967, 0.0381581, 0.230517],
+             [0.199959, 0.489485, 0.0233221, 0.0251417, 0.0233289, 0.238763],
+             [0.279611, 0.452966, 0.0204795, 0.0209126, 0.0194803, 0.20655],
+             [0.51286, 0.288951, 0.0243026, 0.0220788, 0.0219297, 0.129878]],
+            dtype=np.float32)
+        inputs = np.exp(np.concatenate([input_prob_matrix_0 + 2.0,
+                                        np.zeros((2, 6), dtype=np.float32)]))
+        inputs = np.stack([inputs, inputs])
+        input_length = np.array([5, 3])
+
+        decoded, log_prob = KNP.ctc_decode(inputs, input_length,
+                                           greedy=False, beam_width=2,
+                                           top_paths=2)
+        assert len(decoded) == 2
+        assert_allclose(decoded[0][0], [1, 0])
+        assert_allclose(decoded[1][0, :1], [1])
+        assert_allclose(log_prob[0], [-5.811451, -6.63339], atol=1e-5)
+
+        # Greedy decoding of the whole batch matches decoding each sample.
+        decoded, log_prob = KNP.ctc_decode(inputs, input_length)
+        for i, length in enumerate(input_length):
+            best_path = np.argmax(inputs[i, :length], axis=-1)
+            expected = [x for j, x in enumerate(best_path)
+                        if x != 5 and (j == 0 or x != best_path[j - 1])]
+            assert_allclose(decoded[i, :len(expected)], expected)
+            assert np.all(decoded[i, len(expected):] == -1)
+            assert_allclose(log_prob[i, 0], -np.sum(np.log(
+                np.max(inputs[i, :length], axis=-1))), rtol=1e-5)
+
+        input_prob = np.array([[[0, 0, 1], [1, 0, 0], [0, 0, 1], [1, 0, 0],
+                                [0, 1, 0], [0, 0, 1], [0, 1, 0]]])
+        for merge_repeated, expected in [(True, [0, 1]),
+                                         (False, [0, 0, 1, 1])]:
+            decoded, _ = KNP.ctc_decode(input_prob, np.array([7]),
+                                        greedy=False, beam_width=1,
+                                        merge_repeated=merge_repeated)
+            assert_allclose(decoded[0], [expected])
+
     def test_one_hot(self):
         input_length = 10
         num_classes = 20
@@ -2146,6 +2316,89 @@ class TestBackend(object):
         assert np.allclose(K.eval(K.clip(x_k, min_val_k, max_val_k)),
                            KNP.eval(KNP.clip(x, min_val, max_val)))
 
+    def test_count_sketch(self):
+        input_dim, d = 20, 8
+        h = np.random.randint(0, d, size=(input_dim,))
+        s = np.random.randint(0, 2, size=(input_dim,)) * 2 - 1
+        _, x = parse_shape_or_val((3, input_dim))
+        expected = np.zeros((3, d))
+        for i in range(input_dim):
+            expected[:, h[i]] += s[i] * x[:, i]
+        z_list = [k.eval(k.count_sketch(k.variable(h, dtype='int64'),
+                                        k.variable(s, dtype='int64'),
+                                        k.variable(x), d))
+                  for k in WITH_NP]
+        for z in z_list:
+            assert_allclose(z, expected, atol=1e-05)
+
+    @pytest.mark.parametrize('n', [7, 8])
+    def test_scan_conv1d(self, n):
+        _, u = parse_shape_or_val((3, n))
+        _, v = parse_shape_or_val((3, n))
+        expected = np.stack([np.convolve(u_i, v_i)[n // 2:n // 2 + n]
+                             for u_i, v_i in zip(u, v)])
+        z_list = [k.eval(k.scan_conv1d(k.variable(u), k.variable(v)))
+                  for k in WITH_NP]
+        for z in z_list:
+            assert_allclose(z, expected, atol=1e-05)
+
+    def test_numpy_backend_function(self):
+        val = np.random.random((2,))
+        input_val = np.random.random((4, 2))
+        x = KNP.variable(val)
+        y = KNP.placeholder(shape=(None, 2))
+        out = KNP.square(x) + y
+        assert KNP.is_tensor(out)
+        assert KNP.int_shape(out) == (None, 2)
+        f = KNP.function([y], [out], updates=[(x, KNP.identity(x) * 2)])
+        assert_allclose(f([input_val])[0], val ** 2 + input_val, atol=1e-05)
+        assert_allclose(KNP.get_value(x), val * 2, atol=1e-05)
+        with pytest.raises(ValueError):
+            KNP.eval(out)
+
+    @pytest.mark.parametrize('go_backwards', [False, True])
+    def test_numpy_backend_symbolic_rnn(self, go_backwards):
+        num_samples, timesteps, input_dim, output_dim = 4, 6, 5, 3
+        _, x = parse_shape_or_val((num_samples, timesteps, input_dim))
+        _, h0 = parse_shape_or_val((num_samples, output_dim))
+        _, wi = parse_shape_or_val((input_dim, output_dim))
+        mask = np.random.randint(2, size=(num_samples, timesteps))
+
+        def get_step_function(w_i):
+            def step(inputs, states):
+                y = KNP.dot(inputs, w_i) + states[0]
+                return y, [y]
+            return step
+
+        expected = KNP.rnn(get_step_function(wi), x, [h0], mask=mask,
+                           go_backwards=go_backwards,
+                           pos_extra_outputs_states=[0])
+
+        x_ph = KNP.placeholder(shape=(None, timesteps, input_dim))
+        mask_ph = KNP.placeholder(shape=(None, timesteps), dtype='int32')
+        h0_ph = KNP.placeholder(shape=(None, output_dim))
+        last_output, outputs, states = KNP.rnn(
+            get_step_function(KNP.variable(wi)), x_ph, [h0_ph], mask=mask_ph,
+            go_backwards=go_backwards, pos_extra_outputs_states=[0])
+        f = KNP.function([x_ph, mask_ph, h0_ph],
+                         [last_output, outputs, states[0]])
+        for z, e in zip(f([x, mask, h0]), [expected[0], expected[1],
+                                           expected[2][0]]):
+            assert_allclose(z, e, atol=1e-05)
+
+    @pytest.mark.parametrize('strides', [(1, 1), (2, 2), (2, 3)])
+    @pytest.mark.parametrize('padding', ['valid', 'same'])
+    def test_numpy_backend_conv_transpose_is_adjoint(self, strides, padding):
+        # <conv(u), x> == <u, conv_transpose(x)> for any u and x.
+        _, u = parse_shape_or_val((2, 9, 8, 3))
+        _, kernel = parse_shape_or_val((3, 2, 3, 4))
+        y = KNP.conv2d(u, kernel, strides=strides, padding=padding)
+        _, x = parse_shape_or_val(y.shape)
+        z = KNP.conv2d_transpose(x, kernel, u.shape, strides=strides,
+                                 padding=padding)
+        assert z.shape == u.shape
+        assert_allclose(np.sum(y * x), np.sum(u * z), rtol=1e-05)
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -1,6 +1,20 @@
 from __future__ import print_function
 import pytest
-# import keras.caffe.convert as convert
+import struct
+import numpy as np
+from numpy.testing import assert_allclose
+
+from keras import backend as K
+from keras import layers
+from keras.models import Model
+from keras.utils import conv_utils
+
+pytest.importorskip('google.protobuf')
+pytest.importorskip('h5py')
+
+from keras.caffe import caffe_pb2 as caffe  # noqa: E402
+from keras.caffe import convert  # noqa: E402
+from keras.caffe.caffe_utils import iter_caffemodel  # noqa: E402
 
 
 def test_convertGoogleNet():
@@ -22,6 +36,182 @@ def test_convertGoogleNet():
     # model.save_weights(store_path + '/Keras_model_weights.h5', overwrite=True)
 
 
+def random_blob(*shape):
+    return np.random.random(shape).astype(np.float32)
+
+
+def set_blob(blob, array, legacy_shape=False, double=False):
+    if legacy_shape:
+        blob.num, blob.channels, blob.height, blob.width = array.shape
+    else:
+        blob.shape.dim.extend(array.shape)
+    if double:
+        blob.double_data.extend(array.ravel().tolist())
+    else:
+        blob.data.extend(array.ravel().tolist())
+
+
+def unpacked_blob_field(array):
+    """Serializes a LayerParameter.blobs field whose data is not packed,
+    as written by old versions of Caffe.
+    """
+    blob = caffe.BlobProto()
+    blob.shape.dim.extend(array.shape)
+    data = blob.SerializeToString()
+    for value in array.ravel():
+        # BlobProto.data (5), wire type 5 (32-bit)
+        data += b'\x2d' + struct.pack('<f', value)
+    # LayerParameter.blobs (7), wire type 2 (length-delimited)
+    return b'\x3a' + encode_varint(len(data)) + data
+
+
+def encode_varint(value):
+    data = bytearray()
+    while value > 0x7f:
+        data.append(value & 0x7f | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def make_caffemodel(path, blobs):
+    """Writes a caffemodel with V2 layers (`net.layer`) and V1 layers
+    (`net.layers`) covering the blob encodings read by the converter.
+    """
+    net = caffe.NetParameter()
+    net.name = 'test'
+
+    # Grouped convolution, packed float data.
+    conv = net.layer.add()
+    conv.name = 'conv_g'
+    conv.type = 'Convolution'
+    conv.convolution_param.num_output = 4
+    conv.convolution_param.group = 2
+    set_blob(conv.blobs.add(), blobs['conv_g'][0])
+    set_blob(conv.blobs.add(), blobs['conv_g'][1])
+
+    # Convolution without bias, double data.
+    conv = net.layer.add()
+    conv.name = 'conv_nb'
+    conv.type = 'Convolution'
+    conv.convolution_param.num_output = 2
+    conv.convolution_param.bias_term = False
+    set_blob(conv.blobs.add(), blobs['conv_nb'][0], double=True)
+
+    # Layer without weights.
+    relu = net.layer.add()
+    relu.name = 'relu'
+    relu.type = 'ReLU'
+
+    # V1 inner product, legacy 4D blob shapes.
+    fc = net.layers.add()
+    fc.name = 'fc'
+    fc.type = caffe.V1LayerParameter.INNER_PRODUCT
+    set_blob(fc.blobs.add(), blobs['fc'][0].reshape((1, 1, 3, 2)),
+             legacy_shape=True)
+    set_blob(fc.blobs.add(), blobs['fc'][1].reshape((1, 1, 1, 3)),
+             legacy_shape=True)
+
+    # V2 inner product, unpacked float data.
+    fc = caffe.LayerParameter()
+    fc.name = 'fc2'
+    fc.type = 'InnerProduct'
+    data = fc.SerializeToString()
+    for blob in blobs['fc2']:
+        data += unpacked_blob_field(blob)
+    # NetParameter.layer (100), wire type 2 (length-delimited)
+    layer_field = encode_varint(100 << 3 | 2) + encode_varint(len(data)) + data
+
+    with open(path, 'wb') as f:
+        f.write(net.SerializeToString() + layer_field)
+
+
+def expected_kernel(kernel, group=1):
+    """Keras kernel of a Caffe (out, in / group, rows, cols) kernel.
+    """
+    nb_filter, stack_size, rows, cols = kernel.shape
+    expected = np.zeros((rows, cols, stack_size * group, nb_filter),
+                        dtype=np.float32)
+    per_group = nb_filter // group
+    for out in range(nb_filter):
+        g = out // per_group
+        for i in range(stack_size):
+            expected[:, :, g * stack_size + i, out] = kernel[out, i]
+    if K.backend() == 'theano':
+        expected = conv_utils.convert_kernel(expected)
+    return expected
+
+
+@pytest.fixture
+def caffemodel(tmpdir):
+    np.random.seed(1337)
+    blobs = {'conv_g': [random_blob(4, 2, 3, 3), random_blob(4)],
+             'conv_nb': [random_blob(2, 4, 3, 3)],
+             'fc': [random_blob(3, 2), random_blob(3)],
+             'fc2': [random_blob(2, 3), random_blob(2)]}
+    path = str(tmpdir / 'test.caffemodel')
+    make_caffemodel(path, blobs)
+    expected = {
+        'conv_g': [expected_kernel(blobs['conv_g'][0], group=2),
+                   blobs['conv_g'][1]],
+        'conv_nb': [expected_kernel(blobs['conv_nb'][0])],
+        'fc': [blobs['fc'][0].T, blobs['fc'][1]],
+        'fc2': [blobs['fc2'][0].T, blobs['fc2'][1]]}
+    return path, expected
+
+
+def test_iter_caffemodel(caffemodel):
+    path, expected = caffemodel
+    streamed = {}
+    names = []
+    for layer, blobs in iter_caffemodel(path):
+        names.append(layer.name)
+        assert not layer.blobs
+        weights = convert.convert_layer_weights(layer, blobs)
+        if weights is not None:
+            streamed[layer.name] = weights
+    assert sorted(names) == ['conv_g', 'conv_nb', 'fc', 'fc2', 'relu']
+
+    # Same weights as the conversion of the whole parsed caffemodel.
+    net = caffe.NetParameter()
+    with open(path, 'rb') as f:
+        net.ParseFromString(f.read())
+    parsed = convert.convert_weights(net.layer, 'V2')
+    parsed.update(convert.convert_weights(net.layers, 'V1'))
+
+    assert sorted(streamed) == sorted(expected)
+    assert sorted(parsed) == sorted(expected)
+    for name in expected:
+        assert len(streamed[name]) == len(expected[name])
+        assert len(parsed[name]) == len(expected[name])
+        for w, p, e in zip(streamed[name], parsed[name], expected[name]):
+            assert w.dtype == np.float32
+            assert w.shape == e.shape
+            assert_allclose(w, e)
+            assert_allclose(p, e)
+
+
+def test_caffemodel_to_hdf5(caffemodel, tmpdir):
+    path, expected = caffemodel
+    filepath = str(tmpdir / 'weights.h5')
+    convert.caffemodel_to_hdf5(path, filepath)
+
+    inputs = layers.Input((5, 5, 4))
+    x = layers.Conv2D(4, (3, 3), name='conv_g')(inputs)
+    x = layers.Conv2D(2, (3, 3), use_bias=False, name='conv_nb')(x)
+    x = layers.Activation('relu', name='relu')(x)
+    x = layers.Flatten()(x)
+    x = layers.Dense(3, name='fc')(x)
+    x = layers.Dense(2, name='fc2')(x)
+    model = Model(inputs, x)
+    model.load_weights(filepath, by_name=True)
+
+    for name in expected:
+        weights = model.get_layer(name).get_weights()
+        assert len(weights) == len(expected[name])
+        for w, e in zip(weights, expected[name]):
+            assert_allclose(w, e)
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
-    # test_convertGoogleNet()
@@ -709,6 +709,85 @@ def test_EarlyStopping_final_weights_when_restoring_model_weights():
     assert early_stop.model.get_weights() == 2
 
 
+def test_EarlyStopping_restores_weights_snapshot():
+    model = Sequential([Dense(num_classes, input_dim=input_dim)])
+    model.stop_training = False
+    weights = model.get_weights()
+    early_stop = callbacks.EarlyStopping(monitor='val_loss', patience=2,
+                                         restore_best_weights=True)
+    early_stop.set_model(model)
+
+    losses = [0.2, 0.15, 0.1, 0.11, 0.12]
+    early_stop.on_train_begin()
+    for epoch in range(len(losses)):
+        model.set_weights([w + epoch for w in weights])
+        early_stop.on_epoch_end(epoch, logs={'val_loss': losses[epoch]})
+        if model.stop_training:
+            break
+
+    assert epoch == 4
+    for w, best_w in zip(model.get_weights(), weights):
+        assert_allclose(w, best_w + 2)
+    for w, best_w in zip(early_stop.best_weights, model.get_weights()):
+        assert_allclose(w, best_w)
+
+    # The snapshot cannot be restored in another model.
+    other_model = Sequential([Dense(num_classes, input_dim=input_dim)])
+    with pytest.raises(ValueError):
+        early_stop._best_weights.restore(other_model)
+
+
+def test_ReduceLROnPlateau_restore_best_weights():
+    class DummyOptimizer(object):
+        def __init__(self):
+            self.lr = K.variable(1.0)
+
+    class DummyModel(object):
+        def __init__(self):
+            self.optimizer = DummyOptimizer()
+            self.weights = -1
+
+        def get_weights(self):
+            return self.weights
+
+        def set_weights(self, weights):
+            self.weights = weights
+
+    reduce_on_plateau = callbacks.ReduceLROnPlateau(monitor='val_loss',
+                                                    patience=2,
+                                                    restore_best_weights=True)
+    reduce_on_plateau.model = DummyModel()
+
+    losses = [0.2, 0.1, 0.11, 0.12]
+    for epoch in range(len(losses)):
+        reduce_on_plateau.model.weights = epoch
+        reduce_on_plateau.on_epoch_end(epoch, logs={'val_loss': losses[epoch]})
+
+    assert K.get_value(reduce_on_plateau.model.optimizer.lr) < 1.0
+    assert reduce_on_plateau.model.get_weights() == 1
+
+
+def test_ExponentialMovingAverage():
+    model = Sequential([Dense(num_classes, input_dim=input_dim)])
+    weights = model.get_weights()
+    ema = callbacks.ExponentialMovingAverage(decay=0.5)
+    ema.set_model(model)
+
+    ema.on_train_begin()
+    expected = weights
+    for batch in range(3):
+        model.set_weights([w + batch + 1 for w in weights])
+        ema.on_batch_end(batch)
+        expected = [0.5 * e + 0.5 * (w + batch + 1)
+                    for e, w in zip(expected, weights)]
+    ema.on_train_end()
+    for w, e in zip(model.get_weights(), expected):
+        assert_allclose(w, e, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        callbacks.ExponentialMovingAverage(decay=1.)
+
+
 def test_LearningRateScheduler():
     np.random.seed(1337)
     (X_train, y_train), (X_test, y_test) = get_data_callbacks()
@@ -5,6 +5,7 @@ import pytest
 
 from keras.datasets import boston_housing
 from keras.datasets import imdb
+from keras.datasets import mnist
 from keras.datasets import reuters
 
 
@@ -57,6 +58,44 @@ def fake_downloaded_reuters_path(monkeypatch):
         yield f.name
 
 
+@pytest.fixture
+def fake_downloaded_mnist_path(tmpdir, monkeypatch):
+    rng = np.random.RandomState(123)
+    path = str(tmpdir.join('mnist.npz'))
+    np.savez(path,
+             x_train=rng.randint(0, 256, size=(100, 28, 28)).astype('uint8'),
+             y_train=rng.randint(0, 10, size=100).astype('uint8'),
+             x_test=rng.randint(0, 256, size=(20, 28, 28)).astype('uint8'),
+             y_test=rng.randint(0, 10, size=20).astype('uint8'))
+    monkeypatch.setattr(mnist, 'get_file', lambda *args, **kwargs: path)
+    yield path
+
+
+def test_mnist_load_uses_cache(fake_downloaded_mnist_path):
+    (x_train, y_train), (x_test, y_test) = mnist.load_data()
+    with np.load(fake_downloaded_mnist_path) as f:
+        expected = [f['x_train'], f['y_train'], f['x_test'], f['y_test']]
+    for array, expected_array in zip([x_train, y_train, x_test, y_test],
+                                     expected):
+        assert np.array_equal(array, expected_array)
+        assert array.dtype == expected_array.dtype
+
+    # The second load memory-maps the cached arrays.
+    (x_train, y_train), (x_test, y_test) = mnist.load_data()
+    assert isinstance(x_train, np.memmap)
+    assert np.array_equal(x_train, expected[0])
+    assert np.array_equal(y_test, expected[3])
+
+
+def test_imdb_load_uses_cache(fake_downloaded_imdb_path):
+    (x_train, y_train), (x_test, y_test) = imdb.load_data(
+        path=fake_downloaded_imdb_path, maxlen=50)
+    (x_train_2, y_train_2), (x_test_2, y_test_2) = imdb.load_data(
+        path=fake_downloaded_imdb_path, maxlen=50)
+    assert x_train.tolist() == x_train_2.tolist()
+    assert np.array_equal(y_test, y_test_2)
+
+
 def test_boston_load_does_not_affect_global_rng(fake_downloaded_boston_path):
     np.random.seed(1337)
     before = np.random.randint(0, 100, size=10)
@@ -0,0 +1,146 @@
+import os
+import pickle
+
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+from keras import backend as K
+from keras.engine import function_cache
+from keras.engine.function_cache import FunctionCache
+from keras.layers import Dense
+from keras.models import Sequential
+
+
+def test_function_cache_get_put(tmpdir):
+    cache = FunctionCache(str(tmpdir.join('cache')))
+    assert cache.get('a') is None
+    cache.put('a', b'compiled')
+    assert cache.get('a') == b'compiled'
+    cache.remove('a')
+    assert cache.get('a') is None
+    assert cache.stats['hits'] == 1
+    assert cache.stats['misses'] == 2
+    assert cache.stats['stores'] == 1
+    assert '1 hits, 2 misses' in cache.summary()
+
+
+def test_function_cache_eviction(tmpdir):
+    cache = FunctionCache(str(tmpdir), max_size=250)
+    for i, key in enumerate(['a', 'b']):
+        cache.put(key, b'x' * 100)
+        os.utime(cache._path(key), (i, i))
+    # Reading `a` makes `b` the least recently used entry.
+    assert cache.get('a') is not None
+    cache.put('c', b'x' * 100)
+    assert cache.stats['evictions'] == 1
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+
+
+def test_function_cache_get_identifier(tmpdir, monkeypatch):
+    cache = FunctionCache(str(tmpdir))
+    assert function_cache.get(cache) is cache
+    assert function_cache.get(str(tmpdir)).directory == str(tmpdir)
+    assert function_cache.get(False) is None
+    monkeypatch.delenv('KERAS_FUNCTION_CACHE', raising=False)
+    assert function_cache.get(None) is None
+    monkeypatch.setenv('KERAS_FUNCTION_CACHE', str(tmpdir))
+    monkeypatch.setenv('KERAS_FUNCTION_CACHE_SIZE', '3')
+    default_cache = function_cache.get(None)
+    assert default_cache.directory == str(tmpdir)
+    assert default_cache.max_size == 3 * 2 ** 20
+    assert function_cache.get(None) is default_cache
+    with pytest.raises(ValueError):
+        function_cache.get(3)
+
+
+def _make_model(cache):
+    model = Sequential([Dense(3, input_shape=(4,), activation='relu'),
+                        Dense(2)])
+    model.compile('sgd', 'mse', function_cache=cache)
+    return model
+
+
+@pytest.mark.skipif(K.backend() != 'theano',
+                    reason='Only Theano functions can be cached.')
+def test_function_cache_model(tmpdir):
+    cache = FunctionCache(str(tmpdir))
+    x = np.random.random((5, 4))
+    y = np.random.random((5, 2))
+
+    model = _make_model(cache)
+    model.train_on_batch(x, y)
+    model.predict(x)
+    assert cache.stats['misses'] == 2
+    assert cache.stats['stores'] == 2
+
+    # A model of the same architecture loads its functions from the
+    # cache, bound to its own weights.
+    model = _make_model(cache)
+    expected = np.maximum(np.dot(x, model.get_weights()[0]) +
+                          model.get_weights()[1], 0)
+    expected = np.dot(expected, model.get_weights()[2]) + model.get_weights()[3]
+    assert_allclose(model.predict(x), expected, atol=1e-5)
+    old_weights = model.get_weights()
+    model.train_on_batch(x, y)
+    assert cache.stats['hits'] == 2
+    assert cache.stats['misses'] == 2
+    assert not np.allclose(model.get_weights()[0], old_weights[0])
+
+
+def test_function_cache_model_any_backend(tmpdir, monkeypatch):
+    # Functions are "serialized" as a marker and built again on load,
+    # so that the caching logic runs with every backend.
+    def function_signature(inputs, outputs, updates=[], **kwargs):
+        return str([K.int_shape(x) for x in inputs + outputs])
+
+    def serialize_function(f):
+        return pickle.dumps('function')
+
+    def deserialize_function(data, inputs, outputs, updates=[], name=None):
+        assert pickle.loads(data) == 'function'
+        return K.function(inputs, outputs, updates=updates, name=name)
+
+    for f in (function_signature, serialize_function, deserialize_function):
+        monkeypatch.setattr(K, f.__name__, f, raising=False)
+
+    cache = FunctionCache(str(tmpdir))
+    x = np.random.random((5, 4))
+    model = _make_model(cache)
+    y = model.predict(x)
+    assert cache.stats['misses'] == 1
+    assert cache.stats['stores'] == 1
+
+    # The loaded function uses the weights of the new model.
+    model = _make_model(cache)
+    assert not np.allclose(model.predict(x), y)
+    assert cache.stats['hits'] == 1
+
+    # Corrupted entries are errors, not hits, and are replaced.
+    for filename in os.listdir(str(tmpdir)):
+        with open(os.path.join(str(tmpdir), filename), 'wb') as f:
+            f.write(b'corrupted')
+    model = _make_model(cache)
+    with pytest.warns(UserWarning):
+        model.predict(x)
+    assert cache.stats['hits'] == 1
+    assert cache.stats['errors'] == 1
+    assert cache.stats['stores'] == 2
+    model = _make_model(cache)
+    model.predict(x)
+    assert cache.stats['hits'] == 2
+
+
+def test_function_cache_unsupported_backend(tmpdir):
+    if hasattr(K, 'function_signature'):
+        pytest.skip('The backend supports function caching.')
+    cache = FunctionCache(str(tmpdir))
+    model = _make_model(cache)
+    model.predict(np.random.random((5, 4)))
+    assert cache.stats['hits'] == cache.stats['misses'] == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -825,6 +825,145 @@ def test_multi_output_mask():
     assert K.int_shape(z)[1:] == (16, 16, 3)
 
 
+def test_get_submodel():
+    src = Input(shape=(4,), name='src')
+    state = Input(shape=(3,), name='state')
+    extra = Input(shape=(2,), name='extra')
+    enc = Dense(5, name='enc')(src)
+    dec = Dense(3, name='dec')(layers.concatenate([enc, state]))
+    out = Dense(2, name='out')(dec)
+    aux = Dense(2, name='aux')(extra)
+    model = Model([src, state, extra], [out, aux])
+
+    # Unused branches and inputs are pruned.
+    encoder = model.get_submodel('enc')
+    assert [layer.name for layer in encoder.layers] == ['src', 'enc']
+    assert encoder.outputs == [enc]
+
+    # The encoder output is fed instead of being computed.
+    decoder = model.get_submodel([out, 'dec'], inputs='enc')
+    assert decoder.input_names == ['enc_output', 'state']
+    assert decoder.output_names == ['out', 'dec']
+    assert 'enc' not in [layer.name for layer in decoder.layers]
+
+    x_src = np.random.random((2, 4))
+    x_state = np.random.random((2, 3))
+    x_extra = np.random.random((2, 2))
+    expected = model.predict([x_src, x_state, x_extra])[0]
+    out_val, _ = decoder.predict([encoder.predict(x_src), x_state])
+    np.testing.assert_allclose(out_val, expected, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        model.get_submodel(Input(shape=(3,)))
+
+
+def test_model_called_twice_on_new_inputs():
+    a = Input(shape=(3,))
+    b = Input(shape=(2,))
+    h = Dense(4)(a)
+    out = Dense(2)(layers.concatenate([h, b]))
+    model = Model([a, b], [out, h])
+
+    inputs = [Input(shape=(3,)), Input(shape=(2,)),
+              Input(shape=(3,)), Input(shape=(2,))]
+    outputs = model(inputs[:2]) + model(inputs[2:])
+    twice = Model(inputs, outputs)
+
+    data = [np.random.random((4, 3)), np.random.random((4, 2)),
+            np.random.random((4, 3)), np.random.random((4, 2))]
+    results = twice.predict(data)
+    expected = model.predict(data[:2]) + model.predict(data[2:])
+    for result, value in zip(results, expected):
+        np.testing.assert_allclose(result, value, atol=1e-5)
+
+
+def test_model_masks_on_new_inputs():
+    class MaskOutput(Layer):
+        """Outputs the mask computed for its input."""
+
+        def call(self, inputs, mask=None, scale=1.):
+            return scale * K.cast(mask, K.floatx())
+
+        def compute_mask(self, inputs, mask=None):
+            return None
+
+        def compute_output_shape(self, input_shape):
+            return input_shape[:2]
+
+    inputs = Input(shape=(3, 2))
+    masked = layers.Masking(mask_value=0.)(inputs)
+    # The node of the layer has arguments, besides the mask.
+    mask = MaskOutput()(masked, scale=2.)
+    model = Model(inputs, [mask, masked])
+
+    x1 = Input(shape=(3, 2))
+    x2 = Input(shape=(3, 2))
+    mask1, masked1 = model(x1)
+    mask2, masked2 = model(x2)
+    masks1 = model.get_output_mask_at(1)
+    masks2 = model.get_output_mask_at(2)
+    assert masks1[0] is None and masks1[1] is not None
+    assert masks2[1] is not masks1[1]
+    twice = Model([x1, x2], [mask1, mask2])
+
+    data1 = np.ones((2, 3, 2))
+    data1[0, 1] = 0.
+    data2 = np.ones((2, 3, 2))
+    data2[1, 2] = 0.
+    # Each call uses the mask of its own inputs.
+    values1, values2 = twice.predict([data1, data2])
+    np.testing.assert_allclose(values1, [[2, 0, 2], [2, 2, 2]])
+    np.testing.assert_allclose(values2, [[2, 2, 2], [2, 2, 0]])
+    values1, values2 = twice.predict([data2, data1])
+    np.testing.assert_allclose(values1, [[2, 2, 2], [2, 2, 0]])
+    np.testing.assert_allclose(values2, [[2, 0, 2], [2, 2, 2]])
+
+
+def test_sequential_called_after_add_and_pop():
+    model = Sequential([Dense(2, input_shape=(3,), kernel_initializer='ones')])
+    data = np.random.random((4, 3))
+    total = data.sum(axis=1, keepdims=True)
+
+    y = model(Input(shape=(3,)))
+    assert y._keras_shape == (None, 2)
+
+    model.add(Dense(5, kernel_initializer='ones', bias_initializer='ones'))
+    x = Input(shape=(3,))
+    y = model(x)
+    assert y._keras_shape == (None, 5)
+    np.testing.assert_allclose(Model(x, y).predict(data),
+                               np.tile(2 * total + 1, (1, 5)), atol=1e-5)
+
+    model.pop()
+    x = Input(shape=(3,))
+    y = model(x)
+    assert y._keras_shape == (None, 2)
+    np.testing.assert_allclose(Model(x, y).predict(data),
+                               np.tile(total, (1, 2)), atol=1e-5)
+
+
+def test_snapshot_weights():
+    model = Sequential([Dense(3, input_shape=(2,)), Dense(1)])
+    weights = model.get_weights()
+    snapshot = model.snapshot_weights()
+    snapshot.save()
+    model.set_weights([w + 1 for w in weights])
+    for value, w in zip(snapshot.get_values(), weights):
+        np.testing.assert_allclose(value, w)
+    snapshot.restore()
+    for value, w in zip(model.get_weights(), weights):
+        np.testing.assert_allclose(value, w)
+
+    # Snapshot of a subset of the weights, holding a moving average.
+    kernel = model.layers[0].kernel
+    snapshot = model.snapshot_weights([kernel])
+    snapshot.save()
+    K.set_value(kernel, K.get_value(kernel) + 1)
+    snapshot.average(0.75)
+    np.testing.assert_allclose(snapshot.get_values()[0], weights[0] + 0.25,
+                               atol=1e-6)
+
+
 def test_constant_initializer_with_numpy():
     model = Sequential()
     model.add(Dense(2, input_shape=(3,),
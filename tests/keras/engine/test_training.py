@@ -761,6 +761,39 @@ def test_fit_generator_dynamic_size_sequence_main_thread():
     assert tracker_cb.steps_per_epoch_log[0:5] == [202, 101, 51, 26, 13]
 
 
+def test_fit_generator_standardizes_in_background():
+    # The batches are standardized in a background thread, and fed to the
+    # train function in the thread of `fit_generator`.
+    inputs = Input((3,))
+    model = Model(inputs, Dense(2, activation='softmax')(inputs))
+    model.compile('sgd', 'categorical_crossentropy')
+    x = sparse.random(4, 3, density=0.5, format='csr')
+    y = np.eye(2)[[0, 1, 1, 0]]
+    standardizing_threads = set()
+    fed = []
+    standardize_arrays = model._standardize_arrays
+
+    def standardize(*args, **kwargs):
+        standardizing_threads.add(threading.current_thread())
+        return standardize_arrays(*args, **kwargs)
+
+    def train_function(ins):
+        fed.append((threading.current_thread(), ins))
+        return [0.]
+
+    model._standardize_arrays = standardize
+    model.train_function = train_function
+    model.fit_generator(iter([(x, y)] * 3), steps_per_epoch=3, verbose=0,
+                        class_weight={0: 1., 1: 2.}, workers=0)
+    assert threading.current_thread() not in standardizing_threads
+    assert len(fed) == 3
+    for thread, ins in fed:
+        assert thread is threading.current_thread()
+        assert_allclose(ins[0], x.toarray())
+        assert_allclose(ins[1], y)
+        assert_allclose(ins[2], [1., 2., 2., 1.])
+
+
 def test_fit_generator_shape():
     # predict_generator output shape behavior should be consistent
     def expected_shape(batch_size, n_batches):
@@ -931,6 +964,32 @@ def DISABLED_test_sparse_placeholder_fit():
     model.evaluate(test_inputs, test_outputs, batch_size=2)
 
 
+@pytest.mark.skipif(K.backend() == 'cntk',
+                    reason='Sparse inputs of Dense are not supported by CNTK.')
+def test_sparse_input_dense():
+    x = sparse.random(20, 50, density=0.1, format='csr', dtype='float32')
+    y = np.random.random((20, 4))
+    models = []
+    for sparse_input in [True, False]:
+        inp = Input(shape=(50,), sparse=sparse_input)
+        model = Model(inp, Dense(4)(inp))
+        if models:
+            model.set_weights(models[0].get_weights())
+        model.compile('sgd', 'mse')
+        # Same shuffling of the batches.
+        np.random.seed(1337)
+        model.fit(x, y, batch_size=3, epochs=2)
+        models.append(model)
+
+    for w_sparse, w_dense in zip(*[m.get_weights() for m in models]):
+        assert_allclose(w_sparse, w_dense, rtol=1e-5)
+    assert_allclose(models[0].predict(x, batch_size=3),
+                    models[1].predict(x.toarray(), batch_size=3), rtol=1e-5)
+    assert_allclose(models[0].evaluate(x, y, batch_size=3),
+                    models[1].evaluate(x.toarray(), y, batch_size=3),
+                    rtol=1e-5)
+
+
 def test_trainable_argument():
     x = np.random.random((5, 3))
     y = np.random.random((5, 2))
@@ -1897,6 +1956,128 @@ def test_validation_freq():
     assert val_counter.val_runs == 3
 
 
+def test_evaluate_on_metrics():
+    model = Sequential([Dense(3, input_shape=(4,), activation='softmax',
+                              kernel_regularizer='l2')])
+    model.compile('sgd', 'categorical_crossentropy', metrics=['acc', 'mae'])
+    x = np.random.random((10, 4))
+    y = np.eye(3)[np.random.randint(0, 3, size=10)]
+
+    # The metrics match those of `evaluate`, without the loss.
+    outs = model.evaluate(x, y, batch_size=4)
+    metrics_outs = model.evaluate_on_metrics(x, y, batch_size=4)
+    assert_allclose(metrics_outs, outs[1:], rtol=1e-5)
+
+    history = model.fit(x, y, batch_size=4, epochs=2,
+                        validation_data=(x, y),
+                        validation_metrics_only=True)
+    assert 'val_acc' in history.history
+    assert 'val_mae' in history.history
+    assert 'val_loss' not in history.history
+
+    model = Sequential([Dense(3, input_shape=(4,))])
+    model.compile('sgd', 'mse')
+    with pytest.raises(ValueError):
+        model.evaluate_on_metrics(x, y)
+
+
+def test_ema_weights():
+    class Bias(Layer):
+
+        def build(self, input_shape):
+            self.bias = self.add_weight('bias', (1,), initializer='zeros')
+
+        def call(self, inputs):
+            return inputs + self.bias
+
+    inp = Input(shape=(1,))
+    out = Bias()(inp)
+    model = Model(inp, out)
+    model.compile(keras.optimizers.SGD(lr=0.1), 'mae', ema_decay=0.5)
+
+    x = np.array([[0.], [1.], [2.]])
+    y = np.array([[0.5], [2.], [3.5]])
+    for _ in range(3):
+        model.train_on_batch(x, y)
+    bias = model.get_weights()[0]
+    assert_allclose(bias, [0.3], atol=1e-6)
+
+    # The averages of the weights after each step, 0.1, 0.2 and 0.3.
+    with model.swap_ema_weights():
+        ema_bias = model.get_weights()[0]
+        assert_allclose(ema_bias, [((0.1 * 0.5 + 0.2) * 0.5 + 0.3) * 0.5],
+                        atol=1e-6)
+        assert_allclose(model.predict(x), x + ema_bias, atol=1e-6)
+    assert_allclose(model.get_weights()[0], bias)
+
+    model.compile('sgd', 'mae')
+    with pytest.raises(RuntimeError):
+        with model.swap_ema_weights():
+            pass
+    with pytest.raises(ValueError):
+        model.compile('sgd', 'mae', ema_decay=1.)
+
+
+def test_streamed_logs():
+    model = Sequential([Dense(3, input_shape=(4,), activation='softmax')])
+    model.compile('sgd', 'categorical_crossentropy', metrics=['acc', 'mae'])
+    x = np.random.random((10, 4))
+    y = np.eye(3)[np.random.randint(0, 3, size=10)]
+
+    class BatchLogs(Callback):
+        needs_batch_logs = False
+
+        def on_train_begin(self, logs=None):
+            self.batches = []
+
+        def on_batch_end(self, batch, logs=None):
+            if 'loss' in logs:
+                self.batches.append(batch)
+
+        on_test_batch_end = on_batch_end
+
+    # The loss and the metrics are fetched every 2 batches and at the end.
+    batch_logs = BatchLogs()
+    batch_logs.on_train_begin()
+    y_pred = model.predict(x)
+    loss, acc, mae = model.evaluate(x, y, batch_size=2, log_freq=2,
+                                    callbacks=[batch_logs])
+    assert batch_logs.batches == [1, 3, 4]
+    assert_allclose(loss, np.mean(-np.sum(y * np.log(y_pred), axis=-1)),
+                    rtol=1e-5)
+    assert_allclose(acc, np.mean(y_pred.argmax(-1) == y.argmax(-1)))
+    assert_allclose(mae, np.mean(np.abs(y_pred - y)), rtol=1e-5)
+
+    history = model.fit(x, y, batch_size=2, epochs=2, log_freq=3,
+                        validation_data=(x, y), callbacks=[batch_logs])
+    # Training and validation batches.
+    assert batch_logs.batches == [2, 4, 2, 4] * 2
+    assert set(history.history) == {'loss', 'acc', 'mae',
+                                    'val_loss', 'val_acc', 'val_mae'}
+
+    # Callbacks which need the logs of every batch get them.
+    batches = []
+    model.fit(x, y, batch_size=2, epochs=1, log_freq=3,
+              callbacks=[keras.callbacks.LambdaCallback(
+                  on_batch_end=lambda batch, logs: batches.append(logs))])
+    assert all('loss' in logs for logs in batches)
+
+    with pytest.raises(ValueError):
+        model.evaluate(x, y, log_freq=0)
+
+
+def test_should_stream_logs():
+    callbacks = [keras.callbacks.TerminateOnNaN()]
+    assert training_utils.should_stream_logs(2, callbacks)
+    assert training_utils.should_stream_logs(np.int64(2), callbacks)
+    assert not training_utils.should_stream_logs(None, callbacks)
+    assert not training_utils.should_stream_logs(
+        2, callbacks + [keras.callbacks.Callback()])
+    for log_freq in (0, 1.5, True):
+        with pytest.raises(ValueError):
+            training_utils.should_stream_logs(log_freq, callbacks)
+
+
 def test_loss_correctness():
     class Bias(Layer):
 
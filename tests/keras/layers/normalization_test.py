@@ -44,6 +44,33 @@ def test_basic_batchnorm():
                    input_shape=(3, 4, 2, 4))
 
 
+def test_basic_layernorm():
+    layer_test(normalization.LayerNormalization,
+               kwargs={'epsilon': 0.1,
+                       'gamma_regularizer': regularizers.l2(0.01),
+                       'beta_regularizer': regularizers.l2(0.01)},
+               input_shape=(3, 4, 2))
+    layer_test(normalization.LayerNormalization,
+               kwargs={'axis': 1},
+               input_shape=(3, 4, 2))
+    layer_test(normalization.LayerNormalization,
+               kwargs={'axis': [1, 2],
+                       'scale': False,
+                       'center': False},
+               input_shape=(3, 4, 2, 4))
+
+
+def test_layernorm_correctness():
+    x = np.random.normal(loc=5.0, scale=10.0, size=(10, 3, 6))
+    model = Sequential()
+    norm = normalization.LayerNormalization(axis=[1, 2], input_shape=(3, 6))
+    model.add(norm)
+    model.set_weights([np.full((3, 6), 2.), np.ones((3, 6))])
+    out = (model.predict(x) - 1) / 2
+    assert_allclose(out.mean(axis=(1, 2)), 0.0, atol=1e-4)
+    assert_allclose(out.std(axis=(1, 2)), 1.0, atol=1e-3)
+
+
 def test_batchnorm_correctness_1d():
     np.random.seed(1337)
     model = Sequential()
@@ -302,6 +302,110 @@ def test_implementation_mode(layer_class):
                    input_shape=(num_samples, timesteps, embedding_dim))
 
 
+@pytest.mark.parametrize('layer_class', [recurrent.GRU, recurrent.LSTM])
+def test_layer_normalization(layer_class):
+    layer_test(layer_class,
+               kwargs={'units': units,
+                       'layer_normalization': True},
+               input_shape=(num_samples, timesteps, embedding_dim))
+    layer_test(layer_class,
+               kwargs={'units': units,
+                       'layer_normalization': True,
+                       'use_bias': False},
+               input_shape=(num_samples, timesteps, embedding_dim))
+    if layer_class is recurrent.GRU:
+        layer_test(layer_class,
+                   kwargs={'units': units,
+                           'layer_normalization': True,
+                           'reset_after': True},
+                   input_shape=(num_samples, timesteps, embedding_dim))
+
+
+def _np_layer_normalize(x, gamma, epsilon=1e-3):
+    mean = x.mean(axis=-1, keepdims=True)
+    var = x.var(axis=-1, keepdims=True)
+    return (x - mean) / np.sqrt(var + epsilon) * gamma
+
+
+def _np_layer_normalize_gates(x, gamma):
+    num_gates, units = gamma.shape
+    x = _np_layer_normalize(x.reshape((-1, num_gates, units)), gamma)
+    return x.reshape((-1, num_gates * units))
+
+
+def _np_sigmoid(x):
+    return 1. / (1. + np.exp(-x))
+
+
+def _np_lstm(x, kernel, recurrent_kernel, bias, input_gamma, recurrent_gamma,
+             cell_gamma, cell_beta):
+    h = np.zeros((x.shape[0], cell_gamma.shape[0]))
+    c = np.zeros_like(h)
+    for t in range(x.shape[1]):
+        z = (_np_layer_normalize_gates(x[:, t].dot(kernel), input_gamma) +
+             _np_layer_normalize_gates(h.dot(recurrent_kernel),
+                                       recurrent_gamma) + bias)
+        i, f, g, o = np.split(z, 4, axis=-1)
+        c = _np_sigmoid(f) * c + _np_sigmoid(i) * np.tanh(g)
+        h = _np_sigmoid(o) * np.tanh(_np_layer_normalize(c, cell_gamma) +
+                                     cell_beta)
+    return h
+
+
+def _np_gru(x, kernel, recurrent_kernel, bias, input_gamma, recurrent_gamma,
+            reset_after):
+    units = recurrent_kernel.shape[0]
+    if reset_after:
+        input_bias, recurrent_bias = bias
+    else:
+        input_bias = bias
+    h = np.zeros((x.shape[0], units))
+    for t in range(x.shape[1]):
+        x_z, x_r, x_h = np.split(
+            _np_layer_normalize_gates(x[:, t].dot(kernel), input_gamma) +
+            input_bias, 3, axis=-1)
+        if reset_after:
+            h_z, h_r, h_h = np.split(
+                _np_layer_normalize_gates(h.dot(recurrent_kernel),
+                                          recurrent_gamma) +
+                recurrent_bias, 3, axis=-1)
+        else:
+            h_z, h_r = np.split(
+                _np_layer_normalize_gates(
+                    h.dot(recurrent_kernel[:, :2 * units]),
+                    recurrent_gamma[:2]), 2, axis=-1)
+        z = _np_sigmoid(x_z + h_z)
+        r = _np_sigmoid(x_r + h_r)
+        if reset_after:
+            recurrent_h = r * h_h
+        else:
+            recurrent_h = _np_layer_normalize(
+                (r * h).dot(recurrent_kernel[:, 2 * units:]),
+                recurrent_gamma[2])
+        h = z * h + (1 - z) * np.tanh(x_h + recurrent_h)
+    return h
+
+
+@pytest.mark.parametrize('layer_class,kwargs', [
+    (recurrent.LSTM, {}),
+    (recurrent.GRU, {'reset_after': False}),
+    (recurrent.GRU, {'reset_after': True}),
+])
+def test_layer_normalization_correctness(layer_class, kwargs):
+    layer = layer_class(units, layer_normalization=True,
+                        input_shape=(timesteps, embedding_dim), **kwargs)
+    model = Sequential([layer])
+    weights = [np.random.uniform(-1, 1, w.shape) for w in model.get_weights()]
+    model.set_weights(weights)
+
+    x = np.random.uniform(-1, 1, (num_samples, timesteps, embedding_dim))
+    if layer_class is recurrent.LSTM:
+        expected = _np_lstm(x, *weights)
+    else:
+        expected = _np_gru(x, *weights, **kwargs)
+    assert_allclose(model.predict(x), expected, atol=1e-4)
+
+
 @rnn_test
 def test_regularizer(layer_class):
     layer = layer_class(units, return_sequences=False, weights=None,
@@ -125,6 +125,27 @@ def test_TimeDistributed():
     assert K.int_shape(td._input_map[uid]) == (None, 2)
 
 
+def test_TimeDistributed_fixed_batch_size():
+    x = np.random.random((2, 3, 4))
+    layer = wrappers.TimeDistributed(layers.Dense(5),
+                                     batch_input_shape=(2, 3, 4))
+    model = Sequential([layer])
+    # Stateless layers merge the timesteps into the batch dimension,
+    # even when the batch size is fixed.
+    assert object_list_uid(model.inputs) in layer._input_map
+    assert model.output_shape == (2, 3, 5)
+    kernel, bias = layer.get_weights()
+    assert_allclose(model.predict(x, batch_size=2),
+                    np.dot(x, kernel) + bias, atol=1e-5)
+
+    # Stateful layers are applied to one timestep at a time.
+    layer = wrappers.TimeDistributed(
+        layers.SimpleRNN(5, stateful=True), batch_input_shape=(2, 3, 4, 6))
+    model = Sequential([layer])
+    assert object_list_uid(model.inputs) not in layer._input_map
+    assert model.output_shape == (2, 3, 5)
+
+
 @pytest.mark.skipif((K.backend() == 'cntk'),
                     reason='Flaky with CNTK backend')
 def test_TimeDistributed_learning_phase():
@@ -358,6 +379,50 @@ def test_Bidirectional_merged_value(merge_mode):
         assert_allclose(state_birnn, state_inner, atol=1e-5)
 
 
+@pytest.mark.parametrize('rnn', [layers.SimpleRNN, layers.GRU, layers.LSTM])
+@pytest.mark.parametrize('return_sequences', [True, False])
+@pytest.mark.parametrize('merge_mode', ['concat', 'sum', None])
+@pytest.mark.parametrize('go_backwards', [False, True])
+def test_Bidirectional_fused(rnn, return_sequences, merge_mode, go_backwards):
+    samples = 3
+    dim = 4
+    timesteps = 6
+    units = 3
+    x = np.random.rand(samples, timesteps, dim)
+    # Padded sequences of different lengths.
+    x[0, 4:] = 0
+    x[1, 2:] = 0
+
+    outputs = []
+    for fused in [False, True]:
+        inputs = Input((timesteps, dim))
+        masked = layers.Masking()(inputs)
+        layer = wrappers.Bidirectional(
+            rnn(units, return_sequences=return_sequences, return_state=True),
+            merge_mode=merge_mode, fused=fused)
+        states = layer(inputs)[-len(layer.layer.states) * 2:]
+        output = wrappers.Bidirectional(
+            rnn(units, return_sequences=return_sequences,
+                go_backwards=go_backwards),
+            merge_mode=merge_mode, fused=fused)(masked, initial_state=states)
+        model = Model(inputs, output)
+        if fused:
+            # The fused layers use the same weights.
+            model.set_weights(weights)
+            config = model.layers[-1].get_config()
+            assert config['fused']
+            assert wrappers.Bidirectional.from_config(config).fused
+        else:
+            weights = model.get_weights()
+        outputs.append(to_list(model.predict(x)))
+
+    for y, y_fused in zip(*outputs):
+        assert_allclose(y, y_fused, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        wrappers.Bidirectional(rnn(units, stateful=True), fused=True)
+
+
 @pytest.mark.skipif(K.backend() == 'theano', reason='Not supported.')
 @pytest.mark.parametrize('merge_mode', ['sum', 'concat', None])
 def test_Bidirectional_dropout(merge_mode):
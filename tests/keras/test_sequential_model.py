@@ -401,6 +401,70 @@ def test_clone_sequential_model():
     new_model.train_on_batch(None, val_out)
 
 
+def _randomize_affine_layers(model):
+    for layer in model.layers:
+        if isinstance(layer, (keras.layers.BatchNormalization,
+                              keras.layers.Scale)):
+            layer.set_weights([np.random.uniform(0.5, 2., w.shape)
+                               for w in layer.get_weights()])
+
+
+@pytest.mark.parametrize('data_format', ['channels_last', 'channels_first'])
+def test_optimize_for_inference_conv(data_format):
+    channel_axis = -1 if data_format == 'channels_last' else 1
+    inputs = keras.Input((3, 8, 8) if channel_axis == 1 else (8, 8, 3))
+    x = keras.layers.Conv2D(4, 3, use_bias=False,
+                            data_format=data_format)(inputs)
+    x = keras.layers.BatchNormalization(axis=channel_axis)(x)
+    x = keras.layers.Scale(axis=channel_axis)(x)
+    x = keras.layers.Activation('relu')(x)
+    x = keras.layers.DepthwiseConv2D(3, depth_multiplier=2,
+                                     data_format=data_format)(x)
+    x = keras.layers.Dropout(0.5)(x)
+    x = keras.layers.BatchNormalization(axis=channel_axis, scale=False)(x)
+    x = keras.layers.SeparableConv2D(5, 1, data_format=data_format)(x)
+    x = keras.layers.BatchNormalization(axis=channel_axis, center=False)(x)
+    # Not folded: the axis is not the channel axis.
+    x = keras.layers.BatchNormalization(axis=2)(x)
+    x = keras.layers.GaussianNoise(0.1)(x)
+    outputs = keras.layers.GlobalAveragePooling2D(data_format=data_format)(x)
+    model = keras.models.Model(inputs, outputs)
+    _randomize_affine_layers(model)
+
+    new_model = keras.models.optimize_for_inference(model)
+    assert ([layer.__class__.__name__ for layer in new_model.layers] ==
+            ['InputLayer', 'Conv2D', 'Activation', 'DepthwiseConv2D',
+             'SeparableConv2D', 'BatchNormalization',
+             'GlobalAveragePooling2D'])
+    x = np.random.random((2,) + model.input_shape[1:])
+    assert_allclose(new_model.predict(x), model.predict(x),
+                    rtol=1e-4, atol=1e-5)
+
+
+def test_optimize_for_inference_dense():
+    inputs = keras.Input((5,))
+    x = keras.layers.Dense(8, use_bias=False)(inputs)
+    x = keras.layers.BatchNormalization()(x)
+    x = keras.layers.Dense(3)(x)
+    x = keras.layers.Dense(2)(x)
+    # Not folded: the output of the `Dense` layer is used twice.
+    y = keras.layers.BatchNormalization()(x)
+    outputs = keras.layers.concatenate([x, y])
+    model = keras.models.Model(inputs, outputs)
+    _randomize_affine_layers(model)
+
+    new_model = keras.models.optimize_for_inference(model)
+    assert ([layer.__class__.__name__ for layer in new_model.layers] ==
+            ['InputLayer', 'Dense', 'Dense', 'BatchNormalization',
+             'Concatenate'])
+    x = np.random.random((3, 5))
+    assert_allclose(new_model.predict(x), model.predict(x),
+                    rtol=1e-4, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        keras.models.optimize_for_inference(model.layers[1])
+
+
 def test_sequential_update_disabling():
     val_a = np.random.random((10, 4))
     val_out = np.random.random((10, 4))
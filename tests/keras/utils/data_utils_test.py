@@ -24,6 +24,8 @@ from keras.utils import OrderedEnqueuer
 from keras.utils import Sequence
 from keras.utils.data_utils import _hash_file
 from keras.utils.data_utils import get_file
+from keras.utils.data_utils import load_cached_arrays
+from keras.utils.data_utils import prefetch
 from keras.utils.data_utils import validate_file
 from keras import backend as K
 from keras.backend import load_backend
@@ -134,6 +136,110 @@ def test_data_utils(in_tmpdir):
     os.remove('test.zip')
 
 
+def test_validate_file_caches_hashes(tmpdir, monkeypatch):
+    monkeypatch.setenv('KERAS_HOME', str(tmpdir.join('keras_home')))
+    fpath = str(tmpdir.join('test.txt'))
+    with open(fpath, 'w') as f:
+        f.write('Float like a butterfly, sting like a bee.')
+    hashval_sha256 = _hash_file(fpath)
+    hashval_md5 = _hash_file(fpath, algorithm='md5')
+
+    calls = []
+
+    def hash_file(*args):
+        calls.append(args)
+        return _hash_file(*args)
+
+    from keras.utils import data_utils
+    monkeypatch.setattr(data_utils, '_hash_file', hash_file)
+    assert validate_file(fpath, hashval_sha256)
+    assert validate_file(fpath, hashval_sha256)
+    assert validate_file(fpath, hashval_md5)
+    assert not validate_file(fpath, hashval_md5[::-1])
+    assert len(calls) == 2
+
+    # The file is hashed again when it changes.
+    with open(fpath, 'a') as f:
+        f.write(' Rumble, young man, rumble.')
+    assert not validate_file(fpath, hashval_sha256)
+    assert len(calls) == 3
+
+
+def test_load_cached_arrays(tmpdir):
+    source = str(tmpdir.join('data.npz'))
+    cache_path = str(tmpdir.join('data.npz.cache'))
+    x = np.random.random((5, 3))
+    sequences = np.empty(3, dtype=object)
+    sequences[:] = [[1, 2, 3], [], [4, 5]]
+    np.savez(source, x=x, sequences=sequences)
+
+    calls = []
+
+    def load():
+        calls.append(source)
+        with np.load(source, allow_pickle=True) as f:
+            return {'x': f['x'], 'sequences': f['sequences']}
+
+    for _ in range(2):
+        arrays = load_cached_arrays(cache_path, [source], load)
+        np.testing.assert_allclose(arrays['x'], x)
+        assert arrays['sequences'].dtype == object
+        assert arrays['sequences'].tolist() == sequences.tolist()
+    assert len(calls) == 1
+    assert isinstance(arrays['x'], np.memmap)
+    # The arrays are copied on write.
+    arrays['x'][0] = 0
+    arrays = load_cached_arrays(cache_path, [source], load)
+    np.testing.assert_allclose(arrays['x'], x)
+
+    # The cache is rebuilt when the source changes.
+    np.savez(source, x=x[:2], sequences=sequences)
+    arrays = load_cached_arrays(cache_path, [source], load)
+    assert len(calls) == 2
+    np.testing.assert_allclose(arrays['x'], x[:2])
+
+
+def test_prefetch():
+    produced = []
+    reached = threading.Event()
+    closed = threading.Event()
+
+    def items(n):
+        try:
+            for i in range(n):
+                produced.append(i)
+                if i == 2:
+                    reached.set()
+                yield i
+        finally:
+            closed.set()
+
+    assert list(prefetch(items(10))) == list(range(10))
+    assert closed.is_set()
+
+    # The next item is produced while the current one is used.
+    produced[:] = []
+    reached.clear()
+    closed.clear()
+    batches = prefetch(items(10), buffer_size=1)
+    assert next(batches) == 0
+    assert reached.wait(timeout=10)
+    assert produced == [0, 1, 2]
+    # Closing the generator stops the thread and closes the iterator.
+    batches.close()
+    assert closed.wait(timeout=10)
+    assert produced == [0, 1, 2]
+
+    def failing():
+        yield 0
+        raise ValueError('failed')
+
+    batches = prefetch(failing())
+    assert next(batches) == 0
+    with pytest.raises(ValueError, match='failed'):
+        next(batches)
+
+
 """Enqueuers Tests"""
 
 
@@ -81,6 +81,21 @@ def test_has_arg_positional_only():
     assert has_arg(pow, 'x') is False
 
 
+def test_has_arg_methods():
+    class Layer(object):
+        def call(self, inputs, training=None):
+            return inputs
+
+    layer = Layer()
+    for _ in range(2):
+        assert has_arg(layer.call, 'training') is True
+        assert has_arg(Layer().call, 'training') is True
+        assert has_arg(layer.call, 'mask') is False
+        # Bound and unbound methods do not share results.
+        assert has_arg(layer.call, 'self') is (sys.version_info < (3,))
+        assert has_arg(Layer.call, 'self') is True
+
+
 @pytest.mark.parametrize(
     'test_function_type',
     ('simple function', 'closured function'))
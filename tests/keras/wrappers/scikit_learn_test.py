@@ -181,6 +181,60 @@ def assert_regression_predict_shape_correct(num_test):
     assert preds.shape == (num_test, )
 
 
+def test_search():
+    reg = KerasRegressor(
+        build_fn=build_fn_reg, hidden_dims=hidden_dims,
+        batch_size=batch_size, epochs=epochs)
+    param_grid = {'hidden_dims': [3, 5], 'epochs': [1, 2]}
+    reg.search(X_train, y_train, param_grid, cv=2, seed=1)
+
+    assert len(reg.search_results_) == 4
+    for result in reg.search_results_:
+        assert len(result['scores']) == 2
+        assert np.isfinite(result['mean_score'])
+    assert reg.best_params_ in [r['params'] for r in reg.search_results_]
+    assert reg.best_score_ == max(r['mean_score'] for r in reg.search_results_)
+    assert reg.predict(X_test).shape == (num_test,)
+
+
+def test_search_workers():
+    reg = KerasRegressor(
+        build_fn=build_fn_reg, hidden_dims=hidden_dims,
+        batch_size=batch_size, epochs=epochs)
+    param_grid = {'hidden_dims': [3, 5], 'epochs': [1, 2]}
+    results = list(reg.iter_search(X_train, y_train, param_grid, cv=2,
+                                   workers=2, seed=1))
+    assert sorted((r['index'], r['fold']) for r in results) == [
+        (i, fold) for i in range(4) for fold in range(2)]
+    for result in results:
+        assert np.isfinite(result['score'])
+
+
+def test_search_reuses_models():
+    clf = KerasClassifier(
+        build_fn=build_fn_clf, hidden_dims=hidden_dims,
+        batch_size=batch_size, epochs=epochs)
+    cv = [(np.arange(0, 50), np.arange(50, 100)),
+          (np.arange(50, 100), np.arange(0, 50))]
+    results = list(clf.iter_search(X_train, y_train,
+                                   {'epochs': [1, 2]}, cv=cv))
+    assert sorted((r['index'], r['fold']) for r in results) == [
+        (0, 0), (0, 1), (1, 0), (1, 1)]
+
+    # The model is reset to its initial weights for every fold.
+    model_cache = {}
+    clf._model_cache = model_cache
+    clf.fit(X_train, y_train)
+    model = clf.model
+    _, initial_weights, _ = list(model_cache.values())[0]
+    clf.set_params(epochs=2)
+    clf.fit(X_train, y_train)
+    assert clf.model is model
+    clf.fit(X_train, y_train, epochs=0)
+    for weights, initial in zip(model.get_weights(), initial_weights):
+        assert np.allclose(weights, initial)
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
 
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+
+import pytest
+
+
+LAZY_MODULES = ['tensorflow', 'theano', 'cntk',
+                'keras.backend.tensorflow_backend',
+                'keras.backend.theano_backend',
+                'keras.backend.cntk_backend',
+                'keras.backend.numpy_backend',
+                'keras.applications', 'keras.caffe', 'keras.datasets',
+                'keras.wrappers', 'keras.callbacks.tensorboard_v1',
+                'keras.callbacks.tensorboard_v2']
+
+
+def _run(code):
+    return subprocess.check_output([sys.executable, '-c', code])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='Lazy imports require module `__getattr__`.')
+def test_import_is_lazy():
+    code = ('import sys\n'
+            'import keras\n'
+            'print(\' \'.join(m for m in %r if m in sys.modules))\n'
+            % LAZY_MODULES)
+    assert _run(code).decode('utf-8').strip() == ''
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='Lazy imports require module `__getattr__`.')
+def test_lazy_attributes():
+    code = ('import keras\n'
+            'from keras import backend as K\n'
+            'assert callable(K.placeholder)\n'
+            'assert keras.datasets.mnist.load_data\n'
+            'assert keras.wrappers.scikit_learn.KerasClassifier\n'
+            'assert keras.callbacks.TensorBoard\n'
+            'assert keras.metrics.deserialize(\'mse\')\n')
+    _run(code)
+
+
+def test_backend_decorators():
+    # `K.symbolic` and `K.eager` are the decorators of the active backend,
+    # also for the functions decorated before it was loaded.
+    code = ('from keras import backend as K\n'
+            'from keras.backend import common, load_backend\n'
+            '@K.symbolic\n'
+            'def f(x):\n'
+            '    return x + 1\n'
+            'assert f(1) == 2\n'
+            'module = load_backend._BACKEND_MODULE\n'
+            'assert K.symbolic is getattr(module, \'symbolic\', '
+            'common.symbolic)\n'
+            'assert K.eager is getattr(module, \'eager\', common.eager)\n')
+    _run(code)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='Lazy imports require module `__getattr__`.')
+def test_import_time():
+    # Importing Keras should not pay for the import of its backend,
+    # so that e.g. command line tools start quickly. Importing
+    # TensorFlow alone takes several seconds.
+    code = ('import time\n'
+            'start = time.time()\n'
+            'import keras\n'
+            'print(time.time() - start)\n'
+            'from keras.backend import load_backend\n'
+            'assert load_backend._BACKEND_MODULE is None\n')
+    import_time = float(_run(code).decode('utf-8').split()[-1])
+    assert import_time < 5.
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
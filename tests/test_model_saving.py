@@ -15,12 +15,12 @@ from keras.models import Model, Sequential
 from keras.layers import Dense, Lambda, RepeatVector, TimeDistributed
 from keras.layers import Bidirectional, GRU, LSTM, CuDNNGRU, CuDNNLSTM
 from keras.layers import Conv2D, Flatten, Activation
-from keras.layers import Input, InputLayer
+from keras.layers import Input, InputLayer, Embedding, Layer
 from keras.initializers import Constant
 from keras import optimizers
 from keras import losses
 from keras import metrics
-from keras.models import save_model, load_model
+from keras.models import save_model, load_model, quantize_model
 from keras.utils.test_utils import tf_file_io_proxy
 try:
     from unittest.mock import patch
@@ -1003,5 +1003,97 @@ def test_model_saving_with_rnn_initial_state_and_args():
     os.remove(fname)
 
 
+def _get_quantizable_model():
+    inputs = Input((6,), dtype='int32')
+    x = Embedding(50, 16)(inputs)
+    x = LSTM(12, return_sequences=True)(x)
+    x = Bidirectional(GRU(8))(x)
+    outputs = Dense(5, activation='softmax')(x)
+    return Model(inputs, outputs)
+
+
+def test_quantize_model():
+    model = _get_quantizable_model()
+    x = np.random.randint(0, 50, (4, 6))
+    quantized_model = quantize_model(model)
+    assert_allclose(quantized_model.predict(x), model.predict(x), atol=1e-3)
+
+    embedding, lstm, bidirectional, dense = quantized_model.layers[1:]
+    assert [K.dtype(w) for w in embedding.weights] == ['int8', K.floatx()]
+    assert K.int_shape(embedding.weights[1]) == (50, 1)
+    # kernel, recurrent_kernel and bias.
+    assert len(lstm.weights) == 5
+    assert len(bidirectional.weights) == 10
+    assert K.int_shape(dense.weights[1]) == (1, 5)
+    assert not dense.trainable_weights
+    assert dense.get_config()['weight_quantization'] == 'int8'
+
+    # Quantized weights can be loaded in the float model.
+    weights = preprocess_weights_for_loading(model.layers[1],
+                                             embedding.get_weights())
+    assert_allclose(weights[0], model.layers[1].get_weights()[0],
+                    atol=np.abs(weights[0]).max() / 127)
+
+    quantized_model = quantize_model(model, layers=[dense.name])
+    assert quantized_model.layers[1].get_config().get(
+        'weight_quantization') is None
+    assert len(quantized_model.layers[-1].weights) == 3
+    with pytest.raises(ValueError):
+        quantize_model(model, layers=['unknown'])
+
+
+def test_quantize_model_selects_2d_weights():
+    class Projection(Layer):
+        def build(self, input_shape):
+            self.projection = self.add_weight(name='projection',
+                                              shape=(input_shape[-1], 3),
+                                              initializer='uniform')
+            self.scale = self.add_weight(name='scale', shape=(3,),
+                                         initializer='ones')
+            super(Projection, self).build(input_shape)
+
+        def call(self, inputs):
+            return K.dot(inputs, self.projection) * self.scale
+
+        def compute_output_shape(self, input_shape):
+            return input_shape[:-1] + (3,)
+
+    inputs = Input((4,))
+    model = Model(inputs, Projection()(inputs))
+    x = np.random.random((2, 4))
+    quantized_model = quantize_model(
+        model, custom_objects={'Projection': Projection})
+    assert_allclose(quantized_model.predict(x), model.predict(x), atol=1e-3)
+    # The matrix is quantized whatever its name, the vector stays in float.
+    assert ([K.dtype(w) for w in quantized_model.layers[1].weights] ==
+            ['int8', K.floatx(), K.floatx()])
+
+
+def test_saving_quantized_model():
+    model = _get_quantizable_model()
+    quantized_model = quantize_model(model)
+    x = np.random.randint(0, 50, (4, 6))
+    y = quantized_model.predict(x)
+
+    _, fname = tempfile.mkstemp('.h5')
+    save_model(quantized_model, fname)
+    with h5py.File(fname, 'r') as f:
+        group = f['model_weights'][model.layers[1].name]
+        assert any(group[name].dtype == np.int8
+                   for name in group.attrs['weight_names'])
+    new_model = load_model(fname)
+    assert_allclose(new_model.predict(x), y, atol=1e-6)
+
+    # Float weights are quantized when loaded in a quantized model,
+    # and conversely.
+    model.save_weights(fname)
+    new_model.load_weights(fname)
+    assert_allclose(new_model.predict(x), y, atol=1e-6)
+    quantized_model.save_weights(fname)
+    model.load_weights(fname)
+    assert_allclose(model.predict(x), y, atol=1e-6)
+    os.remove(fname)
+
+
 if __name__ == '__main__':
     pytest.main([__file__])